@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Keyword cue matching benchmark
+
+Times the forward/backward temporal classification and the
+contextualization cue scoring on the sentences of a synthetic transcript,
+comparing KeywordMatcher with the per-sentence scans it replaced
+(``any(k in sentence.lower() for k in keywords)`` for every list), and
+checks that both give the same result.
+
+Usage:
+    python benchmarks/keyword_cues.py [--sentences 4000] [--repeat 5] [--json out.json]
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_transcript import generate_transcript
+from config.settings import settings
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.text_utils import BACKWARD_KEYWORDS, FORWARD_KEYWORDS, tokenize_sentence_spans
+
+
+def sample_sentences(count: int, seed: int = 0) -> List[str]:
+    """At least count sentences of synthetic transcript text (exactly count)"""
+    sentences: List[str] = []
+    words = count * 25
+    while len(sentences) < count:
+        text = generate_transcript(words=words, seed=seed)
+        sentences = [text[start:end] for start, end in tokenize_sentence_spans(text)]
+        words *= 2
+    return sentences[:count]
+
+
+def naive_masks(sentences: Sequence[str], cue_lists: Sequence[Sequence[str]]) -> List[int]:
+    """Bitmask per sentence from one any(cue in sentence.lower()) scan per list"""
+    return [
+        sum(1 << bit for bit, cues in enumerate(cue_lists) if any(cue in sentence.lower() for cue in cues))
+        for sentence in sentences
+    ]
+
+
+def best_time(func: Callable[[], List[int]], repeat: int) -> Tuple[float, List[int]]:
+    """Best-of-N wall time (seconds) and the result of the last run"""
+    best = float('inf')
+    result: List[int] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sentence_count: int, repeat: int) -> List[Dict]:
+    """Benchmark both cue sets"""
+    sentences = sample_sentences(sentence_count)
+    cue_sets = {
+        'temporal': {'forward': FORWARD_KEYWORDS, 'backward': BACKWARD_KEYWORDS},
+        'contextualization': {
+            'comparison': settings.CONTEXT_COMPARISON_CUES,
+            'explanation': settings.CONTEXT_EXPLANATION_CUES,
+            'implication': settings.CONTEXT_IMPLICATION_CUES,
+        },
+    }
+
+    results = []
+    for name, categories in cue_sets.items():
+        matcher = KeywordMatcher(categories)
+        cue_lists = list(categories.values())
+
+        naive_seconds, expected = best_time(lambda: naive_masks(sentences, cue_lists), repeat)
+        per_text_seconds, per_text = best_time(
+            lambda: [matcher.mask(sentence.lower()) for sentence in sentences], repeat
+        )
+        batch_seconds, batch = best_time(lambda: matcher.masks(sentences).tolist(), repeat)
+
+        results.append({
+            'cues': name,
+            'sentences': len(sentences),
+            'naive_seconds': round(naive_seconds, 6),
+            'mask_seconds': round(per_text_seconds, 6),
+            'masks_seconds': round(batch_seconds, 6),
+            'mask_speedup': round(naive_seconds / per_text_seconds, 2) if per_text_seconds else None,
+            'masks_speedup': round(naive_seconds / batch_seconds, 2) if batch_seconds else None,
+            'identical': per_text == expected and batch == expected,
+        })
+
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print results as a table"""
+    header = f"{'Cues':<18} {'Sents':>6} {'naive ms':>9} {'mask ms':>9} {'masks ms':>9} {'Speedup':>8} {'Same':>5}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f"{r['cues']:<18} {r['sentences']:>6} {r['naive_seconds'] * 1000:>9.2f} "
+            f"{r['mask_seconds'] * 1000:>9.2f} {r['masks_seconds'] * 1000:>9.2f} "
+            f"{r['masks_speedup']:>7.2f}x {'yes' if r['identical'] else 'NO':>5}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark keyword cue matching')
+    parser.add_argument('--sentences', type=int, default=4000, help='Number of sentences to classify')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per method (best is kept)')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+
+    args = parser.parse_args()
+
+    results = run(args.sentences, args.repeat)
+    print_report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark
+
+Runs EarningsCallAnalyzer.analyze_transcript on synthetic transcripts
+(benchmarks/synthetic_transcript.py) of several sizes, in two modes:
+
+    no_llm    use_llm_features=False
+    fake_llm  use_llm_features=True against a local fake Ollama client that
+              answers instantly (or after --llm-latency seconds)
+
+For every run it records the duration of each pipeline stage, total wall
+time, throughput (words/second) and the peak traced Python memory of a
+separate tracemalloc pass. Results are written as JSON so runs from
+different commits can be compared with --compare.
+
+Usage:
+    python benchmarks/pipeline.py [--sizes 1000 10000 50000] [--modes no_llm fake_llm]
+        [--repeat 1] [--no-memory] [--json out.json] [--compare baseline.json]
+"""
+import re
+import sys
+import json
+import time
+import logging
+import hashlib
+import platform
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_transcript import SentencePool, generate_transcript
+from src.analysis.aggregator import EarningsCallAnalyzer
+from src.core.resources import registry
+from src.models.ollama_client import OllamaClient
+
+SIZES = [1000, 10000, 50000]
+MODES = ['no_llm', 'fake_llm']
+
+
+class FakeOllamaClient(OllamaClient):
+    """
+    Local stand-in for the Ollama server
+
+    Answers every prompt with well-formed JSON of the shape the real prompts
+    ask for, derived deterministically from the prompt text, so the full LLM
+    code path (prompt building, parsing, validation) is exercised.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.host = 'fake'
+        self.timeout = 0
+        self.max_retries = 0
+        self.latency = latency
+        self.calls = 0
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = None,
+        max_tokens: int = None,
+        json_mode: bool = False
+    ) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        score = int(hashlib.md5(prompt.encode('utf-8')).hexdigest()[:4], 16) / 0xFFFF
+
+        if '"assessments"' in prompt:
+            numbers = json.loads(re.search(r'^Numbers: (.*)$', prompt, re.MULTILINE).group(1))
+            return json.dumps({'assessments': [
+                {
+                    'number': number,
+                    'has_comparison': round(score, 2),
+                    'has_explanation': round(1 - score, 2),
+                    'has_implication': 0.5,
+                    'overall_score': round(3 * score, 2),
+                    'category': 'Moderately Contextualized'
+                }
+                for number in numbers
+            ]})
+        if 'relevance_score' in prompt:
+            return json.dumps({
+                'relevance_score': round(score, 2),
+                'addresses_question': score > 0.5,
+                'reasoning': 'fake'
+            })
+        if 'has_comparison' in prompt:
+            return json.dumps({
+                'has_comparison': round(score, 2),
+                'has_explanation': round(1 - score, 2),
+                'has_implication': 0.5,
+                'overall_score': 1.5,
+                'category': 'Moderately Contextualized'
+            })
+        return json.dumps({
+            'sentiment': ('Negative', 'Neutral', 'Positive')[int(score * 2.999)],
+            'confidence': round(0.5 + score / 2, 2),
+            'reasoning': 'fake'
+        })
+
+
+def build_analyzer(mode: str, llm_latency: float) -> EarningsCallAnalyzer:
+    """Analyzer for a benchmark mode, with the on-disk LLM result cache off"""
+    if mode == 'fake_llm':
+        registry.set('ollama_client', FakeOllamaClient(llm_latency))
+        analyzer = EarningsCallAnalyzer(use_llm_features=True)
+    else:
+        analyzer = EarningsCallAnalyzer(use_llm_features=False)
+
+    # Every run should do the full amount of LLM work
+    analyzer.sentiment_analyzer.llm_analyzer.cache = None
+    analyzer.numerical_analyzer.cache = None
+    return analyzer
+
+
+def run_case(path: Path, words: int, mode: str, repeat: int, memory: bool, llm_latency: float) -> Dict:
+    """Benchmark one transcript in one mode"""
+    best_total = float('inf')
+    best_stages: Dict[str, float] = {}
+
+    for _ in range(repeat):
+        analyzer = build_analyzer(mode, llm_latency)
+        start = time.perf_counter()
+        result = analyzer.analyze_transcript(str(path))
+        total = time.perf_counter() - start
+        if total < best_total:
+            best_total = total
+            best_stages = dict(analyzer.stage_timings)
+
+    peak_mb = None
+    if memory:
+        analyzer = build_analyzer(mode, llm_latency)
+        tracemalloc.start()
+        analyzer.analyze_transcript(str(path))
+        peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    client = registry.get('ollama_client') if mode == 'fake_llm' else None
+    registry.reset('ollama_client')
+
+    return {
+        'mode': mode,
+        'target_words': words,
+        'words': result.word_count,
+        'sentences': result.sentence_count,
+        'seconds': round(best_total, 4),
+        'words_per_second': round(result.word_count / best_total) if best_total else None,
+        'peak_memory_mb': round(peak_mb, 2) if peak_mb is not None else None,
+        'llm_calls': client.calls // (repeat + int(memory)) if client else 0,
+        'stages': {name: round(seconds, 4) for name, seconds in best_stages.items()},
+    }
+
+
+def git_revision() -> Optional[str]:
+    """Current commit hash, if run inside a git checkout"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    sizes: List[int],
+    modes: List[str],
+    repeat: int = 1,
+    memory: bool = True,
+    llm_latency: float = 0.0,
+    seed: int = 0
+) -> Dict:
+    """Benchmark every size in every mode"""
+    pool = SentencePool()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for words in sizes:
+            path = Path(tmp) / f'synthetic_{words}.txt'
+            path.write_text(
+                generate_transcript(words, qa_pairs=max(2, words // 1000), seed=seed, pool=pool),
+                encoding='utf-8'
+            )
+            if not results:
+                # Warm-up: load lazily initialized resources outside the timings
+                build_analyzer('no_llm', 0.0).analyze_transcript(str(path))
+            for mode in modes:
+                results.append(run_case(path, words, mode, repeat, memory, llm_latency))
+
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'llm_latency': llm_latency,
+        'results': results,
+    }
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None):
+    """Print results as a table, with speedups against a baseline report"""
+    previous = {
+        (r['mode'], r['target_words']): r for r in (baseline or {}).get('results', [])
+    }
+
+    header = f"{'Mode':<9} {'Words':>7} {'Seconds':>9} {'Words/s':>9} {'Peak MB':>8} {'LLM':>6}   Slowest stages"
+    if previous:
+        header += f"   vs {baseline.get('revision')}"
+    print(f"Revision: {report['revision']}")
+    print(header)
+    print('-' * len(header))
+
+    for r in report['results']:
+        slowest = sorted(r['stages'].items(), key=lambda item: item[1], reverse=True)[:3]
+        stages = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in slowest)
+        peak = f"{r['peak_memory_mb']:.1f}" if r['peak_memory_mb'] is not None else '-'
+        line = (
+            f"{r['mode']:<9} {r['words']:>7} {r['seconds']:>9.3f} {r['words_per_second']:>9} "
+            f"{peak:>8} {r['llm_calls']:>6}   {stages}"
+        )
+        old = previous.get((r['mode'], r['target_words']))
+        if old:
+            line += f"   {old['seconds'] / r['seconds']:.2f}x"
+        print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the full analysis pipeline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='Transcript sizes in words')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES, help='Benchmark modes')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per case (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak memory pass')
+    parser.add_argument('--llm-latency', type=float, default=0.0,
+                       help='Seconds the fake LLM sleeps per call')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic transcript seed')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+    parser.add_argument('--compare', type=Path, help='Baseline JSON from an earlier run')
+
+    args = parser.parse_args()
+
+    # Stage progress is logged at INFO; keep the report readable
+    logging.disable(logging.WARNING)
+
+    report = run(args.sizes, args.modes, args.repeat, not args.no_memory, args.llm_latency, args.seed)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(report, baseline)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.json}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Sentence segmenter benchmark and agreement report
+
+Times every registered segmentation backend on the transcripts in
+data/transcripts and reports how closely each agrees with the punkt
+reference (boundary precision/recall/F1 and exact sentence matches).
+
+Usage:
+    python benchmarks/sentence_segmenters.py [--repeat 5] [--json out.json]
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from src.utils.text_utils import clean_text
+from src.utils.sentence_segmenter import available_segmenters, get_segmenter
+
+REFERENCE = 'nltk'
+
+
+def time_segmenter(name: str, text: str, repeat: int) -> Tuple[float, List[Tuple[int, int]]]:
+    """Best-of-N wall time (seconds) and the spans produced"""
+    segmenter = get_segmenter(name)
+    spans = segmenter.spans(text)  # warm-up (loads punkt once)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        spans = segmenter.spans(text)
+        best = min(best, time.perf_counter() - start)
+
+    return best, spans
+
+
+def agreement(reference: List[Tuple[int, int]], candidate: List[Tuple[int, int]]) -> Dict[str, float]:
+    """Boundary-level agreement of candidate spans with the reference spans"""
+    ref_ends = {end for _, end in reference[:-1]}
+    cand_ends = {end for _, end in candidate[:-1]}
+    matched = len(ref_ends & cand_ends)
+
+    precision = matched / len(cand_ends) if cand_ends else 1.0
+    recall = matched / len(ref_ends) if ref_ends else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    return {
+        'precision': round(precision, 4),
+        'recall': round(recall, 4),
+        'f1': round(f1, 4),
+        'exact_sentences': round(len(set(reference) & set(candidate)) / max(len(reference), 1), 4),
+    }
+
+
+def run(transcripts_dir: Path, repeat: int) -> List[Dict]:
+    """Benchmark every backend on every transcript"""
+    results = []
+
+    for path in sorted(transcripts_dir.glob('*.txt')):
+        text = clean_text(path.read_text(encoding='utf-8'))
+        timings = {name: time_segmenter(name, text, repeat) for name in available_segmenters()}
+        reference_spans = timings[REFERENCE][1]
+
+        for name, (seconds, spans) in timings.items():
+            results.append({
+                'transcript': path.name,
+                'backend': name,
+                'characters': len(text),
+                'sentences': len(spans),
+                'seconds': round(seconds, 6),
+                'chars_per_second': round(len(text) / seconds) if seconds else None,
+                'speedup_vs_reference': round(timings[REFERENCE][0] / seconds, 2) if seconds else None,
+                **agreement(reference_spans, spans),
+            })
+
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print results as a table"""
+    header = f"{'Transcript':<32} {'Backend':<8} {'Sents':>6} {'ms':>9} {'Speedup':>8} {'P':>7} {'R':>7} {'F1':>7} {'Exact':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f"{r['transcript'][:32]:<32} {r['backend']:<8} {r['sentences']:>6} "
+            f"{r['seconds'] * 1000:>9.2f} {r['speedup_vs_reference']:>7.2f}x "
+            f"{r['precision']:>7.3f} {r['recall']:>7.3f} {r['f1']:>7.3f} {r['exact_sentences']:>7.3f}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark sentence segmenters against punkt')
+    parser.add_argument('--transcripts', type=Path, default=settings.DATA_DIR / 'transcripts',
+                       help='Directory of .txt transcripts')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per backend (best is kept)')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+
+    args = parser.parse_args()
+
+    results = run(args.transcripts, args.repeat)
+    print_report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Speaker turn parser benchmark on pathological inputs
+
+Builds ~10 MB inputs designed to make a backtracking speaker regex blow up
+(header-like fragments without a colon, one giant line, very long lines)
+plus a realistic transcript repeated to the same size, and times
+TranscriptProcessor.identify_speaker_turns on each. The legacy regex is
+timed on growing prefixes until it exceeds its time budget, for contrast.
+
+Usage:
+    python benchmarks/speaker_parser.py [--size-mb 10] [--legacy-budget 2.0] [--json out.json]
+"""
+import sys
+import json
+import re
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from src.core.transcript_processor import TranscriptProcessor
+
+# Pattern identify_speakers used before the line-oriented parser
+LEGACY_SPEAKER_PATTERN = re.compile(
+    r'([A-Z][a-zA-Z\s\.]+?)(?:\s*[-–]\s*|\s*\()(.*?)(?:\)|:)\s*([^\n]+(?:\n(?![A-Z][a-zA-Z\s\.]+?(?:\s*[-–]\s*|\s*\()[^\n]*).)*)',
+    re.MULTILINE
+)
+
+
+def _repeat_to_size(unit: str, size: int) -> str:
+    """Repeat unit until the result is about size characters"""
+    return unit * max(1, size // len(unit))
+
+
+def build_inputs(size: int) -> Dict[str, str]:
+    """Pathological and realistic inputs of roughly size characters"""
+    sample = (settings.DATA_DIR / 'transcripts' / 'sample_earnings_call.txt').read_text(encoding='utf-8')
+
+    return {
+        # One line of capitalized name fragments and separators, no colon
+        'single_line_no_colon': _repeat_to_size("John Smith - Chief (Executive ", size),
+        # Many short lines that look like headers but never close one
+        'header_like_lines': _repeat_to_size("Jane Doe - Chief Financial Officer (CFO\n", size),
+        # Capitalized words only: the name group can match almost anywhere
+        'capitalized_words': _repeat_to_size("Revenue Growth Margin Outlook ", size),
+        # Very long lines each with a real header
+        'long_turns': _repeat_to_size("Jane Doe - CFO: " + "Revenue grew strongly. " * 2000 + "\n", size),
+        # A real transcript repeated
+        'realistic': _repeat_to_size(sample + "\n", size),
+    }
+
+
+def time_call(func: Callable[[str], object], text: str) -> Tuple[float, object]:
+    """Wall time of func(text) in seconds, and its result"""
+    start = time.perf_counter()
+    result = func(text)
+    return time.perf_counter() - start, result
+
+
+def legacy_scaling(text: str, budget: float) -> List[Dict]:
+    """Time the legacy regex on doubling prefixes until it exceeds budget"""
+    results = []
+    size = 1024
+
+    while size <= len(text):
+        seconds, _ = time_call(lambda t: list(LEGACY_SPEAKER_PATTERN.finditer(t)), text[:size])
+        results.append({'characters': size, 'seconds': round(seconds, 4)})
+        if seconds > budget:
+            break
+        size *= 2
+
+    return results
+
+
+def run(size_mb: float, legacy_budget: float) -> List[Dict]:
+    """Benchmark the parser on every input"""
+    processor = TranscriptProcessor()
+    size = int(size_mb * 1024 * 1024)
+    results = []
+
+    for name, text in build_inputs(size).items():
+        seconds, turns = time_call(processor.identify_speaker_turns, text)
+        results.append({
+            'input': name,
+            'characters': len(text),
+            'turns': len(turns),
+            'seconds': round(seconds, 4),
+            'mb_per_second': round(len(text) / (1024 * 1024) / seconds, 2) if seconds else None,
+            'legacy': legacy_scaling(text, legacy_budget) if legacy_budget > 0 else [],
+        })
+
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print results as a table"""
+    header = f"{'Input':<24} {'MB':>7} {'Seconds':>9} {'MB/s':>8}   Legacy regex (chars: seconds)"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        legacy = ', '.join(f"{l['characters']}: {l['seconds']}" for l in r['legacy'][-3:])
+        print(
+            f"{r['input']:<24} {r['characters'] / (1024 * 1024):>7.2f} "
+            f"{r['seconds']:>9.3f} {r['mb_per_second']:>8.1f}   {legacy}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the speaker turn parser on pathological inputs')
+    parser.add_argument('--size-mb', type=float, default=10.0, help='Approximate size of each input')
+    parser.add_argument('--legacy-budget', type=float, default=2.0,
+                       help='Stop timing the legacy regex once a prefix takes longer (0 to skip)')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+
+    args = parser.parse_args()
+
+    results = run(args.size_mb, args.legacy_budget)
+    print_report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
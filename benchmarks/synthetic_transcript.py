@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Synthetic earnings call transcript generator
+
+Builds transcripts of any size from the sentences of the sample transcript
+(data/transcripts/sample_earnings_call.txt). Management sentences are drawn
+from executive turns and questions from analyst turns; numbers are
+re-randomized so repeated sentences do not produce identical text. The
+layout (metadata header, PREPARED REMARKS, QUESTIONS AND ANSWERS, operator
+hand-offs, "Name - Title:" headers) matches what TranscriptProcessor parses.
+
+Usage:
+    python benchmarks/synthetic_transcript.py --words 10000 [--speakers 3]
+        [--qa-pairs 12] [--numeric-density 0.4] [--seed 0] [-o out.txt]
+"""
+import sys
+import re
+import random
+import argparse
+from pathlib import Path
+from typing import List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from src.core.transcript_processor import TranscriptProcessor
+from src.utils.sentence_segmenter import get_segmenter
+
+SAMPLE_TRANSCRIPT = settings.DATA_DIR / 'transcripts' / 'sample_earnings_call.txt'
+
+EXECUTIVE_TITLES = [
+    'Chief Executive Officer',
+    'Chief Financial Officer',
+    'Chief Operating Officer',
+    'Head of Investor Relations',
+    'Head of Cloud Services',
+    'Chief Technology Officer',
+]
+
+FIRST_NAMES = ['John', 'Sarah', 'Michael', 'Jennifer', 'David', 'Laura', 'Robert', 'Emily',
+               'James', 'Maria', 'Daniel', 'Karen', 'Thomas', 'Susan', 'Mark', 'Anna']
+LAST_NAMES = ['Smith', 'Johnson', 'Chen', 'Rodriguez', 'Park', 'Miller', 'Nguyen', 'Patel',
+              'Garcia', 'Brown', 'Kim', 'Wilson', 'Moore', 'Taylor', 'Lee', 'Clark']
+FIRMS = ['Goldman Sachs', 'Morgan Stanley', 'JPMorgan', 'Bank of America', 'Citi',
+         'Barclays', 'UBS', 'Deutsche Bank', 'Jefferies', 'Evercore']
+
+SENTENCES_PER_PARAGRAPH = 4
+
+# Share of the word budget spent on prepared remarks when there is a Q&A
+PREPARED_SHARE = 0.45
+
+_QA_OPENING = "Operator: We will now begin the question and answer session."
+_QA_HANDOFF = "Operator: Our next question comes from {analyst} with {firm}."
+_QA_CLOSING = "Operator: That concludes our question and answer session."
+
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+class SentencePool:
+    """Sentences of the sample transcript, split by speaker role and numeric content"""
+
+    def __init__(self, sample_path: Path = SAMPLE_TRANSCRIPT):
+        raw = sample_path.read_text(encoding='utf-8')
+        self.header = raw[:raw.index('PREPARED REMARKS')].strip()
+
+        segmenter = get_segmenter('regex')
+        self.numeric: List[str] = []
+        self.narrative: List[str] = []
+        self.questions: List[str] = []
+
+        for turn in TranscriptProcessor().identify_speaker_turns(raw):
+            if turn.role == 'operator':
+                continue
+            text = raw[turn.start:turn.end]
+            for start, end in segmenter.spans(text):
+                sentence = ' '.join(text[start:end].split())
+                # Analysts are listed by firm, so their turns have no matched role
+                if turn.role in ('analyst', None):
+                    self.questions.append(sentence)
+                elif _NUMBER.search(sentence):
+                    self.numeric.append(sentence)
+                else:
+                    self.narrative.append(sentence)
+
+
+def _vary_numbers(sentence: str, rng: random.Random) -> str:
+    """Replace each number with a random one of similar magnitude"""
+    def replace(match):
+        value = match.group()
+        if '.' in value:
+            whole, fraction = value.split('.')
+            return f"{rng.randint(0, max(1, int(whole) * 2))}.{rng.randint(0, 10 ** len(fraction) - 1):0{len(fraction)}d}"
+        if len(value) == 4 and value.startswith('20'):
+            return value  # keep years
+        return str(rng.randint(1, max(2, int(value) * 2)))
+
+    return _NUMBER.sub(replace, sentence)
+
+
+def _people(rng: random.Random, count: int) -> List[str]:
+    """Distinct random full names"""
+    names = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    return rng.sample(names, count)
+
+
+def _management_text(pool: SentencePool, rng: random.Random, words: int, numeric_density: float) -> str:
+    """Paragraphs of management sentences totalling at most words words (at least one sentence)"""
+    sentences = []
+    count = 0
+    while True:
+        if pool.numeric and rng.random() < numeric_density:
+            sentence = _vary_numbers(rng.choice(pool.numeric), rng)
+        else:
+            sentence = rng.choice(pool.narrative)
+        length = len(sentence.split())
+        if sentences and count + length > words:
+            break
+        sentences.append(sentence)
+        count += length
+
+    return '\n\n'.join(
+        ' '.join(sentences[i:i + SENTENCES_PER_PARAGRAPH])
+        for i in range(0, len(sentences), SENTENCES_PER_PARAGRAPH)
+    )
+
+
+def generate_transcript(
+    words: int = 10000,
+    speakers: int = 3,
+    qa_pairs: int = 10,
+    numeric_density: float = 0.4,
+    seed: int = 0,
+    pool: SentencePool = None
+) -> str:
+    """
+    Generate a synthetic transcript
+
+    Args:
+        words: Approximate word count
+        speakers: Number of executives (at least 1; the first two are CEO and CFO)
+        qa_pairs: Number of analyst question / management answer exchanges
+        numeric_density: Probability that a management sentence contains numbers
+        seed: Random seed (same arguments and seed give the same transcript)
+        pool: Sentence pool (built from the sample transcript if omitted)
+
+    Returns:
+        Transcript text
+    """
+    rng = random.Random(seed)
+    pool = pool or SentencePool()
+
+    speakers = max(1, min(speakers, len(EXECUTIVE_TITLES)))
+    names = _people(rng, speakers + qa_pairs)
+    executives = [f"{name} - {title}" for name, title in zip(names, EXECUTIVE_TITLES[:speakers])]
+    analysts = [(name, rng.choice(FIRMS)) for name in names[speakers:]]
+
+    # Header, operator lines and questions are fixed text; management
+    # sentences fill the rest of the word budget
+    questions = [
+        ' '.join(rng.choice(pool.questions) for _ in range(rng.randint(1, 3)))
+        for _ in analysts
+    ]
+    fixed = [pool.header, 'PREPARED REMARKS']
+    if qa_pairs:
+        fixed += ['QUESTIONS AND ANSWERS', _QA_OPENING, _QA_CLOSING] + questions
+    fixed += [_QA_HANDOFF.format(analyst=analyst, firm=firm) for analyst, firm in analysts]
+    fixed += executives + [f"{analyst} - {firm}" for analyst, firm in analysts]
+    fixed += [max(executives, key=len)] * qa_pairs  # answer headers
+    remaining = max(0, words - sum(len(part.split()) for part in fixed))
+
+    prepared_words = int(remaining * (PREPARED_SHARE if qa_pairs else 1.0))
+    answer_words = (remaining - prepared_words) // qa_pairs if qa_pairs else 0
+
+    parts = [pool.header, 'PREPARED REMARKS']
+
+    per_executive = prepared_words // speakers
+    for executive in executives:
+        parts.append(f"{executive}: {_management_text(pool, rng, per_executive, numeric_density)}")
+
+    if qa_pairs:
+        parts.append('QUESTIONS AND ANSWERS')
+        parts.append(_QA_OPENING)
+
+        for (analyst, firm), question in zip(analysts, questions):
+            parts.append(_QA_HANDOFF.format(analyst=analyst, firm=firm))
+            parts.append(f"{analyst} - {firm}: {question}")
+            parts.append(
+                f"{rng.choice(executives)}: "
+                f"{_management_text(pool, rng, answer_words, numeric_density)}"
+            )
+
+        parts.append(_QA_CLOSING)
+
+    return '\n\n'.join(parts) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic earnings call transcript')
+    parser.add_argument('--words', type=int, default=10000, help='Approximate word count')
+    parser.add_argument('--speakers', type=int, default=3, help='Number of executives')
+    parser.add_argument('--qa-pairs', type=int, default=10, help='Number of Q&A exchanges')
+    parser.add_argument('--numeric-density', type=float, default=0.4,
+                       help='Share of management sentences containing numbers')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('-o', '--output', type=Path, help='Output file (default: stdout)')
+
+    args = parser.parse_args()
+
+    text = generate_transcript(args.words, args.speakers, args.qa_pairs, args.numeric_density, args.seed)
+
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+        print(f"Wrote {len(text.split()):,} words to {args.output}")
+    else:
+        sys.stdout.write(text)
@@ -208,11 +208,36 @@ def inspect(results_file, metric):
 			click.echo(f"  - {key}")
 			
 			
+def _preprocess_batch(analyzer, transcript_files, chunk_size):
+	"""
+	Preprocess transcripts in chunks and score their lexicon sentiment together
+	
+	Yields:
+		(position, file_path, ProcessedTranscript) for every transcript that loaded
+	"""
+	chunk_size = max(1, chunk_size)
+	
+	for offset in range(0, len(transcript_files), chunk_size):
+		chunk = []
+		for i, file_path in enumerate(transcript_files[offset:offset + chunk_size], offset + 1):
+			try:
+				chunk.append((i, file_path, analyzer.preprocess(str(file_path))))
+			except Exception as e:
+				click.echo(f"\n[{i}/{len(transcript_files)}] {file_path.name}")
+				click.echo(f"  ❌ Error: {str(e)}")
+		
+		# One vectorized lexicon pass over every document in the chunk
+		analyzer.score_lexicon([transcript for _, _, transcript in chunk])
+		
+		yield from chunk
+		
+		
 @cli.command()
 @click.argument('directory', type=click.Path(exists=True))
 @click.option('--format', '-f', type=click.Choice(['json', 'csv']), default='json')
 @click.option('--with-deception', is_flag=True, default=True)
-def batch(directory, format, with_deception):
+@click.option('--chunk-size', type=int, default=16, help='Transcripts preprocessed and lexicon-scored together')
+def batch(directory, format, with_deception, chunk_size):
 	"""
 	Batch process all transcripts in a directory
 	
@@ -238,11 +263,11 @@ def batch(directory, format, with_deception):
 	
 	results_list = []
 	
-	for i, file_path in enumerate(transcript_files, 1):
+	for i, file_path, transcript in _preprocess_batch(analyzer, transcript_files, chunk_size):
 		click.echo(f"\n[{i}/{len(transcript_files)}] Processing: {file_path.name}")
 		
 		try:
-			results = analyzer.analyze_transcript(str(file_path))
+			results = analyzer.analyze_processed(transcript)
 			
 			# Save individual result
 			output_path = file_path.with_suffix('.results.json')
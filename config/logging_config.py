@@ -113,17 +113,20 @@ class PerformanceLogger:
             pass
     """
 
-    def __init__(self, operation: str, logger: logging.Logger = None):
+    def __init__(self, operation: str, logger: logging.Logger = None, timings: dict = None):
         """
         Initialize performance logger
 
         Args:
             operation: Name of operation being measured
             logger: Logger to use (default: root logger)
+            timings: Optional dict that receives operation -> duration (seconds)
         """
         self.operation = operation
         self.logger = logger or logging.getLogger()
+        self.timings = timings
         self.start_time = None
+        self.duration = None
 
     def __enter__(self):
         """Start timing"""
@@ -136,6 +139,9 @@ class PerformanceLogger:
         """End timing and log duration"""
         import time
         duration = time.time() - self.start_time
+        self.duration = duration
+        if self.timings is not None:
+            self.timings[self.operation] = duration
 
         if exc_type is None:
             self.logger.info(f"Completed: {self.operation} in {duration:.2f}s")
@@ -3,7 +3,7 @@ Configuration settings for Earnings Call Analyzer
 Phase 2 Enhanced - Includes database, API, and advanced analysis settings
 """
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 
 class Settings:
@@ -29,6 +29,11 @@ class Settings:
     # ===== OLLAMA LLM CONFIGURATION =====
     OLLAMA_HOST: str = "http://localhost:11434"
     OLLAMA_TIMEOUT: int = 120
+    # Several Ollama servers: url -> routing weight (empty: OLLAMA_HOST only)
+    OLLAMA_ENDPOINTS: Dict[str, float] = {}
+    OLLAMA_POOL_SIZE: int = 4
+    OLLAMA_EJECT_AFTER_FAILURES: int = 3  # Consecutive failed requests
+    OLLAMA_PROBE_INTERVAL: float = 30.0  # Seconds between probes of an ejected server
     
     # LLM Models
     SENTIMENT_MODEL: str = "llama3.1:8b"
@@ -39,6 +44,14 @@ class Settings:
     LLM_MAX_TOKENS: int = 2048
     LLM_CHUNK_SIZE: int = 512
     LLM_CHUNK_OVERLAP: int = 128
+    LLM_CHUNK_MEMO_SIZE: int = 4096  # Chunk sentiment results kept in memory per analyzer
+    LLM_MAX_CONCURRENCY: int = 4  # LLM requests in flight per async client (initial limit when adaptive; pooled clients use the pool's limit)
+    # Adapt the number of LLM requests in flight to the observed latency
+    LLM_ADAPTIVE_CONCURRENCY: bool = True
+    LLM_CONCURRENCY_MIN: int = 1
+    LLM_CONCURRENCY_MAX: int = 32
+    LLM_LATENCY_WINDOW: int = 20  # Completed requests per limit adjustment
+    LLM_LATENCY_TOLERANCE: float = 1.5  # p50 over baseline latency treated as overload
     
     # ===== PHASE 2: FEATURE FLAGS =====
     ENABLE_DECEPTION_ANALYSIS: bool = True
@@ -53,11 +66,22 @@ class Settings:
     MIN_TRANSCRIPT_LENGTH: int = 500  # words
     MAX_TRANSCRIPT_LENGTH: int = 50000  # words
     
+    # ===== TEXT PROCESSING =====
+    # Sentence segmentation backend: "nltk" (punkt, reference) or "regex" (fast)
+    SENTENCE_SEGMENTER: str = "nltk"
+    # spaCy parsing: Docs are parsed through nlp.pipe and shared via a cache
+    SPACY_BATCH_SIZE: int = 64
+    SPACY_N_PROCESS: int = 1  # worker processes for batches larger than SPACY_BATCH_SIZE
+    SPACY_DOC_CACHE_SIZE: int = 512  # Docs kept in the shared cache
+    
     # ===== SENTIMENT ANALYSIS =====
     # Hybrid sentiment weighting (must sum to 1.0)
     HYBRID_SENTIMENT_WEIGHT_LEXICON: float = 0.3
     HYBRID_SENTIMENT_WEIGHT_LLM: float = 0.7
     
+    # Loughran-McDonald word lists compiled to a word -> category bitmask file
+    LM_COMPILED_LEXICON: Path = DICTIONARIES_DIR / "loughran_mcdonald.bin"
+    
     # S&P 500 Benchmarks
     SP500_NET_POSITIVITY: float = 15.0  # LM Net Positivity benchmark
     
@@ -71,10 +95,33 @@ class Settings:
         'quarter': 2,
     }
     
+    # Maximum learned entries in the process-wide syllable memo table
+    SYLLABLE_CACHE_SIZE: int = 50000
+    
     # ===== NUMERICAL ANALYSIS =====
     # S&P 500 Benchmarks
     SP500_NUMERIC_TRANSPARENCY: float = 3.5  # Percentage of words that are numbers
     
+    # Rule-based contextualization cues (lowercase substrings); a number's
+    # sentence scores one point per cue category it contains
+    CONTEXT_COMPARISON_CUES: List[str] = [
+        'up from', 'down from', 'vs', 'versus', 'compared to',
+        'year-over-year', 'yoy', 'qoq', 'quarter-over-quarter'
+    ]
+    CONTEXT_EXPLANATION_CUES: List[str] = [
+        'driven by', 'due to', 'because', 'as a result',
+        'reflecting', 'primarily', 'driven'
+    ]
+    CONTEXT_IMPLICATION_CUES: List[str] = [
+        'positioning', 'enables', 'allows', 'supports',
+        'demonstrates', 'indicates', 'shows'
+    ]
+    
+    # Sentence density clusters: rolling window (sentences) and extra window
+    # sizes reported as multi-scale clusters (empty = off)
+    DENSITY_CLUSTER_WINDOW: int = 5
+    DENSITY_CLUSTER_SCALES: List[int] = []
+    
     # ===== PHASE 2: DECEPTION DETECTION =====
     # Risk Level Thresholds (0-100 scale)
     DECEPTION_RISK_WARNING: int = 50  # High risk threshold
@@ -143,6 +190,9 @@ class Settings:
     # ===== CACHE SETTINGS =====
     ENABLE_CACHING: bool = True
     CACHE_TTL: int = 3600  # seconds (1 hour)
+    LLM_CACHE_PATH: Path = CACHE_DIR / "llm_responses.sqlite"
+    LLM_CACHE_MAX_ENTRIES: int = 100000
+    LLM_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
     
     # ===== JOB QUEUE (for API) =====
     MAX_CONCURRENT_JOBS: int = 4
@@ -225,7 +275,11 @@ class Settings:
         
         if not (1024 <= self.API_PORT <= 65535):
             warnings.append("API_PORT should be between 1024 and 65535")
-        
+
+        # Validate text processing
+        if self.SENTENCE_SEGMENTER not in ("nltk", "regex"):
+            warnings.append("SENTENCE_SEGMENTER must be 'nltk' or 'regex'")
+
         return warnings
 
 
@@ -3,7 +3,7 @@ Main Analysis Aggregator - Phase 2 Enhanced
 Combines all analysis modules including deception detection
 """
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 import json
 import logging
 from pathlib import Path
@@ -57,6 +57,15 @@ class ComprehensiveAnalysisResult:
     # Phase 1: Speaker-specific metrics (top 2: CEO, CFO)
     ceo_metrics: Dict[str, Any]
     cfo_metrics: Dict[str, Any]
+
+    # Key insights
+    key_findings: List[str]
+    red_flags: List[str]
+    strengths: List[str]
+
+    # Raw transcript info
+    word_count: int
+    sentence_count: int
     
     # Phase 2A: Deception Detection
     deception_risk: Optional[DeceptionRiskScore] = None
@@ -68,15 +77,6 @@ class ComprehensiveAnalysisResult:
     distribution_patterns: Optional[DistributionPattern] = None
     informativeness_metrics: Optional[InformativenessMetrics] = None
 
-    # Key insights
-    key_findings: List[str]
-    red_flags: List[str]
-    strengths: List[str]
-
-    # Raw transcript info
-    word_count: int
-    sentence_count: int
-
 
 class EarningsCallAnalyzer:
     """Main analyzer that orchestrates all analysis modules including deception detection"""
@@ -97,7 +97,7 @@ class EarningsCallAnalyzer:
 
         # Phase 1 analyzers
         self.transcript_processor = TranscriptProcessor()
-        self.sentiment_analyzer = HybridSentimentAnalyzer()
+        self.sentiment_analyzer = HybridSentimentAnalyzer(use_llm=use_llm_features)
         self.complexity_analyzer = ComplexityAnalyzer()
         self.numerical_analyzer = NumericalAnalyzer(use_llm_contextualization=use_llm_features)
         self.use_llm = use_llm_features
@@ -114,6 +114,7 @@ class EarningsCallAnalyzer:
             self.deception_analyzer = DeceptionRiskAnalyzer()
             self.evasiveness_analyzer = EvasivenessAnalyzer()
             self.qa_detector = QuestionEvasionDetector()
+            self.qa_detector.use_llm = use_llm_features
             logger.info("Deception detection enabled")
         else:
             logger.info("Deception detection disabled")
@@ -121,6 +122,9 @@ class EarningsCallAnalyzer:
             self.evasiveness_analyzer = None
             self.qa_detector = None
 
+        # Duration of each stage of the last analyze_transcript call (seconds)
+        self.stage_timings: Dict[str, float] = {}
+
         logger.info("Analyzer initialization complete")
     
     def analyze_transcript(self, file_path: str) -> ComprehensiveAnalysisResult:
@@ -133,13 +137,27 @@ class EarningsCallAnalyzer:
         Returns:
             ComprehensiveAnalysisResult object
         """
+        self.stage_timings = {}
+        transcript = self.preprocess(file_path)
+        return self.analyze_processed(transcript)
+
+    def preprocess(self, file_path: str) -> ProcessedTranscript:
+        """
+        Load, clean and validate a transcript
+        
+        Args:
+            file_path: Path to transcript file
+            
+        Returns:
+            ProcessedTranscript object
+        """
         logger.info("="*80)
         logger.info(f"Processing transcript: {file_path}")
         logger.info("="*80)
 
         # Step 1: Process transcript
         logger.info("STEP 1: TRANSCRIPT PREPROCESSING")
-        with PerformanceLogger("transcript_preprocessing", logger):
+        with PerformanceLogger("transcript_preprocessing", logger, self.stage_timings):
             logger.info("Preprocessing text...")
             transcript = self.transcript_processor.process(file_path)
 
@@ -151,33 +169,75 @@ class EarningsCallAnalyzer:
                     logger.warning(f"  - {warning}")
             logger.info(f"Processed {transcript.word_count:,} words in {transcript.sentence_count} sentences")
 
+        return transcript
+
+    def score_lexicon(self, transcripts: Sequence[ProcessedTranscript]) -> None:
+        """
+        Compute lexicon sentiment for whole transcripts, sections and speakers in one batch
+        
+        Scores are memoized on each document, so the sentiment passes of
+        analyze_processed reuse them. Pass several transcripts to batch
+        across transcripts.
+        
+        Args:
+            transcripts: Processed transcripts
+        """
+        documents = []
+        for transcript in transcripts:
+            documents.append(transcript.document)
+            documents.extend(transcript.section_documents().values())
+            documents.extend(transcript.speaker_documents().values())
+        self.sentiment_analyzer.lexicon_analyzer.analyze_batch(documents)
+
+    def analyze_processed(self, transcript: ProcessedTranscript) -> ComprehensiveAnalysisResult:
+        """
+        Run every analysis on an already processed transcript
+        
+        Args:
+            transcript: ProcessedTranscript from preprocess
+            
+        Returns:
+            ComprehensiveAnalysisResult object
+        """
         # Step 2: Phase 1 Analysis
         logger.info("STEP 2: PHASE 1 CORE ANALYSIS")
 
-        with PerformanceLogger("sentiment_analysis", logger):
+        # Every overall pass reads the same tokenization
+        document = transcript.document
+
+        # Sections and speakers are range views of the same document, so the
+        # per-section and per-speaker passes reuse its tokenization
+        section_documents = transcript.section_documents()
+        speaker_documents = transcript.speaker_documents()
+
+        with PerformanceLogger("sentiment_analysis", logger, self.stage_timings):
             logger.info("Analyzing overall sentiment...")
-            overall_sentiment = self.sentiment_analyzer.analyze(transcript.cleaned_text)
+            self.score_lexicon([transcript])
+            # LLM chunks align with the sections, so the section passes reuse
+            # the chunk results behind the overall score
+            self.sentiment_analyzer.plan_llm_chunks(document, section_documents.values())
+            overall_sentiment = self.sentiment_analyzer.analyze_document(document)
 
-        with PerformanceLogger("complexity_analysis", logger):
+        with PerformanceLogger("complexity_analysis", logger, self.stage_timings):
             logger.info("Analyzing language complexity...")
-            overall_complexity = self.complexity_analyzer.analyze(transcript.cleaned_text)
+            overall_complexity = self.complexity_analyzer.analyze_document(document)
 
-        with PerformanceLogger("numerical_analysis", logger):
+        with PerformanceLogger("numerical_analysis", logger, self.stage_timings):
             logger.info("Analyzing numerical content...")
-            overall_numerical = self.numerical_analyzer.analyze(transcript.cleaned_text)
+            overall_numerical = self.numerical_analyzer.analyze_document(document)
 
         # Step 3: Section analysis
-        with PerformanceLogger("section_analysis", logger):
+        with PerformanceLogger("section_analysis", logger, self.stage_timings):
             logger.info("Analyzing sections (Prepared Remarks vs Q&A)...")
-            section_sentiment = self.sentiment_analyzer.analyze_by_section(transcript.sections)
-            section_complexity = self.complexity_analyzer.analyze_by_section(transcript.sections)
+            section_sentiment = self.sentiment_analyzer.analyze_by_section(section_documents)
+            section_complexity = self.complexity_analyzer.analyze_by_section(section_documents)
 
         # Step 4: Speaker analysis
-        with PerformanceLogger("speaker_analysis", logger):
+        with PerformanceLogger("speaker_analysis", logger, self.stage_timings):
             logger.info("Analyzing speakers...")
-            speaker_sentiment = self.sentiment_analyzer.analyze_by_speaker(transcript.speakers)
-            speaker_complexity = self.complexity_analyzer.analyze_by_speaker(transcript.speakers)
-            speaker_numerical = self.numerical_analyzer.analyze_by_speaker(transcript.speakers)
+            speaker_sentiment = self.sentiment_analyzer.analyze_by_speaker(speaker_documents)
+            speaker_complexity = self.complexity_analyzer.analyze_by_speaker(speaker_documents)
+            speaker_numerical = self.numerical_analyzer.analyze_by_speaker(speaker_documents)
 
         logger.info("Phase 1 analysis complete")
         
@@ -189,7 +249,7 @@ class EarningsCallAnalyzer:
         if self.enable_deception:
             logger.info("STEP 3: PHASE 2A DECEPTION ANALYSIS")
 
-            with PerformanceLogger("deception_risk_analysis", logger):
+            with PerformanceLogger("deception_risk_analysis", logger, self.stage_timings):
                 logger.info("Analyzing deception risk indicators...")
                 deception_risk = self.deception_analyzer.analyze(
                     transcript=transcript,
@@ -202,13 +262,13 @@ class EarningsCallAnalyzer:
                     }
                 )
 
-            with PerformanceLogger("evasiveness_analysis", logger):
+            with PerformanceLogger("evasiveness_analysis", logger, self.stage_timings):
                 logger.info("Analyzing evasiveness patterns...")
-                evasiveness_scores = self.evasiveness_analyzer.analyze(transcript.cleaned_text)
+                evasiveness_scores = self.evasiveness_analyzer.analyze_document(document)
 
             # Q&A analysis (if Q&A section exists)
-            if transcript.sections.get('qa') and settings.ENABLE_QA_ANALYSIS:
-                with PerformanceLogger("qa_evasion_analysis", logger):
+            if transcript.sections.has_text('qa') and settings.ENABLE_QA_ANALYSIS:
+                with PerformanceLogger("qa_evasion_analysis", logger, self.stage_timings):
                     logger.info("Analyzing Q&A exchanges for evasion...")
                     qa_analysis = self.qa_detector.analyze_qa_section(transcript.sections['qa'])
                     logger.info(f"Analyzed {len(qa_analysis)} Q&A pairs")
@@ -224,25 +284,23 @@ class EarningsCallAnalyzer:
         distribution_patterns = None
         informativeness_metrics = None
 
-        with PerformanceLogger("sentence_density_analysis", logger):
+        with PerformanceLogger("sentence_density_analysis", logger, self.stage_timings):
             logger.info("Analyzing sentence-level numeric density...")
-            sentence_density_metrics = self.sentence_density_analyzer.analyze_sentence_density(
-                transcript.cleaned_text
-            )
+            sentence_density_metrics = self.sentence_density_analyzer.analyze_document(document)
             logger.info(f"Analyzed {sentence_density_metrics.total_sentences} sentences")
             logger.info(f"Dense sentences: {sentence_density_metrics.numeric_dense_sentences} ({sentence_density_metrics.proportion_numeric_dense:.1%})")
 
-        with PerformanceLogger("distribution_pattern_analysis", logger):
+        with PerformanceLogger("distribution_pattern_analysis", logger, self.stage_timings):
             logger.info("Analyzing numeric distribution patterns...")
             distribution_patterns = self.sentence_density_analyzer.analyze_distribution_patterns(
                 sentence_density_metrics,
-                sections=transcript.sections,
-                speakers=transcript.speakers
+                sections=section_documents,
+                speakers=speaker_documents
             )
             logger.info(f"Pattern: {distribution_patterns.pattern_type} (confidence: {distribution_patterns.pattern_confidence:.1%})")
             logger.info(f"Clusters detected: {distribution_patterns.cluster_count}")
 
-        with PerformanceLogger("informativeness_calculation", logger):
+        with PerformanceLogger("informativeness_calculation", logger, self.stage_timings):
             logger.info("Calculating informativeness metrics...")
             informativeness_metrics = self.sentence_density_analyzer.calculate_informativeness(
                 sentence_density_metrics,
@@ -257,7 +315,7 @@ class EarningsCallAnalyzer:
 
         # Step 6: Generate insights
         logger.info("STEP 4: GENERATING INSIGHTS")
-        with PerformanceLogger("insights_generation", logger):
+        with PerformanceLogger("insights_generation", logger, self.stage_timings):
             logger.info("Identifying patterns and generating insights...")
             key_findings, red_flags, strengths = self._generate_insights(
                 overall_sentiment,
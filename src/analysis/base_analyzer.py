@@ -5,9 +5,12 @@ Provides shared functionality for all analyzer implementations,
 eliminating code duplication across sentiment, complexity, and numerical analyzers.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, TypeVar, Generic, Any
+from typing import TYPE_CHECKING, Dict, TypeVar, Generic, Any
 import logging
 
+if TYPE_CHECKING:
+    from src.core.tokenized_document import TokenizedDocument
+
 logger = logging.getLogger(__name__)
 
 # Generic type for analysis results
@@ -53,6 +56,21 @@ class BaseAnalyzer(ABC, Generic[T]):
         """
         pass
 
+    def analyze_document(self, doc: 'TokenizedDocument') -> T:
+        """
+        Analyze an already tokenized document
+
+        Subclasses override this to reuse the document's sentence and token
+        spans; the default falls back to analyzing the document text.
+
+        Args:
+            doc: TokenizedDocument shared across analyzers
+
+        Returns:
+            Analysis result of type T
+        """
+        return self.analyze(doc.text)
+
     def analyze_by_section(self, sections: Dict[str, str]) -> Dict[str, T]:
         """
         Analyze text by section (e.g., Prepared Remarks, Q&A)
@@ -3,16 +3,18 @@ Language Complexity Analysis Module
 Implements all 5 readability metrics as specified in PRD
 """
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Mapping, NamedTuple, Optional, Union
 import math
-from src.utils.text_utils import (
-    tokenize_sentences,
-    tokenize_words,
-    count_syllables,
-    count_complex_words,
-    count_polysyllabic_words,
-    calculate_word_character_ratio
-)
+import re
+import numpy as np
+from src.core.tokenized_document import TokenizedDocument, as_document, is_blank
+from src.utils.syllables import get_syllable_counter
+
+_NON_LETTERS = re.compile(r'[^a-zA-Z]')
+
+# TokenizedDocument._cache keys for readability features and per-sentence scores
+FEATURES_KEY = 'readability_features'
+SENTENCE_SCORES_KEY = 'sentence_complexity'
 
 
 @dataclass
@@ -36,6 +38,110 @@ class ComplexityScores:
     complex_word_count: int
 
 
+class ReadabilityTotals(NamedTuple):
+    """Sums of the per-token readability features over a span of tokens"""
+    token_count: int  # All tokens, punctuation included (Coleman-Liau denominator)
+    word_count: int  # Alphanumeric tokens
+    syllable_count: int
+    letter_count: int  # ASCII letters over all tokens
+    polysyllabic_count: int
+    complex_count: int
+
+
+class ReadabilityFeatures:
+    """
+    Per-token readability features of a document
+    
+    One array per feature, aligned with the document's tokens (punctuation
+    tokens have zero syllables and are never polysyllabic or complex).
+    Column-wise prefix sums turn the totals of any token range into two
+    lookups, so sections and speakers (range views) are scored by range
+    reductions over their parent document's features.
+    """
+    
+    def __init__(self, doc: TokenizedDocument):
+        """
+        Compute features for every token of doc
+        
+        Args:
+            doc: Tokenized document
+        """
+        tokens = doc.tokens
+        is_word = ~doc.punct
+        words = [token for token, word in zip(tokens, is_word.tolist()) if word]
+        
+        # Syllables per word, counted once per distinct word
+        syllables = np.zeros(len(tokens), dtype=np.int64)
+        syllables[is_word] = get_syllable_counter().count_batch(words)
+        
+        candidates = np.zeros(len(tokens), dtype=bool)
+        candidates[is_word] = ComplexityAnalyzer._complex_candidates(words)
+        
+        letter_counts = {token: len(_NON_LETTERS.sub('', token)) for token in dict.fromkeys(tokens)}
+        
+        self.is_word = is_word
+        self.syllables = syllables
+        self.letters = np.fromiter(map(letter_counts.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        self.is_polysyllabic = syllables >= 3
+        self.is_complex = self.is_polysyllabic & candidates
+        self.sentence_bounds = doc.sentence_bounds
+        
+        # Row i holds the sums over tokens [0, i)
+        columns = np.stack([
+            np.ones(len(tokens), dtype=np.int64),
+            is_word,
+            syllables,
+            self.letters,
+            self.is_polysyllabic,
+            self.is_complex,
+        ], axis=1).astype(np.int64)
+        self._prefix = np.vstack([np.zeros((1, columns.shape[1]), dtype=np.int64), np.cumsum(columns, axis=0)])
+    
+    @classmethod
+    def of(cls, doc: TokenizedDocument) -> 'ReadabilityFeatures':
+        """Features of a document (computed once and cached on it)"""
+        if FEATURES_KEY not in doc._cache:
+            doc._cache[FEATURES_KEY] = cls(doc)
+        return doc._cache[FEATURES_KEY]
+    
+    def totals(self, token_ranges: Optional[np.ndarray] = None) -> ReadabilityTotals:
+        """
+        Feature totals over token ranges
+        
+        Args:
+            token_ranges: (n, 2) array of (first, last) token offsets; None for all tokens
+            
+        Returns:
+            ReadabilityTotals
+        """
+        if token_ranges is None:
+            sums = self._prefix[-1]
+        else:
+            sums = (self._prefix[token_ranges[:, 1]] - self._prefix[token_ranges[:, 0]]).sum(axis=0)
+        return ReadabilityTotals(*(int(value) for value in sums))
+    
+    def sentence_totals(self) -> np.ndarray:
+        """
+        Feature totals of every sentence
+        
+        Returns:
+            Integer array (n_sentences, 6), columns in ReadabilityTotals order
+        """
+        return self._prefix[self.sentence_bounds[1:]] - self._prefix[self.sentence_bounds[:-1]]
+    
+    @staticmethod
+    def totals_for(doc: TokenizedDocument) -> ReadabilityTotals:
+        """
+        Feature totals of a document
+        
+        A range view is reduced over its parent's features; any other
+        document is featurized itself.
+        """
+        if doc.parent is not None and doc.token_ranges is not None:
+            return ReadabilityFeatures.of(doc.parent).totals(doc.token_ranges)
+        return ReadabilityFeatures.of(doc).totals()
+
+
 class ComplexityAnalyzer:
     """Analyzes language complexity using multiple readability formulas"""
     
@@ -59,25 +165,34 @@ class ComplexityAnalyzer:
         Returns:
             ComplexityScores object
         """
-        # Tokenize
-        sentences = tokenize_sentences(text)
-        words = tokenize_words(text, lowercase=False, remove_punct=True)
+        return self.analyze_document(TokenizedDocument.from_text(text))
+    
+    def analyze_document(self, doc: TokenizedDocument) -> ComplexityScores:
+        """
+        Analyze language complexity of an already tokenized document
         
-        if not sentences or not words:
-            return self._empty_scores()
+        Args:
+            doc: Tokenized document
+            
+        Returns:
+            ComplexityScores object
+        """
+        sentence_count = doc.sentence_count
+        totals = ReadabilityFeatures.totals_for(doc)
         
-        sentence_count = len(sentences)
-        word_count = len(words)
+        if not sentence_count or not totals.word_count:
+            return self._empty_scores()
         
-        # Calculate syllable count
-        syllable_count = sum(count_syllables(word) for word in words)
+        word_count = totals.word_count
+        syllable_count = totals.syllable_count
+        complex_count = totals.complex_count
         
         # Calculate individual metrics
         fres = self._flesch_reading_ease(word_count, sentence_count, syllable_count)
         fkgl = self._flesch_kincaid_grade(word_count, sentence_count, syllable_count)
-        fog = self._gunning_fog_index(text, words, sentences)
-        smog = self._smog_index(text, sentences)
-        cli = self._coleman_liau_index(text, words)
+        fog = self._gunning_fog_index(word_count, sentence_count, complex_count)
+        smog = self._smog_index(totals.polysyllabic_count)
+        cli = self._coleman_liau_index(totals.letter_count, totals.token_count, sentence_count)
         
         # Calculate composite score
         composite = self._composite_score(fres, fkgl, fog, smog, cli)
@@ -96,9 +211,56 @@ class ComplexityAnalyzer:
             word_count=word_count,
             sentence_count=sentence_count,
             syllable_count=syllable_count,
-            complex_word_count=count_complex_words(words)
+            complex_word_count=complex_count
         )
     
+    def sentence_scores(self, doc: TokenizedDocument) -> np.ndarray:
+        """
+        Composite complexity score of every sentence, in one vectorized pass
+        
+        Each score equals the composite_score analyze_document would give the
+        sentence on its own (0.0 for sentences without words). The same
+        formulas are evaluated column-wise over the per-sentence feature
+        totals, so no sentence is re-tokenized.
+        
+        Args:
+            doc: Tokenized document
+            
+        Returns:
+            Float array with one composite score per sentence (cached on doc)
+        """
+        if SENTENCE_SCORES_KEY in doc._cache:
+            return doc._cache[SENTENCE_SCORES_KEY]
+        
+        totals = ReadabilityFeatures.of(doc).sentence_totals().astype(np.float64)
+        token_count, word_count, syllable_count, letter_count, polysyllabic_count, complex_count = totals.T
+        
+        has_words = word_count > 0
+        words = np.where(has_words, word_count, 1.0)
+        tokens = np.where(token_count > 0, token_count, 1.0)
+        
+        # Every row is a single sentence
+        words_per_sentence = words
+        syllables_per_word = syllable_count / words
+        
+        fres = np.clip(206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 0.0, 100.0)
+        fkgl = np.maximum(0.0, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59)
+        fog = np.maximum(0.0, 0.4 * (words_per_sentence + (complex_count / words) * 100))
+        smog = np.maximum(0.0, np.sqrt(polysyllabic_count) + 3)
+        cli = np.maximum(0.0, 0.0588 * ((letter_count / tokens) * 100) - 0.296 * ((1 / tokens) * 100) - 15.8)
+        
+        composite = (
+            (100 - fres) +
+            np.minimum(100, (fkgl / 20) * 100) +
+            np.minimum(100, (fog / 20) * 100) +
+            np.minimum(100, (smog / 20) * 100) +
+            np.minimum(100, (cli / 20) * 100)
+        ) / 5
+        
+        scores = np.where(has_words, np.round(composite, 2), 0.0)
+        doc._cache[SENTENCE_SCORES_KEY] = scores
+        return scores
+    
     def _flesch_reading_ease(self, word_count: int, sentence_count: int, syllable_count: int) -> float:
         """
         Calculate Flesch Reading Ease Score
@@ -131,18 +293,26 @@ class ComplexityAnalyzer:
         
         return max(0.0, grade)
     
-    def _gunning_fog_index(self, text: str, words: list, sentences: list) -> float:
+    @staticmethod
+    def _complex_candidates(words: list) -> np.ndarray:
+        """
+        Words eligible to count as complex (see count_complex_words)
+        Skips proper nouns (capitalized), numbers, and very short words
+        """
+        return np.fromiter(
+            (not word[0].isupper() and word.isalpha() and len(word) > 3 for word in words),
+            dtype=bool,
+            count=len(words)
+        )
+    
+    def _gunning_fog_index(self, word_count: int, sentence_count: int, complex_count: int) -> float:
         """
         Calculate Gunning Fog Index
         Formula: 0.4 × [(words/sentences) + 100(complex_words/words)]
         """
-        if not words or not sentences:
+        if not word_count or not sentence_count:
             return 0.0
         
-        word_count = len(words)
-        sentence_count = len(sentences)
-        complex_count = count_complex_words(words)
-        
         words_per_sentence = word_count / sentence_count
         complex_ratio = (complex_count / word_count) * 100
         
@@ -150,32 +320,27 @@ class ComplexityAnalyzer:
         
         return max(0.0, fog)
     
-    def _smog_index(self, text: str, sentences: list) -> float:
+    def _smog_index(self, polysyllabic_count: int) -> float:
         """
         Calculate SMOG Index
         Formula: √(polysyllabic_word_count) + 3
         """
-        words = tokenize_words(text, lowercase=False, remove_punct=True)
-        
-        if not words:
-            return 0.0
-        
-        polysyllabic_count = count_polysyllabic_words(words)
-        
         smog = math.sqrt(polysyllabic_count) + 3
         
         return max(0.0, smog)
     
-    def _coleman_liau_index(self, text: str, words: list) -> float:
+    def _coleman_liau_index(self, letter_count: int, token_count: int, sentence_count: int) -> float:
         """
         Calculate Coleman-Liau Index
         Formula: 0.0588 × L - 0.296 × S - 15.8
         where L = letters per 100 words, S = sentences per 100 words
+        (words here are all tokens, punctuation included)
         """
-        if not words:
+        if not token_count:
             return 0.0
         
-        l, s = calculate_word_character_ratio(text)
+        l = (letter_count / token_count) * 100  # Letters per 100 words
+        s = (sentence_count / token_count) * 100  # Sentences per 100 words
         
         cli = 0.0588 * l - 0.296 * s - 15.8
         
@@ -208,36 +373,42 @@ class ComplexityAnalyzer:
                 return level
         return "Unknown"
     
-    def analyze_by_section(self, sections: Dict[str, str]) -> Dict[str, ComplexityScores]:
+    def analyze_by_section(
+        self,
+        sections: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, ComplexityScores]:
         """
         Analyze complexity for each section
         
         Args:
-            sections: Dict of section_name -> text
+            sections: Dict of section_name -> text or document view
             
         Returns:
             Dict of section_name -> ComplexityScores
         """
         return {
-            section_name: self.analyze(text)
+            section_name: self.analyze_document(as_document(text))
             for section_name, text in sections.items()
-            if text.strip()
+            if not is_blank(text)
         }
     
-    def analyze_by_speaker(self, speakers: Dict[str, str]) -> Dict[str, ComplexityScores]:
+    def analyze_by_speaker(
+        self,
+        speakers: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, ComplexityScores]:
         """
         Analyze complexity for each speaker
         
         Args:
-            speakers: Dict of speaker_name -> text
+            speakers: Dict of speaker_name -> text or document view
             
         Returns:
             Dict of speaker_name -> ComplexityScores
         """
         return {
-            speaker_name: self.analyze(text)
+            speaker_name: self.analyze_document(as_document(text))
             for speaker_name, text in speakers.items()
-            if text.strip()
+            if not is_blank(text)
         }
     
     def _empty_scores(self) -> ComplexityScores:
@@ -4,10 +4,11 @@
 Deception Risk Detector
 Comprehensive analysis of potential deception indicators in earnings calls
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
+import heapq
 import numpy as np
-from src.analysis.complexity.readability import ComplexityScores
+from src.analysis.complexity.readability import ComplexityAnalyzer, ComplexityScores
 from src.analysis.sentiment.hybrid_scorer import HybridSentimentScores
 from src.analysis.numerical.transparency import NumericalScores
 from src.core.transcript_processor import ProcessedTranscript
@@ -58,6 +59,9 @@ class DeceptionRiskScore:
 	complexity_hotspots: List[Tuple[str, float]]
 	numerical_red_flags: List[Dict]
 	
+	# Composite complexity score of every sentence, in transcript order
+	sentence_complexity: List[float] = field(default_factory=list)
+	
 	
 class DeceptionRiskAnalyzer:
 	"""Detects potential deception or obfuscation in earnings calls"""
@@ -65,6 +69,7 @@ class DeceptionRiskAnalyzer:
 	def __init__(self):
 		self.linguistic_analyzer = LinguisticDeceptionMarkers()
 		self.evasiveness_analyzer = EvasivenessAnalyzer()
+		self.complexity_analyzer = ComplexityAnalyzer()
 		
 	def analyze(
 		self,
@@ -110,7 +115,8 @@ class DeceptionRiskAnalyzer:
 		
 		# Find specific examples
 		evasive_qa = self._identify_evasive_questions(transcript)
-		complexity_hotspots = self._find_complexity_hotspots(transcript)
+		sentence_complexity = self.complexity_analyzer.sentence_scores(transcript.document)
+		complexity_hotspots = self._find_complexity_hotspots(transcript, sentence_complexity)
 		numerical_flags = self._flag_numerical_issues(transcript, numerical_scores)
 		
 		return DeceptionRiskScore(
@@ -122,7 +128,8 @@ class DeceptionRiskAnalyzer:
 			risk_components=risk_components,
 			most_evasive_questions=evasive_qa,
 			complexity_hotspots=complexity_hotspots,
-			numerical_red_flags=numerical_flags
+			numerical_red_flags=numerical_flags,
+			sentence_complexity=sentence_complexity.tolist()
 		)
 	
 	def _calculate_indicators(
@@ -135,17 +142,17 @@ class DeceptionRiskAnalyzer:
 	) -> DeceptionIndicators:
 		"""Calculate all individual deception indicators"""
 		
-		text = transcript.cleaned_text
+		doc = transcript.document
 		
 		# Linguistic indicators
-		hedging_score = self.linguistic_analyzer.calculate_hedging_density(text)
-		qualifier_density = self.linguistic_analyzer.calculate_qualifier_density(text)
+		hedging_score = self.linguistic_analyzer.calculate_hedging_density(doc)
+		qualifier_density = self.linguistic_analyzer.calculate_qualifier_density(doc)
 		modal_weakness = self.linguistic_analyzer.calculate_modal_weakness(
-			transcript.speakers, sentiment_scores.lexicon_scores
+			transcript.speaker_documents(), sentiment_scores.lexicon_scores
 		)
-		passive_ratio = self.linguistic_analyzer.detect_passive_voice(text)
+		passive_ratio = self.linguistic_analyzer.detect_passive_voice(doc)
 		
-		pronoun_analysis = self.linguistic_analyzer.analyze_pronoun_distancing(text)
+		pronoun_analysis = self.linguistic_analyzer.analyze_pronoun_distancing(doc)
 		pronoun_distancing = pronoun_analysis.get('distancing_score', 0.0)
 		
 		# Behavioral indicators (section comparison)
@@ -403,7 +410,7 @@ class DeceptionRiskAnalyzer:
 		confidence_factors = []
 		
 		# Q&A section present
-		if transcript.sections.get('qa'):
+		if transcript.sections.has_text('qa'):
 			confidence_factors.append(1.0)
 		else:
 			confidence_factors.append(0.5)
@@ -524,28 +531,30 @@ class DeceptionRiskAnalyzer:
 	
 	def _find_complexity_hotspots(
 		self, 
-		transcript: ProcessedTranscript
+		transcript: ProcessedTranscript,
+		sentence_complexity: Optional[np.ndarray] = None
 	) -> List[Tuple[str, float]]:
-		"""Find sentences/passages with unusually high complexity"""
-		from src.analysis.complexity.readability import ComplexityAnalyzer
+		"""
+		Find sentences/passages with unusually high complexity
 		
-		analyzer = ComplexityAnalyzer()
-		sentences = tokenize_sentences(transcript.cleaned_text)
+		Args:
+			transcript: Processed transcript
+			sentence_complexity: Per-sentence composite scores (computed if omitted)
+			
+		Returns:
+			Up to 5 (sentence, composite score) pairs, most complex first
+		"""
+		doc = transcript.document
+		if sentence_complexity is None:
+			sentence_complexity = self.complexity_analyzer.sentence_scores(doc)
 		
-		hotspots = []
+		# Very complex sentences of at least 10 tokens
+		token_counts = doc.sentence_token_counts(remove_punct=False)
+		candidates = np.flatnonzero((token_counts >= 10) & (sentence_complexity > 75))
 		
-		for sentence in sentences:
-			if len(tokenize_words(sentence, lowercase=False)) < 10:
-				continue  # Skip short sentences
-			
-			scores = analyzer.analyze(sentence)
-			
-			if scores.composite_score > 75:  # Very complex
-				hotspots.append((sentence, scores.composite_score))
-			
-		# Return top 5 most complex
-		hotspots.sort(key=lambda x: x[1], reverse=True)
-		return hotspots[:5]
+		top = heapq.nlargest(5, candidates.tolist(), key=lambda i: sentence_complexity[i])
+		sentences = doc.sentences
+		return [(sentences[i], float(sentence_complexity[i])) for i in top]
 	
 	def _flag_numerical_issues(
 		self, 
@@ -6,7 +6,7 @@ Measures evasiveness in earnings call language
 """
 from dataclasses import dataclass
 from typing import List, Tuple
-from src.utils.text_utils import tokenize_sentences, tokenize_words
+from src.core.tokenized_document import TokenizedDocument
 from src.analysis.deception.linguistic_markers import LinguisticDeceptionMarkers
 from config.settings import settings
 
@@ -45,16 +45,28 @@ class EvasivenessAnalyzer:
 		Args:
 			text: Input text
 			
+		Returns:
+			EvasivenessScores object
+		"""
+		return self.analyze_document(TokenizedDocument.from_text(text))
+	
+	def analyze_document(self, doc: TokenizedDocument) -> EvasivenessScores:
+		"""
+		Calculate evasiveness metrics for an already tokenized document
+		
+		Args:
+			doc: Tokenized document
+			
 		Returns:
 			EvasivenessScores object
 		"""
 		# Component calculations
-		qualifier_density = self.linguistic_markers.calculate_qualifier_density(text)
-		hedging_pct = self.linguistic_markers.calculate_hedging_density(text)
-		passive_pct = self.linguistic_markers.detect_passive_voice(text)
-		vague_pronoun_pct = self.linguistic_markers.calculate_vague_pronoun_usage(text)
+		qualifier_density = self.linguistic_markers.calculate_qualifier_density(doc)
+		hedging_pct = self.linguistic_markers.calculate_hedging_density(doc)
+		passive_pct = self.linguistic_markers.detect_passive_voice(doc)
+		vague_pronoun_pct = self.linguistic_markers.calculate_vague_pronoun_usage(doc)
 		
-		distancing_analysis = self.linguistic_markers.analyze_pronoun_distancing(text)
+		distancing_analysis = self.linguistic_markers.analyze_pronoun_distancing(doc)
 		distancing_score = distancing_analysis['distancing_score']
 		
 		# Composite evasiveness score
@@ -71,7 +83,7 @@ class EvasivenessAnalyzer:
 		level = self._determine_level(overall)
 		
 		# Find most evasive sentences
-		evasive_sentences = self._identify_evasive_sentences(text, top_n=5)
+		evasive_sentences = self._identify_evasive_sentences(doc, top_n=5)
 		
 		return EvasivenessScores(
 			overall_evasiveness=round(overall, 2),
@@ -107,45 +119,45 @@ class EvasivenessAnalyzer:
 		
 	def _identify_evasive_sentences(
 		self, 
-		text: str, 
+		doc: TokenizedDocument, 
 		top_n: int = 5
 	) -> List[Tuple[str, float]]:
 		"""
 		Identify most evasive sentences
 		
 		Args:
-			text: Input text
+			doc: Tokenized document
 			top_n: Number of sentences to return
 			
 		Returns:
 			List of (sentence, evasiveness_score) tuples
 		"""
-		sentences = tokenize_sentences(text)
+		token_counts = doc.sentence_token_counts(remove_punct=False)
 		scored_sentences = []
 		
-		for sentence in sentences:
-			if len(tokenize_words(sentence, lowercase=False)) < 5:
+		for i, sentence in enumerate(doc.sentences):
+			if token_counts[i] < 5:
 				continue  # Skip very short sentences
 			
-			score = self._score_sentence_evasiveness(sentence)
+			score = self._score_sentence_evasiveness(
+				doc.sentence_words(i, lowercase=True, remove_punct=True)
+			)
 			scored_sentences.append((sentence, score))
 			
 		# Sort by score and return top N
 		scored_sentences.sort(key=lambda x: x[1], reverse=True)
 		return scored_sentences[:top_n]
 	
-	def _score_sentence_evasiveness(self, sentence: str) -> float:
+	def _score_sentence_evasiveness(self, words: List[str]) -> float:
 		"""
 		Score a single sentence for evasiveness
 		
 		Args:
-			sentence: Sentence to score
+			words: Lowercased, punctuation-free words of the sentence
 			
 		Returns:
 			Evasiveness score (0-100)
 		"""
-		words = tokenize_words(sentence, lowercase=True, remove_punct=True)
-		
 		if not words:
 			return 0.0
 		
@@ -4,25 +4,17 @@
 Linguistic Deception Markers
 Detects linguistic patterns associated with deception and obfuscation
 """
-from typing import Dict, List, Set
+from typing import Dict, List, Mapping, Set, Union
 import re
-from src.utils.text_utils import tokenize_words, tokenize_sentences
+from src.utils.text_utils import tokenize_words
+from src.core.tokenized_document import TokenizedDocument, as_document
 from config.settings import settings
+from src.core.resources import get_spacy_docs
+
+# spaCy components passive voice detection does not use
+PASSIVE_VOICE_DISABLE = ('ner',)
+
 
-# Try to import spaCy for advanced passive voice detection
-try:
-	import spacy
-	SPACY_AVAILABLE = True
-	try:
-		nlp = spacy.load('en_core_web_sm')
-	except OSError:
-		SPACY_AVAILABLE = False
-		nlp = None
-except ImportError:
-	SPACY_AVAILABLE = False
-	nlp = None
-	
-	
 class LinguisticDeceptionMarkers:
 	"""Detects linguistic patterns associated with deception"""
 	
@@ -66,17 +58,41 @@ class LinguisticDeceptionMarkers:
 			'we', 'us', 'our', 'ours', 'ourselves'
 		}
 		
-	def calculate_hedging_density(self, text: str) -> float:
+	def analyze_document(self, doc: TokenizedDocument) -> Dict[str, float]:
+		"""
+		Calculate all text-level markers from one tokenized document
+		
+		Args:
+			doc: Tokenized document
+			
+		Returns:
+			Dict with hedging, qualifier, passive voice, vague pronoun,
+			distancing and specificity scores
+		"""
+		hedging = self.calculate_hedging_density(doc)
+		qualifiers = self.calculate_qualifier_density(doc)
+		vague_pronouns = self.calculate_vague_pronoun_usage(doc)
+		
+		return {
+			'hedging_density': hedging,
+			'qualifier_density': qualifiers,
+			'passive_voice_pct': self.detect_passive_voice(doc),
+			'vague_pronoun_pct': vague_pronouns,
+			'distancing_score': self.analyze_pronoun_distancing(doc)['distancing_score'],
+			'specificity_index': self._specificity_from_densities(hedging, qualifiers, vague_pronouns)
+		}
+	
+	def calculate_hedging_density(self, text: Union[str, TokenizedDocument]) -> float:
 		"""
 		Calculate percentage of hedging words
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Percentage of words that are hedging words (0-100)
 		"""
-		words = tokenize_words(text, lowercase=True, remove_punct=True)
+		words = as_document(text).words(lowercase=True, remove_punct=True)
 		
 		if not words:
 			return 0.0
@@ -85,18 +101,19 @@ class LinguisticDeceptionMarkers:
 		
 		return (hedge_count / len(words)) * 100
 	
-	def calculate_qualifier_density(self, text: str) -> float:
+	def calculate_qualifier_density(self, text: Union[str, TokenizedDocument]) -> float:
 		"""
 		Calculate percentage of qualifier words and phrases
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Percentage of words that are qualifiers (0-100)
 		"""
-		words = tokenize_words(text, lowercase=True, remove_punct=True)
-		text_lower = text.lower()
+		doc = as_document(text)
+		words = doc.words(lowercase=True, remove_punct=True)
+		text_lower = doc.text.lower()
 		
 		if not words:
 			return 0.0
@@ -113,7 +130,7 @@ class LinguisticDeceptionMarkers:
 	
 	def calculate_modal_weakness(
 		self, 
-		speakers: Dict[str, str],
+		speakers: Mapping[str, Union[str, TokenizedDocument]],
 		sentiment_scores = None
 	) -> float:
 		"""
@@ -122,19 +139,25 @@ class LinguisticDeceptionMarkers:
 		High ratio of weak to strong modals indicates uncertainty/hedging
 		
 		Args:
-			speakers: Dict of speaker -> text
+			speakers: Dict of speaker -> text or document view
 			sentiment_scores: Optional sentiment scores with modal counts
 			
 		Returns:
 			Modal weakness score (0-100)
 		"""
-		# Combine all speaker text
-		text = ' '.join(speakers.values()) if speakers else ''
-		
-		if not text:
-			return 0.0
-		
-		words = tokenize_words(text, lowercase=True, remove_punct=True)
+		if speakers and all(isinstance(view, TokenizedDocument) for view in speakers.values()):
+			# Document views already carry their tokens
+			if not any(view.token_count for view in speakers.values()):
+				return 0.0
+			words = [w for view in speakers.values() for w in view.words(lowercase=True, remove_punct=True)]
+		else:
+			# Combine all speaker text
+			text = ' '.join(speakers.values()) if speakers else ''
+			
+			if not text:
+				return 0.0
+			
+			words = tokenize_words(text, lowercase=True, remove_punct=True)
 		
 		strong_count = sum(1 for w in words if w in self.strong_modals)
 		weak_count = sum(1 for w in words if w in self.weak_modals)
@@ -149,26 +172,26 @@ class LinguisticDeceptionMarkers:
 		
 		return weakness_ratio * 100
 	
-	def detect_passive_voice(self, text: str) -> float:
+	def detect_passive_voice(self, text: Union[str, TokenizedDocument]) -> float:
 		"""
 		Detect passive voice constructions
 		
 		Passive voice can indicate distancing/evasion
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Percentage of verb phrases in passive voice (0-100)
 		"""
-		if SPACY_AVAILABLE and nlp:
-			return self._spacy_passive_detection(text)
+		if get_spacy_docs() is not None:
+			return self._spacy_passive_detection(text.text if isinstance(text, TokenizedDocument) else text)
 		else:
-			return self._simple_passive_detection(text)
+			return self._simple_passive_detection(as_document(text))
 		
 	def _spacy_passive_detection(self, text: str) -> float:
 		"""Use spaCy for accurate passive voice detection"""
-		doc = nlp(text)
+		doc = get_spacy_docs().get(text, disable=PASSIVE_VOICE_DISABLE)
 		
 		passive_count = 0
 		total_verbs = 0
@@ -192,9 +215,9 @@ class LinguisticDeceptionMarkers:
 					
 		return (passive_count / total_verbs * 100) if total_verbs > 0 else 0.0
 	
-	def _simple_passive_detection(self, text: str) -> float:
+	def _simple_passive_detection(self, doc: TokenizedDocument) -> float:
 		"""Simple rule-based passive voice detection (fallback)"""
-		sentences = tokenize_sentences(text)
+		sentences = doc.sentences
 		
 		if not sentences:
 			return 0.0
@@ -215,20 +238,21 @@ class LinguisticDeceptionMarkers:
 				
 		return (passive_count / len(sentences)) * 100
 	
-	def analyze_pronoun_distancing(self, text: str) -> Dict[str, float]:
+	def analyze_pronoun_distancing(self, text: Union[str, TokenizedDocument]) -> Dict[str, float]:
 		"""
 		Analyze pronoun usage patterns for distancing behavior
 		
 		Deception indicator: Using "the company" instead of "we/us/our"
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Dict with distancing metrics
 		"""
-		words = tokenize_words(text, lowercase=True, remove_punct=True)
-		text_lower = text.lower()
+		doc = as_document(text)
+		words = doc.words(lowercase=True, remove_punct=True)
+		text_lower = doc.text.lower()
 		
 		# Count inclusive pronouns
 		inclusive_count = sum(1 for w in words if w in self.inclusive_pronouns)
@@ -259,19 +283,19 @@ class LinguisticDeceptionMarkers:
 			'distancing_count': distancing_count
 		}
 	
-	def calculate_vague_pronoun_usage(self, text: str) -> float:
+	def calculate_vague_pronoun_usage(self, text: Union[str, TokenizedDocument]) -> float:
 		"""
 		Calculate usage of vague pronouns (it, that, thing, etc.)
 		
 		High usage can indicate lack of specificity
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Percentage of vague pronouns (0-100)
 		"""
-		words = tokenize_words(text, lowercase=True, remove_punct=True)
+		words = as_document(text).words(lowercase=True, remove_punct=True)
 		
 		if not words:
 			return 0.0
@@ -320,7 +344,7 @@ class LinguisticDeceptionMarkers:
 				
 		return found_euphemisms
 	
-	def calculate_specificity_index(self, text: str) -> float:
+	def calculate_specificity_index(self, text: Union[str, TokenizedDocument]) -> float:
 		"""
 		Calculate overall linguistic specificity
 		
@@ -328,16 +352,21 @@ class LinguisticDeceptionMarkers:
 		Low specificity = vague, abstract language
 		
 		Args:
-			text: Input text
+			text: Input text or tokenized document
 			
 		Returns:
 			Specificity score (0-100, higher = more specific)
 		"""
 		# Inverse of hedging + qualifiers + vague pronouns
-		hedging = self.calculate_hedging_density(text)
-		qualifiers = self.calculate_qualifier_density(text)
-		vague_pronouns = self.calculate_vague_pronoun_usage(text)
+		doc = as_document(text)
+		hedging = self.calculate_hedging_density(doc)
+		qualifiers = self.calculate_qualifier_density(doc)
+		vague_pronouns = self.calculate_vague_pronoun_usage(doc)
 		
+		return self._specificity_from_densities(hedging, qualifiers, vague_pronouns)
+	
+	def _specificity_from_densities(self, hedging: float, qualifiers: float, vague_pronouns: float) -> float:
+		"""Invert combined vagueness densities into a specificity score"""
 		# Combined vagueness
 		vagueness = (hedging + qualifiers + vague_pronouns) / 3
 		
@@ -7,25 +7,15 @@ Analyzes analyst questions vs management responses to detect evasion
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 import re
-import json
 from src.utils.text_utils import tokenize_sentences, tokenize_words
-from src.models.ollama_client import ollama_client
-from config.settings import settings
+from src.core.resources import get_ollama_client, get_spacy_docs
+from src.models.async_ollama_client import AsyncOllamaClient
+
+# spaCy components topic extraction does not use (entities and noun chunks
+# need ner, tagger and parser)
+TOPIC_EXTRACTION_DISABLE = ('lemmatizer',)
+
 
-# Try to use spaCy for better topic extraction
-try:
-	import spacy
-	SPACY_AVAILABLE = True
-	try:
-		nlp = spacy.load('en_core_web_sm')
-	except OSError:
-		SPACY_AVAILABLE = False
-		nlp = None
-except ImportError:
-	SPACY_AVAILABLE = False
-	nlp = None
-	
-	
 @dataclass
 class QuestionResponse:
 	"""Represents a Q&A pair"""
@@ -62,8 +52,22 @@ class QuestionEvasionDetector:
 		qa_pairs = self._extract_qa_pairs(qa_text)
 		analyzed_pairs = []
 		
-		for question, response, analyst, responder in qa_pairs:
-			analysis = self._analyze_pair(question, response)
+		# Parse every question and response in one batch
+		docs = get_spacy_docs()
+		if docs is not None and qa_pairs:
+			docs.pipe(
+				[text for pair in qa_pairs for text in pair[:2]],
+				disable=TOPIC_EXTRACTION_DISABLE
+			)
+		
+		# Score the relevance of every pair concurrently
+		if self.use_llm:
+			relevances = self._llm_relevance_scores([pair[:2] for pair in qa_pairs])
+		else:
+			relevances = [None] * len(qa_pairs)
+		
+		for (question, response, analyst, responder), relevance in zip(qa_pairs, relevances):
+			analysis = self._analyze_pair(question, response, relevance)
 			
 			analyzed_pairs.append(QuestionResponse(
 				question=question,
@@ -130,13 +134,14 @@ class QuestionEvasionDetector:
 				
 		return pairs
 	
-	def _analyze_pair(self, question: str, response: str) -> Dict:
+	def _analyze_pair(self, question: str, response: str, relevance: Optional[float] = None) -> Dict:
 		"""
 		Analyze a single Q&A pair for evasion
 		
 		Args:
 			question: Analyst question
 			response: Management response
+			relevance: LLM relevance score, if already computed
 			
 		Returns:
 			Dict with analysis results
@@ -169,12 +174,13 @@ class QuestionEvasionDetector:
 		else:
 			evasion_type = max(evasion_signals, key=evasion_signals.get)
 			
-		# Use LLM for relevance scoring if available
-		if self.use_llm:
-			relevance = self._llm_relevance_score(question, response)
-		else:
-			# Fallback: use topic overlap as proxy
-			relevance = overlap
+		# Use LLM for relevance scoring if available (unless already scored)
+		if relevance is None:
+			if self.use_llm:
+				relevance = self._llm_relevance_score(question, response)
+			else:
+				# Fallback: use topic overlap as proxy
+				relevance = overlap
 			
 		return {
 			'relevance': relevance,
@@ -195,14 +201,14 @@ class QuestionEvasionDetector:
 		Returns:
 			List of topic keywords
 		"""
-		if SPACY_AVAILABLE and nlp:
+		if get_spacy_docs() is not None:
 			return self._spacy_topic_extraction(text)
 		else:
 			return self._simple_topic_extraction(text)
 		
 	def _spacy_topic_extraction(self, text: str) -> List[str]:
 		"""Use spaCy for topic extraction"""
-		doc = nlp(text)
+		doc = get_spacy_docs().get(text, disable=TOPIC_EXTRACTION_DISABLE)
 		
 		topics = []
 		
@@ -342,47 +348,37 @@ class QuestionEvasionDetector:
 		Returns:
 			Relevance score (0-1)
 		"""
-		system_prompt = """You are an expert analyst evaluating earnings call Q&A sessions.
-Your task is to determine how well a management response addresses an analyst's question."""
-		
-		user_prompt = f"""Rate how well this response addresses the analyst's question.
-
-Question: "{question}"
-
-Response: "{response}"
-
-Evaluate:
-1. Does the response directly address the core question?
-2. Are specific details provided?
-3. Is there deflection or topic changing?
-
-Score from 0.0 (completely evasive/non-responsive) to 1.0 (directly and thoroughly addresses all aspects).
-
-Respond ONLY with valid JSON in this exact format:
-{{
-	"relevance_score": 0.75,
-	"addresses_question": true,
-	"reasoning": "Response provides specific details but deflects slightly"
-}}"""
-		
 		try:
-			result = ollama_client.generate(
-				model=settings.SENTIMENT_MODEL,
-				prompt=user_prompt,
-				system_prompt=system_prompt,
-				json_mode=True,
-				temperature=0.1
-			)
-			
-			parsed = json.loads(result)
-			return parsed.get('relevance_score', 0.5)
-		
+			return get_ollama_client().score_relevance(question, response)
 		except Exception as e:
-			print(f"Warning: LLM relevance scoring failed: {e}")
-			# Fallback to topic overlap
-			question_topics = self._extract_topics(question)
-			response_topics = self._extract_topics(response)
-			return self._calculate_topic_overlap(question_topics, response_topics)
+			return self._relevance_fallback(question, response, e)
+	
+	def _llm_relevance_scores(self, pairs: List[Tuple[str, str]]) -> List[float]:
+		"""
+		LLM relevance scores of many Q&A pairs, requested concurrently
+		
+		Args:
+			pairs: (question, response) tuples
+			
+		Returns:
+			Relevance score (0-1) of each pair, in order
+		"""
+		client = AsyncOllamaClient.for_client(get_ollama_client())
+		results = client.run_all(
+			(client.score_relevance(question, response) for question, response in pairs),
+			return_exceptions=True
+		)
+		return [
+			self._relevance_fallback(question, response, result) if isinstance(result, Exception) else result
+			for (question, response), result in zip(pairs, results)
+		]
+	
+	def _relevance_fallback(self, question: str, response: str, error: Exception) -> float:
+		"""Topic overlap as relevance when LLM scoring failed"""
+		print(f"Warning: LLM relevance scoring failed: {error}")
+		question_topics = self._extract_topics(question)
+		response_topics = self._extract_topics(response)
+		return self._calculate_topic_overlap(question_topics, response_topics)
 		
 	def calculate_overall_evasion_rate(
 		self, 
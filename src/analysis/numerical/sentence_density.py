@@ -5,11 +5,20 @@ Analyzes numeric content density at the sentence level to identify:
 - Proportion of numerically dense sentences per transcript
 - Distribution patterns (where numerics cluster)
 - Informativeness metrics based on numeric content
+
+SentenceDensityAccumulator computes the same sentence metrics incrementally
+for transcripts that are still arriving.
 """
-from dataclasses import dataclass
-from typing import List, Tuple, Dict
+import bisect
+import heapq
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Iterable, Mapping, Optional, Sequence, Union
 import numpy as np
-from src.utils.text_utils import tokenize_sentences, tokenize_words, extract_numerical_tokens
+from config.settings import settings
+from src.core.tokenized_document import TokenizedDocument, as_document, is_blank
+
+# TokenizedDocument._cache key for the per-sentence density vector
+DENSITY_KEY = 'sentence_density'
 
 
 @dataclass
@@ -73,6 +82,9 @@ class DistributionPattern:
 	density_variance_ratio: float  # std/mean, measures consistency
 	coefficient_of_variation: float  # Normalized variance
 
+	# Clusters at additional window sizes (DENSITY_CLUSTER_SCALES)
+	multiscale_clusters: Dict[int, List[Tuple[int, int]]] = field(default_factory=dict)
+
 
 @dataclass
 class InformativenessMetrics:
@@ -116,9 +128,22 @@ class SentenceLevelDensityAnalyzer:
 	CLUSTER_WINDOW_SIZE = 5  # sentences
 	CLUSTER_DENSITY_THRESHOLD = 12.0  # % to be considered cluster
 
-	def __init__(self):
-		"""Initialize sentence-level density analyzer"""
-		pass
+	def __init__(self, cluster_window_size: Optional[int] = None, cluster_scales: Optional[Sequence[int]] = None):
+		"""
+		Initialize sentence-level density analyzer
+
+		Args:
+			cluster_window_size: Rolling window (sentences) for cluster detection
+				(default: settings.DENSITY_CLUSTER_WINDOW)
+			cluster_scales: Extra window sizes reported in
+				DistributionPattern.multiscale_clusters (default: settings.DENSITY_CLUSTER_SCALES)
+		"""
+		self.cluster_window_size = cluster_window_size or getattr(
+			settings, 'DENSITY_CLUSTER_WINDOW', self.CLUSTER_WINDOW_SIZE
+		)
+		if cluster_scales is None:
+			cluster_scales = getattr(settings, 'DENSITY_CLUSTER_SCALES', ())
+		self.cluster_scales = tuple(cluster_scales)
 
 	def analyze_sentence_density(self, text: str) -> SentenceDensityMetrics:
 		"""
@@ -130,60 +155,54 @@ class SentenceLevelDensityAnalyzer:
 		Returns:
 			SentenceDensityMetrics with detailed sentence-level analysis
 		"""
-		sentences = tokenize_sentences(text)
+		return self.analyze_document(TokenizedDocument.from_text(text))
+
+	def analyze_document(self, doc: TokenizedDocument) -> SentenceDensityMetrics:
+		"""
+		Analyze numeric density at sentence level for an already tokenized document
+
+		Args:
+			doc: Tokenized document
+
+		Returns:
+			SentenceDensityMetrics with detailed sentence-level analysis
+		"""
+		sentences = doc.sentences
 
 		if not sentences:
 			return self._empty_sentence_metrics()
 
-		# Calculate density for each sentence
-		densities = []
-		sentence_classifications = {
-			'dense': 0,
-			'moderate': 0,
-			'sparse': 0,
-			'narrative': 0
-		}
+		# Density of every sentence, computed once per document
+		densities = self.sentence_densities(doc)
 
-		for sentence in sentences:
-			density = self._calculate_sentence_density(sentence)
-			densities.append((sentence, density))
-
-			# Classify sentence
-			if density >= self.DENSE_THRESHOLD:
-				sentence_classifications['dense'] += 1
-			elif density >= self.MODERATE_THRESHOLD:
-				sentence_classifications['moderate'] += 1
-			elif density >= self.SPARSE_THRESHOLD:
-				sentence_classifications['sparse'] += 1
-			else:
-				sentence_classifications['narrative'] += 1
-
-		# Extract density values for statistics
-		density_values = [d for _, d in densities]
+		# Classify sentences by density
+		dense = int(np.count_nonzero(densities >= self.DENSE_THRESHOLD))
+		moderate = int(np.count_nonzero(densities >= self.MODERATE_THRESHOLD)) - dense
+		sparse = int(np.count_nonzero(densities >= self.SPARSE_THRESHOLD)) - dense - moderate
+		narrative = len(densities) - dense - moderate - sparse
 
 		# Calculate statistics
-		mean_density = np.mean(density_values)
-		median_density = np.median(density_values)
-		std_density = np.std(density_values)
-		max_density = np.max(density_values)
-		min_density = np.min(density_values)
-		p25 = np.percentile(density_values, 25)
-		p75 = np.percentile(density_values, 75)
+		mean_density = np.mean(densities)
+		median_density = np.median(densities)
+		std_density = np.std(densities)
+		max_density = np.max(densities)
+		min_density = np.min(densities)
+		p25, p75 = np.percentile(densities, [25, 75])
 
 		# Proportion metrics
 		total = len(sentences)
-		prop_dense = sentence_classifications['dense'] / total
-		prop_narrative = sentence_classifications['narrative'] / total
+		prop_dense = dense / total
+		prop_narrative = narrative / total
 
 		# Top dense sentences
-		top_dense = sorted(densities, key=lambda x: x[1], reverse=True)[:10]
+		top_dense = [(sentences[i], densities[i].item()) for i in self._top_indices(densities, 10)]
 
 		return SentenceDensityMetrics(
 			total_sentences=total,
-			numeric_dense_sentences=sentence_classifications['dense'],
-			numeric_moderate_sentences=sentence_classifications['moderate'],
-			numeric_sparse_sentences=sentence_classifications['sparse'],
-			narrative_sentences=sentence_classifications['narrative'],
+			numeric_dense_sentences=dense,
+			numeric_moderate_sentences=moderate,
+			numeric_sparse_sentences=sparse,
+			narrative_sentences=narrative,
 			mean_numeric_density=mean_density,
 			median_numeric_density=median_density,
 			std_numeric_density=std_density,
@@ -194,27 +213,27 @@ class SentenceLevelDensityAnalyzer:
 			proportion_numeric_dense=prop_dense,
 			proportion_narrative=prop_narrative,
 			top_dense_sentences=top_dense,
-			density_by_position=density_values
+			density_by_position=densities.tolist()
 		)
 
 	def analyze_distribution_patterns(
 		self,
 		sentence_metrics: SentenceDensityMetrics,
-		sections: Dict[str, str] = None,
-		speakers: Dict[str, str] = None
+		sections: Mapping[str, Union[str, TokenizedDocument]] = None,
+		speakers: Mapping[str, Union[str, TokenizedDocument]] = None
 	) -> DistributionPattern:
 		"""
 		Analyze distribution patterns of numeric density
 
 		Args:
 			sentence_metrics: Output from analyze_sentence_density
-			sections: Optional dict of section_name -> text
-			speakers: Optional dict of speaker_name -> text
+			sections: Optional dict of section_name -> text or document view
+			speakers: Optional dict of speaker_name -> text or document view
 
 		Returns:
 			DistributionPattern analysis
 		"""
-		densities = sentence_metrics.density_by_position
+		densities = np.asarray(sentence_metrics.density_by_position, dtype=float)
 		total = len(densities)
 
 		# Positional analysis (beginning/middle/end)
@@ -230,38 +249,44 @@ class SentenceLevelDensityAnalyzer:
 			beginning_density, middle_density, end_density, densities
 		)
 
-		# Identify clusters using rolling window
-		clusters, cluster_densities = self._identify_clusters(densities)
+		# Identify clusters using rolling windows (all scales share one cumulative sum)
+		scales = self.identify_clusters_multiscale(
+			densities, (self.cluster_window_size,) + self.cluster_scales
+		)
+		clusters, cluster_densities = scales[self.cluster_window_size]
+		multiscale_clusters = {size: scales[size][0] for size in self.cluster_scales}
 
 		# Q&A analysis (if sections available)
 		question_density = 0.0
 		answer_density = 0.0
 		qa_differential = 0.0
 
-		if sections and 'Q&A' in sections:
-			# Simplified - would need more sophisticated Q&A parsing
-			qa_text = sections.get('Q&A', sections.get('Questions and Answers', ''))
-			if qa_text:
-				qa_sentences = tokenize_sentences(qa_text)
-				# Rough heuristic: questions have '?' and are typically lower density
-				questions = [s for s in qa_sentences if '?' in s]
-				answers = [s for s in qa_sentences if '?' not in s]
+		qa_text = None
+		if sections:
+			qa_text = next(
+				(sections[key] for key in ('qa', 'Q&A', 'Questions and Answers') if key in sections),
+				None
+			)
 
-				if questions:
-					question_density = np.mean([self._calculate_sentence_density(q) for q in questions])
-				if answers:
-					answer_density = np.mean([self._calculate_sentence_density(a) for a in answers])
+		if qa_text is not None and not is_blank(qa_text):
+			qa_doc = as_document(qa_text)
+			# Rough heuristic: questions have '?' and are typically lower density
+			is_question = np.array(['?' in s for s in qa_doc.sentences], dtype=bool)
 
-				qa_differential = answer_density - question_density
+			if is_question.any():
+				question_density = self._masked_mean(qa_doc, is_question)
+			if (~is_question).any():
+				answer_density = self._masked_mean(qa_doc, ~is_question)
+
+			qa_differential = answer_density - question_density
 
 		# Speaker analysis
 		speaker_densities = {}
 		if speakers:
 			for speaker, text in speakers.items():
-				speaker_sentences = tokenize_sentences(text)
-				if speaker_sentences:
-					densities_list = [self._calculate_sentence_density(s) for s in speaker_sentences]
-					speaker_densities[speaker] = np.mean(densities_list)
+				speaker_doc = as_document(text)
+				if speaker_doc.sentence_count:
+					speaker_densities[speaker] = self._masked_mean(speaker_doc)
 
 		# Variance analysis
 		mean_density = sentence_metrics.mean_numeric_density
@@ -283,7 +308,8 @@ class SentenceLevelDensityAnalyzer:
 			qa_density_differential=qa_differential,
 			speaker_densities=speaker_densities,
 			density_variance_ratio=variance_ratio,
-			coefficient_of_variation=cv
+			coefficient_of_variation=cv,
+			multiscale_clusters=multiscale_clusters
 		)
 
 	def calculate_informativeness(
@@ -403,17 +429,107 @@ class SentenceLevelDensityAnalyzer:
 		"""
 		Calculate numeric density for a single sentence
 
+		Counts words and numbers the same way as sentence_densities: word
+		tokens of the sentence, and mentions from scan_numeric_mentions over
+		its sentence spans.
+
 		Returns:
 			Percentage of words that are numbers (0-100)
 		"""
-		words = tokenize_words(sentence, lowercase=False, remove_punct=True)
-		if not words:
-			return 0.0
+		doc = TokenizedDocument.from_text(sentence)
+		return self._density_from_counts(len(doc.numeric_index.mentions), doc.word_count)
+
+	def sentence_densities(self, doc: TokenizedDocument) -> np.ndarray:
+		"""
+		Numeric density of every sentence of a document (0 for empty sentences)
+
+		Computed once per document and cached on it; section and speaker
+		views count numbers from their parent's numeric index.
+		analyze_distribution_patterns reduces the parent's vector with a
+		mask instead wherever a view holds whole sentences.
 
-		numbers = extract_numerical_tokens(sentence)
-		density = (len(numbers) / len(words)) * 100
+		Returns:
+			Array of percentages (0-100), one per sentence
+		"""
+		if DENSITY_KEY not in doc._cache:
+			word_counts = doc.sentence_token_counts(remove_punct=True)
+			number_counts = doc.numeric_index.counts_per_sentence()
+
+			densities = np.zeros(len(word_counts), dtype=float)
+			nonempty = word_counts > 0
+			densities[nonempty] = number_counts[nonempty] / word_counts[nonempty] * 100
+			doc._cache[DENSITY_KEY] = densities
+		return doc._cache[DENSITY_KEY]
+
+	@staticmethod
+	def _parent_sentence_ids(view: TokenizedDocument) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Index in the parent document of every sentence of a range view
+
+		Returns:
+			(parent sentence index per view sentence, True where the view
+			holds that sentence whole rather than clipped by a range
+			boundary, e.g. a turn starting mid-sentence after its label)
+		"""
+		parent = view.parent
+		ids = np.searchsorted(parent.sentence_spans[:, 0], view.sentence_spans[:, 0], side='right') - 1
+		ids = np.maximum(ids, 0)
+		whole = (parent.sentence_spans[ids] == view.sentence_spans).all(axis=1)
+		return ids, whole
+
+	def _masked_mean(self, doc: TokenizedDocument, selected: Optional[np.ndarray] = None) -> float:
+		"""
+		Mean density of a document's sentences (those flagged in selected)
+
+		For a range view, sentences it holds whole are reduced with a
+		boolean mask over the parent's density vector, aligned by parent
+		sentence index; only sentences clipped by a range boundary get
+		their own density, since it differs from the whole sentence's.
+
+		Args:
+			doc: Document or range view
+			selected: Boolean mask over doc's sentences (default: all)
+
+		Returns:
+			Mean density of the selected sentences
+		"""
+		if selected is None:
+			selected = np.ones(doc.sentence_count, dtype=bool)
+		if doc.parent is None:
+			return float(np.mean(self.sentence_densities(doc)[selected]))
+
+		ids, whole = self._parent_sentence_ids(doc)
+		densities = self.sentence_densities(doc.parent)
+		mask = np.zeros(len(densities), dtype=bool)
+		mask[ids[selected & whole]] = True
+		total = densities[mask].sum() + sum(
+			self._calculate_sentence_density(doc.sentences[i])
+			for i in np.flatnonzero(selected & ~whole).tolist()
+		)
+		return float(total / selected.sum())
+
+	@staticmethod
+	def _top_indices(values: np.ndarray, k: int) -> List[int]:
+		"""
+		Indices of the k largest values, largest first (ties keep sentence order)
+
+		Same order as a stable descending sort, selected with argpartition.
+		"""
+		if len(values) <= k:
+			return np.lexsort((np.arange(len(values)), -values)).tolist()
+
+		kth = values[np.argpartition(-values, k - 1)[k - 1]]
+		above = np.flatnonzero(values > kth)
+		tied = np.flatnonzero(values == kth)[:k - len(above)]
+		chosen = np.concatenate([above, tied])
+		return chosen[np.lexsort((chosen, -values[chosen]))].tolist()
+
+	def _density_from_counts(self, number_count: int, word_count: int) -> float:
+		"""Percentage of words that are numbers (0 for empty sentences)"""
+		if not word_count:
+			return 0.0
 
-		return density
+		return (number_count / word_count) * 100
 
 	def _classify_pattern(
 		self,
@@ -463,49 +579,80 @@ class SentenceLevelDensityAnalyzer:
 
 	def _identify_clusters(
 		self,
-		densities: List[float]
+		densities: Union[List[float], np.ndarray],
+		window_size: Optional[int] = None
 	) -> Tuple[List[Tuple[int, int]], List[float]]:
 		"""
 		Identify high-density clusters using rolling window
 
+		Args:
+			densities: Density of each sentence, in order
+			window_size: Window in sentences (default: cluster_window_size)
+
 		Returns:
 			(cluster_positions, cluster_densities)
 		"""
-		clusters = []
-		cluster_densities = []
-
-		if len(densities) < self.CLUSTER_WINDOW_SIZE:
-			return clusters, cluster_densities
-
-		# Rolling window approach
-		window_size = self.CLUSTER_WINDOW_SIZE
-		in_cluster = False
-		cluster_start = 0
-
-		for i in range(len(densities) - window_size + 1):
-			window = densities[i:i + window_size]
-			window_avg = np.mean(window)
-
-			if window_avg >= self.CLUSTER_DENSITY_THRESHOLD:
-				if not in_cluster:
-					# Start new cluster
-					cluster_start = i
-					in_cluster = True
-			else:
-				if in_cluster:
-					# End cluster
-					cluster_end = i - 1 + window_size
-					clusters.append((cluster_start, cluster_end))
-					cluster_density = np.mean(densities[cluster_start:cluster_end])
-					cluster_densities.append(cluster_density)
-					in_cluster = False
+		window_size = window_size or self.cluster_window_size
+		return self.identify_clusters_multiscale(densities, (window_size,))[window_size]
 
-		# Handle cluster extending to end
-		if in_cluster:
-			clusters.append((cluster_start, len(densities) - 1))
-			cluster_densities.append(np.mean(densities[cluster_start:]))
+	def identify_clusters_multiscale(
+		self,
+		densities: Union[List[float], np.ndarray],
+		window_sizes: Sequence[int]
+	) -> Dict[int, Tuple[List[Tuple[int, int]], List[float]]]:
+		"""
+		Identify high-density clusters at several window sizes in one pass
+
+		A cluster is a run of consecutive windows whose average density
+		reaches CLUSTER_DENSITY_THRESHOLD, spanning from the first window's
+		start to the last window's end. Window averages for every size come
+		from one cumulative sum; averages within rounding distance of the
+		threshold are recomputed directly, so the result does not depend on
+		summation order.
+
+		Args:
+			densities: Density of each sentence, in order
+			window_sizes: Window sizes in sentences
+
+		Returns:
+			Dict of window_size -> (cluster_positions, cluster_densities)
+		"""
+		densities = np.asarray(densities, dtype=float)
+		n = len(densities)
+		threshold = self.CLUSTER_DENSITY_THRESHOLD
+		cumulative = np.concatenate(([0.0], np.cumsum(densities)))
+		tolerance = 1e-9 * max(1.0, float(cumulative[-1]))
+
+		results = {}
+		for window_size in dict.fromkeys(window_sizes):
+			clusters = []
+			cluster_densities = []
+			results[window_size] = (clusters, cluster_densities)
+
+			if window_size < 1 or n < window_size:
+				continue
+
+			window_sums = cumulative[window_size:] - cumulative[:-window_size]
+			above = window_sums >= threshold * window_size
+			for i in np.flatnonzero(np.abs(window_sums - threshold * window_size) <= tolerance).tolist():
+				above[i] = np.mean(densities[i:i + window_size]) >= threshold
+
+			# Runs of qualifying windows [start, stop)
+			edges = np.diff(np.concatenate(([0], above.astype(np.int8), [0])))
+			run_starts = np.flatnonzero(edges == 1).tolist()
+			run_stops = np.flatnonzero(edges == -1).tolist()
+
+			for cluster_start, stop in zip(run_starts, run_stops):
+				if stop < len(above):
+					cluster_end = stop - 1 + window_size
+					clusters.append((cluster_start, cluster_end))
+					cluster_densities.append(np.mean(densities[cluster_start:cluster_end]))
+				else:
+					# Cluster extends to the end
+					clusters.append((cluster_start, n - 1))
+					cluster_densities.append(np.mean(densities[cluster_start:]))
 
-		return clusters, cluster_densities
+		return results
 
 	def _classify_transparency_tier(self, score: float) -> str:
 		"""Classify transparency tier based on score"""
@@ -605,3 +752,239 @@ class SentenceLevelDensityAnalyzer:
 		empty = "░" * (max_width - width)
 
 		return f"[{bar}{empty}]"
+
+
+class StreamingQuantiles:
+	"""
+	Quantiles of a bounded stream from a fixed-resolution histogram
+
+	Values are counted into bins of width ``resolution`` over [low, high];
+	each bin also keeps the smallest and largest value it has seen. Values
+	outside [low, high] are kept exactly in sorted lists (densities pass
+	100% only when numbers outnumber words, e.g. "$5.5 and $6.6"). Quantiles
+	use the same linear interpolation between order statistics as
+	np.percentile, with an order statistic inside a bin interpolated
+	between the bin's min and max. The result is exact whenever the order
+	statistics involved are out-of-range values or fall in bins holding a
+	single distinct value, and never off by more than ``resolution``
+	otherwise. Memory and the cost of a query are fixed by the number of
+	bins plus the out-of-range values, not the stream length.
+	"""
+
+	def __init__(self, low: float = 0.0, high: float = 100.0, resolution: float = 0.05):
+		"""
+		Args:
+			low: Lower end of the expected value range
+			high: Upper end of the expected value range
+			resolution: Bin width (the worst-case quantile error)
+		"""
+		self.low = low
+		self.high = high
+		self.resolution = resolution
+		self.bins = int(np.ceil((high - low) / resolution)) + 1
+		self.count = 0
+		self._counts = np.zeros(self.bins, dtype=np.int64)
+		self._mins = np.full(self.bins, np.inf)
+		self._maxs = np.full(self.bins, -np.inf)
+		self._below: List[float] = []
+		self._above: List[float] = []
+
+	def add(self, value: float):
+		"""Add one observation"""
+		self.count += 1
+		if value < self.low:
+			bisect.insort(self._below, value)
+			return
+		if value > self.high:
+			bisect.insort(self._above, value)
+			return
+
+		index = min(int((value - self.low) / self.resolution), self.bins - 1)
+		self._counts[index] += 1
+		if value < self._mins[index]:
+			self._mins[index] = value
+		if value > self._maxs[index]:
+			self._maxs[index] = value
+
+	def quantiles(self, qs: Sequence[float]) -> List[float]:
+		"""
+		Estimates of several quantiles (0-1) at once
+
+		Returns:
+			One value per quantile (0.0 for an empty stream)
+		"""
+		if not self.count:
+			return [0.0 for _ in qs]
+
+		cumulative = np.cumsum(self._counts)
+		below = len(self._below)
+		binned = int(cumulative[-1])
+
+		def order_statistic(rank: int) -> float:
+			if rank < below:
+				return self._below[rank]
+			rank -= below
+			if rank >= binned:
+				return self._above[rank - binned]
+			index = int(np.searchsorted(cumulative, rank, side='right'))
+			in_bin = self._counts[index]
+			offset = rank - (cumulative[index - 1] if index else 0)
+			low, high = self._mins[index], self._maxs[index]
+			if in_bin == 1 or low == high:
+				return float(low)
+			return float(low + (high - low) * offset / (in_bin - 1))
+
+		results = []
+		for q in qs:
+			position = (self.count - 1) * q
+			lower = int(np.floor(position))
+			value = order_statistic(lower)
+			if position > lower:
+				value += (position - lower) * (order_statistic(lower + 1) - value)
+			results.append(value)
+		return results
+
+class SentenceDensityAccumulator:
+	"""
+	Incremental sentence-level density statistics for transcripts that are
+	still arriving (e.g. live calls)
+
+	Sentences are appended one at a time; snapshot() returns the
+	SentenceDensityMetrics of everything seen so far without revisiting
+	earlier sentences. Compared with analyze_document on the same sentences:
+
+	- class counts, proportions, min, max and the top dense sentences are exact
+	- mean and standard deviation use Welford's update and agree to floating
+	  point rounding (relative error below 1e-9)
+	- median and the 25th/75th percentiles come from a StreamingQuantiles
+	  histogram and are within QUANTILE_TOLERANCE density percentage points
+	  (exact when the neighbouring densities are identical, as they are for
+	  the many number-free sentences of a call)
+	"""
+
+	# Histogram bin width, and so the worst-case percentile error (percentage points)
+	QUANTILE_TOLERANCE = 0.05
+
+	def __init__(self, top_k: int = 10, keep_positions: bool = False):
+		"""
+		Initialize accumulator
+
+		Args:
+			top_k: Number of densest sentences kept
+			keep_positions: Also keep every density in order, for
+				density_by_position (snapshot then copies the list, O(n))
+		"""
+		self.analyzer = SentenceLevelDensityAnalyzer()
+		self.top_k = top_k
+		self.keep_positions = keep_positions
+
+		self.count = 0
+		self.class_counts = {'dense': 0, 'moderate': 0, 'sparse': 0, 'narrative': 0}
+		self.minimum = float('inf')
+		self.maximum = float('-inf')
+		self._mean = 0.0
+		self._m2 = 0.0
+		self._quantiles = StreamingQuantiles(resolution=self.QUANTILE_TOLERANCE)
+
+		# Min-heap of (density, -position, sentence): the root is the weakest
+		# of the kept sentences (lowest density, latest among equals)
+		self._top: List[Tuple[float, int, str]] = []
+		self._positions: List[float] = []
+
+	def add(self, sentence: str, density: Optional[float] = None):
+		"""
+		Append one sentence
+
+		Args:
+			sentence: Sentence text
+			density: Its numeric density if already known (computed otherwise)
+		"""
+		if density is None:
+			density = self.analyzer._calculate_sentence_density(sentence)
+		density = float(density)
+
+		self.count += 1
+		if density >= self.analyzer.DENSE_THRESHOLD:
+			self.class_counts['dense'] += 1
+		elif density >= self.analyzer.MODERATE_THRESHOLD:
+			self.class_counts['moderate'] += 1
+		elif density >= self.analyzer.SPARSE_THRESHOLD:
+			self.class_counts['sparse'] += 1
+		else:
+			self.class_counts['narrative'] += 1
+
+		self.minimum = min(self.minimum, density)
+		self.maximum = max(self.maximum, density)
+
+		# Welford's online mean and variance
+		delta = density - self._mean
+		self._mean += delta / self.count
+		self._m2 += delta * (density - self._mean)
+
+		self._quantiles.add(density)
+
+		entry = (density, -self.count, sentence)
+		if len(self._top) < self.top_k:
+			heapq.heappush(self._top, entry)
+		elif entry[:2] > self._top[0][:2]:
+			heapq.heapreplace(self._top, entry)
+
+		if self.keep_positions:
+			self._positions.append(density)
+
+	def extend(self, sentences: Iterable[str]):
+		"""Append sentences in order"""
+		for sentence in sentences:
+			self.add(sentence)
+
+	def add_document(self, doc: TokenizedDocument):
+		"""Append every sentence of a tokenized document (e.g. a newly transcribed segment)"""
+		densities = self.analyzer.sentence_densities(doc)
+		for sentence, density in zip(doc.sentences, densities.tolist()):
+			self.add(sentence, density)
+
+	@property
+	def mean(self) -> float:
+		return self._mean
+
+	@property
+	def std(self) -> float:
+		"""Population standard deviation (as np.std)"""
+		return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+	def snapshot(self) -> SentenceDensityMetrics:
+		"""
+		Metrics of the sentences seen so far
+
+		Independent of the number of sentences seen (the percentiles scan
+		the fixed-size histogram and the top list is sorted), unless
+		keep_positions is set.
+		"""
+		if not self.count:
+			return self.analyzer._empty_sentence_metrics()
+
+		counts = self.class_counts
+		p25, median, p75 = self._quantiles.quantiles((0.25, 0.5, 0.75))
+		top_dense = [
+			(sentence, density)
+			for density, _, sentence in sorted(self._top, key=lambda e: (-e[0], -e[1]))
+		]
+
+		return SentenceDensityMetrics(
+			total_sentences=self.count,
+			numeric_dense_sentences=counts['dense'],
+			numeric_moderate_sentences=counts['moderate'],
+			numeric_sparse_sentences=counts['sparse'],
+			narrative_sentences=counts['narrative'],
+			mean_numeric_density=self.mean,
+			median_numeric_density=median,
+			std_numeric_density=self.std,
+			max_numeric_density=self.maximum,
+			min_numeric_density=self.minimum,
+			p25_density=p25,
+			p75_density=p75,
+			proportion_numeric_dense=counts['dense'] / self.count,
+			proportion_narrative=counts['narrative'] / self.count,
+			top_dense_sentences=top_dense,
+			density_by_position=list(self._positions)
+		)
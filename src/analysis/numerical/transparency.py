@@ -3,17 +3,23 @@ Numerical Content Analysis Module
 Implements all 4 numerical metrics as specified in PRD
 """
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Tuple, Union
+import json
 import re
-from src.utils.text_utils import (
-    extract_numerical_tokens,
-    identify_forward_looking_statements,
-    identify_backward_looking_statements,
-    tokenize_words
-)
-from src.models.ollama_client import ollama_client
+
+import numpy as np
+
+from src.core.tokenized_document import TokenizedDocument, as_document, is_blank
+from src.utils.text_utils import classify_temporal
+from src.core.resources import get_contextualization_cues, get_ollama_client
+from src.cache.result_cache import get_cache
+from src.models.async_ollama_client import AsyncOllamaClient
+from src.models.ollama_client import FallbackAssessment
 from config.settings import settings
 
+# TokenizedDocument._cache key for the per-sentence forward/backward flags
+TEMPORAL_FLAGS_KEY = 'temporal_flags'
+
 
 @dataclass
 class NumericalScores:
@@ -40,15 +46,17 @@ class NumericalScores:
 class NumericalAnalyzer:
     """Analyzes numerical content transparency and quality"""
     
-    def __init__(self, use_llm_contextualization: bool = True):
+    def __init__(self, use_llm_contextualization: bool = True, use_cache: bool = True):
         """
         Initialize numerical analyzer
         
         Args:
             use_llm_contextualization: Whether to use LLM for contextualization
+            use_cache: Whether to cache LLM contextualization results
         """
         self.use_llm = use_llm_contextualization
-        self.client = ollama_client if use_llm_contextualization else None
+        self._client = None
+        self.cache = get_cache() if use_cache and use_llm_contextualization else None
         
         # Specificity weights from PRD
         self.specificity_weights = {
@@ -59,6 +67,17 @@ class NumericalAnalyzer:
             'uncertain': 0.3
         }
     
+    @property
+    def client(self):
+        """Ollama client (shared instance, resolved on first use; None without LLM)"""
+        if self._client is None and self.use_llm:
+            self._client = get_ollama_client()
+        return self._client
+    
+    @client.setter
+    def client(self, client):
+        self._client = client
+    
     def analyze(self, text: str) -> NumericalScores:
         """
         Analyze numerical content
@@ -69,15 +88,26 @@ class NumericalAnalyzer:
         Returns:
             NumericalScores object
         """
-        # Extract numerical tokens
-        numerical_tokens = extract_numerical_tokens(text)
+        return self.analyze_document(TokenizedDocument.from_text(text))
+    
+    def analyze_document(self, doc: TokenizedDocument) -> NumericalScores:
+        """
+        Analyze numerical content of an already tokenized document
+        
+        Args:
+            doc: Tokenized document
+            
+        Returns:
+            NumericalScores object
+        """
+        # Numerical tokens from the document's numeric index
+        numerical_tokens = doc.numerical_tokens()
         
         if not numerical_tokens:
             return self._empty_scores()
         
         # Count total words
-        words = tokenize_words(text, lowercase=False, remove_punct=True)
-        total_words = len(words)
+        total_words = doc.word_count
         
         # Calculate transparency score
         transparency_score = (len(numerical_tokens) / total_words) * 100
@@ -87,7 +117,7 @@ class NumericalAnalyzer:
         
         # Calculate forward/backward density
         forward_density, backward_density, fwd_tokens, bwd_tokens = \
-            self._calculate_temporal_density(text, numerical_tokens)
+            self._calculate_temporal_density(doc)
         
         # Calculate forward-to-backward ratio
         if backward_density > 0:
@@ -169,32 +199,41 @@ class NumericalAnalyzer:
         # Default to whole number
         return self.specificity_weights['whole']
     
-    def _calculate_temporal_density(
-        self,
-        text: str,
-        numerical_tokens: List[Tuple[str, str]]
-    ) -> Tuple[float, float, int, int]:
+    @staticmethod
+    def temporal_flags(doc: TokenizedDocument) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Forward- and backward-looking flags of every sentence (cached on the document)
+        
+        Returns:
+            Tuple of (forward, backward) boolean arrays over the sentence index
+        """
+        if TEMPORAL_FLAGS_KEY not in doc._cache:
+            doc._cache[TEMPORAL_FLAGS_KEY] = classify_temporal(doc.sentences)
+        return doc._cache[TEMPORAL_FLAGS_KEY]
+    
+    def _calculate_temporal_density(self, doc: TokenizedDocument) -> Tuple[float, float, int, int]:
         """
         Calculate forward-looking and backward-looking numerical density
         
+        Each numeric mention counts toward the class of the sentence it occurs in.
+        
         Returns:
             Tuple of (forward_density, backward_density, forward_count, backward_count)
         """
-        # Get forward and backward looking statements
-        forward_statements = identify_forward_looking_statements(text)
-        backward_statements = identify_backward_looking_statements(text)
+        forward, backward = self.temporal_flags(doc)
         
         # Count words in each
-        forward_words = sum(len(tokenize_words(s, lowercase=False, remove_punct=True)) 
-                           for s in forward_statements)
-        backward_words = sum(len(tokenize_words(s, lowercase=False, remove_punct=True)) 
-                            for s in backward_statements)
-        
-        # Count numerical tokens in each
-        forward_count = sum(1 for _, context in numerical_tokens 
-                           if any(context in stmt for stmt in forward_statements))
-        backward_count = sum(1 for _, context in numerical_tokens 
-                            if any(context in stmt for stmt in backward_statements))
+        word_counts = doc.sentence_token_counts(remove_punct=True)
+        forward_words = int(word_counts[forward].sum())
+        backward_words = int(word_counts[backward].sum())
+        
+        # Count numerical tokens in each, by the sentence they occur in
+        mentions = doc.numeric_index.mentions
+        sentence_ids = np.fromiter(
+            (m.sentence_index for m in mentions), dtype=np.int64, count=len(mentions)
+        )
+        forward_count = int(forward[sentence_ids].sum())
+        backward_count = int(backward[sentence_ids].sum())
         
         # Calculate densities
         forward_density = (forward_count / forward_words * 100) if forward_words > 0 else 0.0
@@ -215,32 +254,21 @@ class NumericalAnalyzer:
         if not numerical_tokens:
             return 0.0, 0, 0
         
-        context_scores = []
-        well_contextualized = 0
-        undercontextualized = 0
-        
-        for number, context in numerical_tokens:
-            if self.use_llm and self.client:
-                # Use LLM for assessment
-                assessment = self.client.assess_contextualization(number, context)
-                score = assessment.get('overall_score', 1.5)
-                
-                # Normalize to 0-3 scale
-                if score >= 2.5:
-                    well_contextualized += 1
-                elif score <= 1.0:
-                    undercontextualized += 1
-                
-                context_scores.append(score)
-            else:
-                # Use rule-based heuristic
-                score = self._rule_based_contextualization(number, context)
-                context_scores.append(score)
-                
-                if score >= 2.5:
-                    well_contextualized += 1
-                elif score <= 1.0:
-                    undercontextualized += 1
+        if self.use_llm and self.client:
+            # Use LLM for assessment
+            context_scores = self._llm_contextualization(numerical_tokens)
+        else:
+            # Use rule-based heuristic; the distinct sentences are scanned in
+            # one batch and each cue bitset shared by every number in it
+            contexts = list(dict.fromkeys(context for _, context in numerical_tokens))
+            sentence_cues: Dict[str, int] = dict(
+                zip(contexts, get_contextualization_cues().masks(contexts).tolist())
+            )
+            context_scores = [self._cue_score(sentence_cues[context]) for _, context in numerical_tokens]
+        
+        # Scores are on a 0-3 scale
+        well_contextualized = sum(1 for score in context_scores if score >= 2.5)
+        undercontextualized = sum(1 for score in context_scores if score <= 1.0)
         
         # Calculate average and normalize to 0-1 scale
         avg_score = sum(context_scores) / len(context_scores)
@@ -248,6 +276,69 @@ class NumericalAnalyzer:
         
         return quality_score, well_contextualized, undercontextualized
     
+    def _llm_contextualization(self, numerical_tokens: List[Tuple[str, str]]) -> List[float]:
+        """
+        LLM contextualization scores, one prompt per sentence
+        
+        Numbers sharing a sentence are scored together, so a repeated
+        sentence is sent once; results are cached per (sentence, numbers, model).
+        
+        Returns:
+            Score (0-3) of every numerical token, in order
+        """
+        # Distinct numbers of each sentence, in first-seen order
+        groups: Dict[str, Dict[str, None]] = {}
+        for number, context in numerical_tokens:
+            groups.setdefault(context, {})[number] = None
+        
+        batches = [(context, list(numbers)) for context, numbers in groups.items()]
+        scores: Dict[Tuple[str, str], float] = {}
+        for (context, numbers), assessments in zip(batches, self._assess_batches(batches)):
+            for number, assessment in zip(numbers, assessments):
+                scores[context, number] = assessment.get('overall_score', 1.5)
+        
+        return [scores[context, number] for number, context in numerical_tokens]
+    
+    def _assess_batches(self, batches: List[Tuple[str, List[str]]]) -> List[List[Dict]]:
+        """
+        Run assess_contextualization_batch for (sentence, numbers) batches
+        
+        Cached batches are not sent again; the rest are sent concurrently,
+        bounded by the async client's max_concurrency. A batch whose
+        response fell back to neutral defaults for any number is not
+        cached, so it is asked for again next time.
+        
+        Returns:
+            Assessments of each batch, in order
+        """
+        analysis_type = f"contextualization:{settings.CONTEXTUALIZATION_MODEL}"
+        keys = [json.dumps([context, numbers]) for context, numbers in batches]
+        
+        results: Dict[str, List[Dict]] = {}
+        pending: Dict[str, Tuple[str, List[str]]] = {}
+        for key, batch in zip(keys, batches):
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key, analysis_type) if self.cache else None
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = batch
+        
+        if pending:
+            client = AsyncOllamaClient.for_client(self.client)
+            assessed = client.run_all(
+                client.assess_contextualization_batch(numbers, context)
+                for context, numbers in pending.values()
+            )
+            
+            for key, assessments in zip(pending, assessed):
+                results[key] = assessments
+                if self.cache and not any(isinstance(a, FallbackAssessment) for a in assessments):
+                    self.cache.set(key, analysis_type, assessments)
+        
+        return [results[key] for key in keys]
+    
     def _rule_based_contextualization(self, number: str, context: str) -> float:
         """
         Rule-based contextualization assessment (fallback)
@@ -255,28 +346,12 @@ class NumericalAnalyzer:
         Returns:
             Score from 0-3
         """
-        context_lower = context.lower()
-        score = 0.0
-        
-        # Check for comparison words
-        comparison_words = ['up from', 'down from', 'vs', 'versus', 'compared to', 
-                          'year-over-year', 'yoy', 'qoq', 'quarter-over-quarter']
-        if any(word in context_lower for word in comparison_words):
-            score += 1.0
-        
-        # Check for explanation words
-        explanation_words = ['driven by', 'due to', 'because', 'as a result', 
-                           'reflecting', 'primarily', 'driven']
-        if any(word in context_lower for word in explanation_words):
-            score += 1.0
-        
-        # Check for implication words
-        implication_words = ['positioning', 'enables', 'allows', 'supports', 
-                           'demonstrates', 'indicates', 'shows']
-        if any(word in context_lower for word in implication_words):
-            score += 1.0
-        
-        return score
+        return self._cue_score(get_contextualization_cues().mask(context.lower()))
+    
+    @staticmethod
+    def _cue_score(cue_mask: int) -> float:
+        """One point each for comparison, explanation and implication cues"""
+        return float(bin(cue_mask).count('1'))
     
     def _benchmark_comparison(self, transparency_score: float) -> str:
         """Compare to S&P 500 benchmark"""
@@ -289,20 +364,26 @@ class NumericalAnalyzer:
         else:
             return "at"
     
-    def analyze_by_section(self, sections: Dict[str, str]) -> Dict[str, NumericalScores]:
-        """Analyze numerical content for each section"""
+    def analyze_by_section(
+        self,
+        sections: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, NumericalScores]:
+        """Analyze numerical content for each section (text or document view)"""
         return {
-            section_name: self.analyze(text)
+            section_name: self.analyze_document(as_document(text))
             for section_name, text in sections.items()
-            if text.strip()
+            if not is_blank(text)
         }
     
-    def analyze_by_speaker(self, speakers: Dict[str, str]) -> Dict[str, NumericalScores]:
-        """Analyze numerical content for each speaker"""
+    def analyze_by_speaker(
+        self,
+        speakers: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, NumericalScores]:
+        """Analyze numerical content for each speaker (text or document view)"""
         return {
-            speaker_name: self.analyze(text)
+            speaker_name: self.analyze_document(as_document(text))
             for speaker_name, text in speakers.items()
-            if text.strip()
+            if not is_blank(text)
         }
     
     def _empty_scores(self) -> NumericalScores:
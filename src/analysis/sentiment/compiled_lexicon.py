@@ -0,0 +1,264 @@
+"""
+Compiled Loughran-McDonald lexicon
+The seven category word lists are merged into a single word -> bitmask
+mapping (bit i set = word is in LM_CATEGORIES[i]) and stored in one binary
+file, so a lexicon loads without re-parsing the text lists
+"""
+import hashlib
+import logging
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Category order defines the bit positions
+LM_CATEGORIES: Tuple[str, ...] = (
+    'negative', 'positive', 'uncertainty', 'litigious',
+    'strong_modal', 'weak_modal', 'constraining'
+)
+
+# Binary layout (little endian):
+#   magic, version, category count, source fingerprint, word count,
+#   word blob length, then the '\n'-joined category names, the
+#   (st_mtime_ns, st_size) of every category word list, the '\n'-joined
+#   words (UTF-8) and one mask byte per word
+_MAGIC = b'LMLX'
+_VERSION = 2
+_HEADER = struct.Struct('<4sHHIII')
+_SOURCE_STAT = struct.Struct('<qq')
+
+# (st_mtime_ns, st_size) of each word list, (-1, -1) when missing
+SourceStats = Tuple[Tuple[int, int], ...]
+
+
+def source_stats(dict_path: Path, categories: Tuple[str, ...] = LM_CATEGORIES) -> SourceStats:
+    """
+    Modification time and size of every category word list
+
+    Args:
+        dict_path: Directory holding <category>.txt files
+
+    Returns:
+        One (st_mtime_ns, st_size) pair per category, (-1, -1) for missing lists
+    """
+    stats = []
+    for category in categories:
+        try:
+            stat = (dict_path / f"{category}.txt").stat()
+            stats.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stats.append((-1, -1))
+    return tuple(stats)
+
+
+def source_fingerprint(dict_path: Path, categories: Tuple[str, ...] = LM_CATEGORIES) -> int:
+    """
+    CRC32 over the raw bytes of every category word list
+
+    Args:
+        dict_path: Directory holding <category>.txt files
+
+    Returns:
+        Fingerprint that changes whenever any list changes (missing lists count as empty)
+    """
+    crc = 0
+    for category in categories:
+        file_path = dict_path / f"{category}.txt"
+        data = file_path.read_bytes() if file_path.exists() else b''
+        crc = zlib.crc32(category.encode('utf-8') + b'\0' + data, crc)
+    return crc
+
+
+class CompiledLexicon:
+    """Word -> category bitmask mapping for the LM dictionary"""
+
+    def __init__(
+        self,
+        bitmasks: Dict[str, int],
+        categories: Tuple[str, ...] = LM_CATEGORIES,
+        fingerprint: int = 0,
+        stats: Optional[SourceStats] = None
+    ):
+        """
+        Initialize compiled lexicon
+
+        Args:
+            bitmasks: Dict of lowercased word -> category bitmask
+            categories: Category names in bit order
+            fingerprint: source_fingerprint of the word lists this was built from
+            stats: source_stats of those word lists
+        """
+        self.bitmasks = bitmasks
+        self.categories = categories
+        self.fingerprint = fingerprint
+        self.stats = stats or ((-1, -1),) * len(categories)
+
+        # Category indices set in every possible mask
+        self.mask_categories: List[Tuple[int, ...]] = [
+            tuple(i for i in range(len(categories)) if mask >> i & 1)
+            for mask in range(1 << len(categories))
+        ]
+
+    @classmethod
+    def from_word_lists(cls, dict_path: Path, categories: Tuple[str, ...] = LM_CATEGORIES) -> 'CompiledLexicon':
+        """
+        Compile the lexicon from <category>.txt word lists
+
+        Args:
+            dict_path: Directory holding the word lists (one word per line)
+
+        Returns:
+            CompiledLexicon
+        """
+        # Taken before reading, so an edit made meanwhile shows up as a mismatch
+        stats = source_stats(dict_path, categories)
+        bitmasks: Dict[str, int] = {}
+
+        for bit, category in enumerate(categories):
+            file_path = dict_path / f"{category}.txt"
+
+            if not file_path.exists():
+                logger.warning(f"{category}.txt not found at {file_path}")
+                continue
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    word = line.strip().lower()
+                    if word:
+                        bitmasks[word] = bitmasks.get(word, 0) | (1 << bit)
+
+        return cls(bitmasks, categories, source_fingerprint(dict_path, categories), stats)
+
+    def save(self, path: Path):
+        """Write the lexicon to a binary file"""
+        words = list(self.bitmasks)
+        names = '\n'.join(self.categories).encode('utf-8')
+        blob = '\n'.join(words).encode('utf-8')
+
+        header = _HEADER.pack(_MAGIC, _VERSION, len(self.categories), self.fingerprint, len(words), len(blob))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(
+            header + struct.pack('<I', len(names)) + names +
+            b''.join(_SOURCE_STAT.pack(*stat) for stat in self.stats) + blob +
+            bytes(self.bitmasks[word] for word in words)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'CompiledLexicon':
+        """
+        Read a lexicon written by save()
+
+        Raises:
+            ValueError: If the file is not a compiled lexicon of this version
+        """
+        data = path.read_bytes()
+        if len(data) < _HEADER.size + 4:
+            raise ValueError(f"Not a compiled lexicon: {path}")
+
+        magic, version, category_count, fingerprint, word_count, blob_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not a compiled lexicon (version {_VERSION}): {path}")
+
+        offset = _HEADER.size
+        (names_length,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        categories = tuple(data[offset:offset + names_length].decode('utf-8').split('\n'))
+        offset += names_length
+
+        stats_end = offset + category_count * _SOURCE_STAT.size
+        if stats_end > len(data):
+            raise ValueError(f"Truncated compiled lexicon: {path}")
+        stats = tuple(_SOURCE_STAT.unpack_from(data, offset + i * _SOURCE_STAT.size) for i in range(category_count))
+        offset = stats_end
+
+        words = data[offset:offset + blob_length].decode('utf-8').split('\n') if word_count else []
+        offset += blob_length
+        masks = data[offset:offset + word_count]
+
+        if len(categories) != category_count or len(words) != word_count or len(masks) != word_count:
+            raise ValueError(f"Truncated compiled lexicon: {path}")
+
+        return cls(dict(zip(words, masks)), categories, fingerprint, stats)
+
+
+def default_compiled_path(dict_path: Path) -> Path:
+    """
+    Where the compiled form of a word list directory is kept
+
+    The bundled dictionary compiles to settings.LM_COMPILED_LEXICON; any
+    other directory compiles into the cache directory, never next to the
+    caller's own files.
+
+    Args:
+        dict_path: Directory holding the category word lists
+
+    Returns:
+        Path of the binary lexicon file
+    """
+    from config.settings import settings
+
+    dict_path = Path(dict_path).resolve()
+    if dict_path == (settings.DICTIONARIES_DIR / "loughran_mcdonald").resolve():
+        return Path(getattr(settings, 'LM_COMPILED_LEXICON', settings.DICTIONARIES_DIR / "loughran_mcdonald.bin"))
+    digest = hashlib.sha1(str(dict_path).encode('utf-8')).hexdigest()[:16]
+    return settings.CACHE_DIR / "lexicons" / f"{dict_path.name}-{digest}.bin"
+
+
+def load_lexicon(dict_path: Path, compiled_path: Optional[Path] = None) -> CompiledLexicon:
+    """
+    Load the compiled lexicon, rebuilding it when the word lists changed
+
+    The compiled file is used as is when the modification time and size
+    stored for every word list match; only on a mismatch are the lists
+    hashed, and recompiled if their contents really changed. The file is
+    rewritten (best effort) whenever it was out of date.
+
+    Args:
+        dict_path: Directory holding the category word lists
+        compiled_path: Binary lexicon file (default: default_compiled_path(dict_path))
+
+    Returns:
+        CompiledLexicon
+    """
+    compiled_path = Path(compiled_path or default_compiled_path(dict_path))
+    stats = source_stats(dict_path)
+
+    lexicon = None
+    if compiled_path.exists():
+        try:
+            lexicon = CompiledLexicon.load(compiled_path)
+        except ValueError as e:
+            logger.warning(f"{e}; rebuilding")
+
+    if lexicon is not None and lexicon.categories != LM_CATEGORIES:
+        lexicon = None
+
+    if lexicon is not None:
+        if lexicon.stats == stats:
+            return lexicon
+        if lexicon.fingerprint == source_fingerprint(dict_path):
+            # Touched but unchanged: only record the new stats
+            lexicon.stats = stats
+        else:
+            logger.info(f"Compiled lexicon is stale, rebuilding: {compiled_path}")
+            lexicon = None
+
+    if lexicon is None:
+        lexicon = CompiledLexicon.from_word_lists(dict_path)
+    try:
+        lexicon.save(compiled_path)
+    except OSError as e:
+        logger.warning(f"Could not write compiled lexicon {compiled_path}: {e}")
+    return lexicon
+
+
+if __name__ == '__main__':
+    from config.settings import settings
+
+    source = settings.DICTIONARIES_DIR / "loughran_mcdonald"
+    target = settings.DICTIONARIES_DIR / "loughran_mcdonald.bin"
+    compiled = CompiledLexicon.from_word_lists(source)
+    compiled.save(target)
+    print(f"Compiled {len(compiled.bitmasks):,} words into {target}")
@@ -2,9 +2,10 @@
 Hybrid Sentiment Analysis - Combines Lexicon and LLM approaches
 """
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable, Mapping, Union
 from src.analysis.sentiment.lexicon_analyzer import LexiconSentimentAnalyzer, LMSentimentScores
 from src.analysis.sentiment.llm_analyzer import LLMSentimentAnalyzer, LLMSentimentScores
+from src.core.tokenized_document import TokenizedDocument, as_document, is_blank
 from config.settings import settings
 
 
@@ -32,10 +33,17 @@ class HybridSentimentAnalyzer:
     Implements 70% LLM / 30% Lexicon weighting as specified in PRD
     """
     
-    def __init__(self):
-        """Initialize hybrid analyzer"""
+    def __init__(self, use_llm: bool = True):
+        """
+        Initialize hybrid analyzer
+        
+        Args:
+            use_llm: Whether to query the LLM; when False llm_scores holds a
+                neutral placeholder (the same scores as an unavailable LLM)
+        """
         self.lexicon_analyzer = LexiconSentimentAnalyzer()
         self.llm_analyzer = LLMSentimentAnalyzer()
+        self.use_llm = use_llm
         
         # Weighting from PRD
         self.lexicon_weight = settings.HYBRID_SENTIMENT_WEIGHT_LEXICON  # 0.3
@@ -55,8 +63,58 @@ class HybridSentimentAnalyzer:
         lexicon_scores = self.lexicon_analyzer.analyze(text)
         
         # Get LLM-based scores
-        llm_scores = self.llm_analyzer.analyze(text)
+        llm_scores = self._llm_scores(text)
+        
+        return self._combine(lexicon_scores, llm_scores)
+    
+    def analyze_document(self, doc: TokenizedDocument) -> HybridSentimentScores:
+        """
+        Perform hybrid sentiment analysis on an already tokenized document
         
+        Args:
+            doc: Tokenized document
+            
+        Returns:
+            HybridSentimentScores object
+        """
+        lexicon_scores = self.lexicon_analyzer.analyze_document(doc)
+        llm_scores = self._llm_scores(doc)
+        
+        return self._combine(lexicon_scores, llm_scores)
+    
+    def plan_llm_chunks(self, doc: TokenizedDocument, views: Iterable[TokenizedDocument]) -> None:
+        """
+        Fix the LLM chunk boundaries of a document before scoring it
+        
+        Chunks will not cross the boundaries of views, so the document's
+        LLM score and each view's are aggregated from the same chunk results.
+        
+        Args:
+            doc: Full document
+            views: Range views of doc (e.g. its sections)
+        """
+        if self.use_llm:
+            self.llm_analyzer.plan_chunks(doc, views)
+    
+    def _llm_scores(self, text: Union[str, TokenizedDocument]) -> LLMSentimentScores:
+        """LLM scores for text, or a neutral placeholder when the LLM is off"""
+        if not self.use_llm:
+            return LLMSentimentScores(
+                overall_sentiment="Neutral",
+                sentiment_score=0.0,
+                confidence=0.0,
+                segment_sentiments=[]
+            )
+        if isinstance(text, TokenizedDocument):
+            return self.llm_analyzer.analyze_document(text)
+        return self.llm_analyzer.analyze(text)
+    
+    def _combine(
+        self,
+        lexicon_scores: LMSentimentScores,
+        llm_scores: LLMSentimentScores
+    ) -> HybridSentimentScores:
+        """Weight lexicon and LLM scores into a hybrid score"""
         # Calculate hybrid score
         # Lexicon: Net Positivity ranges from -100 to +100
         # LLM: sentiment_score ranges from -1.0 to +1.0
@@ -85,41 +143,59 @@ class HybridSentimentAnalyzer:
             confidence=llm_scores.confidence
         )
     
-    def analyze_by_section(self, sections: Dict[str, str]) -> Dict[str, HybridSentimentScores]:
+    def analyze_by_section(
+        self,
+        sections: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, HybridSentimentScores]:
         """
         Analyze sentiment for each section
         
         Args:
-            sections: Dict of section_name -> text
+            sections: Dict of section_name -> text or document view
             
         Returns:
             Dict of section_name -> HybridSentimentScores
         """
-        results = {}
+        documents = {
+            section_name: as_document(text)
+            for section_name, text in sections.items()
+            if not is_blank(text)
+        }
         
-        for section_name, text in sections.items():
-            if text.strip():
-                results[section_name] = self.analyze(text)
+        # Lexicon scores for every section in one batch
+        self.lexicon_analyzer.analyze_batch(list(documents.values()))
         
-        return results
+        return {
+            section_name: self.analyze_document(doc)
+            for section_name, doc in documents.items()
+        }
     
-    def analyze_by_speaker(self, speakers: Dict[str, str]) -> Dict[str, HybridSentimentScores]:
+    def analyze_by_speaker(
+        self,
+        speakers: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, HybridSentimentScores]:
         """
         Analyze sentiment for each speaker
         
         Args:
-            speakers: Dict of speaker_name -> text
+            speakers: Dict of speaker_name -> text or document view
             
         Returns:
             Dict of speaker_name -> HybridSentimentScores
         """
-        results = {}
+        documents = {
+            speaker_name: as_document(text)
+            for speaker_name, text in speakers.items()
+            if not is_blank(text)
+        }
         
-        for speaker_name, text in speakers.items():
-            if text.strip():
-                results[speaker_name] = self.analyze(text)
+        # Lexicon scores for every speaker in one batch
+        self.lexicon_analyzer.analyze_batch(list(documents.values()))
         
-        return results
+        return {
+            speaker_name: self.analyze_document(doc)
+            for speaker_name, doc in documents.items()
+        }
     
     def compare_approaches(self, text: str) -> Dict[str, any]:
         """
@@ -1,13 +1,21 @@
 """
 Loughran-McDonald Dictionary-Based Sentiment Analysis
 """
-from typing import Dict, List, Set
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Sequence, Set, Union
 from pathlib import Path
 from dataclasses import dataclass
+import numpy as np
+from src.analysis.sentiment.compiled_lexicon import load_lexicon
 from src.utils.text_utils import tokenize_words
+from src.core.tokenized_document import TokenizedDocument, as_document
 from config.settings import settings
 
 
+# TokenizedDocument._cache key for memoized lexicon scores
+LM_SCORES_KEY = 'lm_sentiment'
+
+
 @dataclass
 class LMSentimentScores:
     """Loughran-McDonald sentiment scores"""
@@ -34,39 +42,31 @@ class LMSentimentScores:
 class LMDictionary:
     """Loughran-McDonald Master Dictionary"""
     
-    def __init__(self, dict_path: Path = None):
+    def __init__(self, dict_path: Path = None, compiled_path: Path = None):
         """
         Initialize LM Dictionary
         
         Args:
             dict_path: Path to dictionary directory
+            compiled_path: Path to the compiled binary lexicon
+                (default: settings.LM_COMPILED_LEXICON for the default dictionary,
+                the cache directory for any other)
         """
         self.dict_path = dict_path or settings.DICTIONARIES_DIR / "loughran_mcdonald"
-        self.dictionaries = self._load_dictionaries()
+        self.lexicon = load_lexicon(self.dict_path, compiled_path)
+        self.categories = self.lexicon.categories
+        self.bitmasks = self.lexicon.bitmasks
+        self._dictionaries = None
     
-    def _load_dictionaries(self) -> Dict[str, Set[str]]:
-        """Load all LM dictionary categories"""
-        categories = [
-            'negative', 'positive', 'uncertainty', 'litigious',
-            'strong_modal', 'weak_modal', 'constraining'
-        ]
-        
-        dictionaries = {}
-        
-        for category in categories:
-            file_path = self.dict_path / f"{category}.txt"
-            
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    # Words are typically one per line in LM dictionary
-                    words = set(line.strip().lower() for line in f if line.strip())
-                dictionaries[category] = words
-            else:
-                # Create empty set if file doesn't exist
-                dictionaries[category] = set()
-                print(f"Warning: {category}.txt not found at {file_path}")
-        
-        return dictionaries
+    @property
+    def dictionaries(self) -> Dict[str, Set[str]]:
+        """Category -> word set view of the compiled lexicon"""
+        if self._dictionaries is None:
+            self._dictionaries = {category: set() for category in self.categories}
+            for word, mask in self.bitmasks.items():
+                for index in self.lexicon.mask_categories[mask]:
+                    self._dictionaries[self.categories[index]].add(word)
+        return self._dictionaries
     
     def get_word_categories(self, word: str) -> List[str]:
         """
@@ -78,14 +78,75 @@ class LMDictionary:
         Returns:
             List of category names
         """
-        word_lower = word.lower()
-        categories = []
+        mask = self.bitmasks.get(word.lower(), 0)
+        return [self.categories[index] for index in self.lexicon.mask_categories[mask]]
+    
+    def count_categories(self, words: Iterable[str]) -> Dict[str, int]:
+        """
+        Count category hits over lowercased words
         
-        for category, word_set in self.dictionaries.items():
-            if word_lower in word_set:
-                categories.append(category)
+        Each distinct word is looked up once and weighted by its frequency.
         
-        return categories
+        Args:
+            words: Lowercased words
+            
+        Returns:
+            Dict of category -> number of words in that category
+        """
+        totals = [0] * len(self.categories)
+        bitmasks = self.bitmasks
+        mask_categories = self.lexicon.mask_categories
+        
+        for word, count in Counter(words).items():
+            mask = bitmasks.get(word)
+            if mask:
+                for index in mask_categories[mask]:
+                    totals[index] += count
+        
+        return dict(zip(self.categories, totals))
+    
+    def count_categories_batch(self, word_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Category counts for many documents at once
+        
+        Builds a sparse document-term count matrix (COO: one entry per
+        distinct word of each document) over a vocabulary shared by all
+        documents, and multiplies it by the vocabulary's category indicator
+        matrix.
+        
+        Args:
+            word_lists: Lowercased words of each document
+            
+        Returns:
+            Integer array (n_documents, n_categories), columns in self.categories order
+        """
+        n_categories = len(self.categories)
+        vocabulary: Dict[str, int] = {}
+        doc_ids: List[int] = []
+        term_ids: List[int] = []
+        term_counts: List[int] = []
+        
+        for doc_id, words in enumerate(word_lists):
+            counter = Counter(words)
+            doc_ids.extend([doc_id] * len(counter))
+            term_ids.extend(vocabulary.setdefault(word, len(vocabulary)) for word in counter)
+            term_counts.extend(counter.values())
+        
+        # (vocabulary, categories) 0/1 indicator matrix
+        bitmasks = self.bitmasks
+        masks = np.fromiter((bitmasks.get(word, 0) for word in vocabulary), dtype=np.int64, count=len(vocabulary))
+        indicator = (masks[:, None] >> np.arange(n_categories)) & 1
+        
+        # Keep only entries for words in at least one category
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        keep = masks[term_ids] != 0 if len(term_ids) else np.zeros(0, dtype=bool)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)[keep]
+        weights = indicator[term_ids[keep]] * np.asarray(term_counts, dtype=np.int64)[keep, None]
+        
+        # Sparse product: sum each entry's weighted indicator row into its document's row
+        cells = (doc_ids[:, None] * n_categories + np.arange(n_categories)).ravel()
+        totals = np.bincount(cells, weights=weights.ravel(), minlength=len(word_lists) * n_categories)
+        return np.rint(totals).astype(np.int64).reshape(len(word_lists), n_categories)
 
 
 class LexiconSentimentAnalyzer:
@@ -105,28 +166,60 @@ class LexiconSentimentAnalyzer:
         Returns:
             LMSentimentScores object
         """
-        # Tokenize text
-        words = tokenize_words(text, lowercase=True, remove_punct=True)
-        word_count = len(words)
+        return self._score_words(tokenize_words(text, lowercase=True, remove_punct=True))
+    
+    def analyze_document(self, doc: TokenizedDocument) -> LMSentimentScores:
+        """
+        Analyze sentiment of an already tokenized document
         
-        if word_count == 0:
-            return self._empty_scores()
+        Scores are memoized on the document, so a document scored earlier
+        (e.g. by analyze_batch) is not counted again.
         
-        # Count words in each category
-        counts = {
-            'negative': 0,
-            'positive': 0,
-            'uncertainty': 0,
-            'litigious': 0,
-            'strong_modal': 0,
-            'weak_modal': 0,
-            'constraining': 0,
-        }
+        Args:
+            doc: Tokenized document
+            
+        Returns:
+            LMSentimentScores object
+        """
+        return self.analyze_batch([doc])[0]
+    
+    def analyze_batch(self, documents: Sequence[Union[str, TokenizedDocument]]) -> List[LMSentimentScores]:
+        """
+        Analyze sentiment of many documents in one vectorized pass
+        
+        Works for the splits of one transcript (overall, sections, speakers)
+        and for documents from different transcripts alike; results equal
+        analyze_document on each document.
+        
+        Args:
+            documents: Texts or tokenized documents
+            
+        Returns:
+            LMSentimentScores per document, in order
+        """
+        docs = [as_document(document) for document in documents]
+        pending = [doc for doc in dict.fromkeys(docs) if LM_SCORES_KEY not in doc._cache]
         
-        for word in words:
-            categories = self.dictionary.get_word_categories(word)
-            for category in categories:
-                counts[category] += 1
+        if pending:
+            word_lists = [doc.words(lowercase=True, remove_punct=True) for doc in pending]
+            counts = self.dictionary.count_categories_batch(word_lists)
+            
+            for doc, words, row in zip(pending, word_lists, counts.tolist()):
+                doc._cache[LM_SCORES_KEY] = self._scores_from_counts(
+                    dict(zip(self.dictionary.categories, row)),
+                    len(words)
+                )
+        
+        return [doc._cache[LM_SCORES_KEY] for doc in docs]
+    
+    def _score_words(self, words: List[str]) -> LMSentimentScores:
+        """Count dictionary categories over lowercased, punctuation-free words"""
+        return self._scores_from_counts(self.dictionary.count_categories(words), len(words))
+    
+    def _scores_from_counts(self, counts: Dict[str, int], word_count: int) -> LMSentimentScores:
+        """Turn category counts into percentage scores and net positivity"""
+        if word_count == 0:
+            return self._empty_scores()
         
         # Calculate percentage scores
         scores = {
@@ -162,35 +255,35 @@ class LexiconSentimentAnalyzer:
             constraining_count=counts['constraining'],
         )
     
-    def analyze_by_section(self, sections: Dict[str, str]) -> Dict[str, LMSentimentScores]:
+    def analyze_by_section(
+        self,
+        sections: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, LMSentimentScores]:
         """
         Analyze sentiment for each section
         
         Args:
-            sections: Dict of section_name -> text
+            sections: Dict of section_name -> text or document view
             
         Returns:
             Dict of section_name -> LMSentimentScores
         """
-        return {
-            section_name: self.analyze(text)
-            for section_name, text in sections.items()
-        }
+        return dict(zip(sections.keys(), self.analyze_batch(list(sections.values()))))
     
-    def analyze_by_speaker(self, speakers: Dict[str, str]) -> Dict[str, LMSentimentScores]:
+    def analyze_by_speaker(
+        self,
+        speakers: Mapping[str, Union[str, TokenizedDocument]]
+    ) -> Dict[str, LMSentimentScores]:
         """
         Analyze sentiment for each speaker
         
         Args:
-            speakers: Dict of speaker_name -> text
+            speakers: Dict of speaker_name -> text or document view
             
         Returns:
             Dict of speaker_name -> LMSentimentScores
         """
-        return {
-            speaker_name: self.analyze(text)
-            for speaker_name, text in speakers.items()
-        }
+        return dict(zip(speakers.keys(), self.analyze_batch(list(speakers.values()))))
     
     def _empty_scores(self) -> LMSentimentScores:
         """Return empty scores for zero-length text"""
@@ -218,13 +311,10 @@ class LexiconSentimentAnalyzer:
             List of words in that category
         """
         words = tokenize_words(text, lowercase=True, remove_punct=True)
-        category_words = []
-        
-        for word in words:
-            if category in self.dictionary.get_word_categories(word):
-                category_words.append(word)
+        bit = 1 << self.dictionary.categories.index(category) if category in self.dictionary.categories else 0
+        bitmasks = self.dictionary.bitmasks
         
-        return category_words
+        return [word for word in words if bitmasks.get(word, 0) & bit]
     
     def benchmark_comparison(self, scores: LMSentimentScores) -> Dict[str, str]:
         """
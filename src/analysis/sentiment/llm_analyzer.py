@@ -2,17 +2,25 @@
 LLM-based contextual sentiment analysis using Ollama
 Enhanced with result caching for performance
 """
-from typing import Dict, List
+import copy
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
 from dataclasses import dataclass, asdict
 import logging
 import numpy as np
-from src.models.ollama_client import ollama_client
-from src.utils.text_utils import split_into_chunks, tokenize_sentences
+from src.core.resources import get_ollama_client
+from src.core.tokenized_document import TokenizedDocument
+from src.models.async_ollama_client import AsyncOllamaClient
+from src.models.ollama_client import FallbackAssessment
+from src.utils.text_utils import pack_sentences, split_into_sentence_chunks, tokenize_sentences
 from src.cache.result_cache import get_cache
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# TokenizedDocument._cache key for a full document's chunk spans
+CHUNK_PLAN_KEY = 'llm_chunk_plan'
+
 
 @dataclass
 class LLMSentimentScores:
@@ -33,13 +41,41 @@ class LLMSentimentAnalyzer:
         Args:
             use_cache: Whether to use result caching (default: True)
         """
-        self.client = ollama_client
+        self._client = None
         self.sentiment_map = {
             "Positive": 1.0,
             "Negative": -1.0,
             "Neutral": 0.0
         }
         self.cache = get_cache() if use_cache else None
+        
+        # Results of chunks already scored, shared by every view of a transcript
+        self._chunk_results: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.chunk_memo_size = getattr(settings, 'LLM_CHUNK_MEMO_SIZE', 4096)
+    
+    @property
+    def client(self):
+        """Ollama client (the shared instance, resolved on first use)"""
+        if self._client is None:
+            self._client = get_ollama_client()
+        return self._client
+    
+    @client.setter
+    def client(self, client):
+        self._client = client
+    
+    def _analyze_all(self, texts: List[str]) -> List:
+        """
+        analyze_sentiment for many texts, requested concurrently
+        
+        Returns:
+            Result dict (or the exception raised) of each text, in order
+        """
+        async_client = AsyncOllamaClient.for_client(self.client)
+        return async_client.run_all(
+            (async_client.analyze_sentiment(text) for text in texts),
+            return_exceptions=True
+        )
     
     def analyze(self, text: str, use_chunks: bool = True) -> LLMSentimentScores:
         """
@@ -74,8 +110,10 @@ class LLMSentimentAnalyzer:
                 segment_sentiments=[llm_result]
             )
 
-        # Cache the result
-        if self.cache:
+        # Cache the result, unless part of it is a fallback for a failed call
+        if self.cache and not any(
+            isinstance(segment, FallbackAssessment) for segment in result.segment_sentiments
+        ):
             self.cache.set(text, 'llm_sentiment', asdict(result))
 
         return result
@@ -90,41 +128,216 @@ class LLMSentimentAnalyzer:
         Returns:
             Aggregated LLMSentimentScores
         """
-        chunks = split_into_chunks(
-            text,
-            chunk_size=settings.LLM_CHUNK_SIZE,
-            overlap=settings.LLM_CHUNK_OVERLAP
+        chunks = split_into_sentence_chunks(text, chunk_size=settings.LLM_CHUNK_SIZE)
+        return self._aggregate(self._score_chunks(chunks))
+    
+    def plan_chunks(
+        self,
+        doc: TokenizedDocument,
+        views: Iterable[TokenizedDocument] = ()
+    ) -> List[Tuple[int, int]]:
+        """
+        Split a full document into sentence-aligned chunks and store them on it
+        
+        Chunks also break wherever one of views (e.g. the section range
+        views) starts or ends, so each view is covered by whole chunks and
+        shares their results with the document.
+        
+        Args:
+            doc: Full document (not a range view)
+            views: Range views of doc whose boundaries chunks must respect
+            
+        Returns:
+            (start, end) character offsets of each chunk into doc.source
+        """
+        anchors = sorted({
+            int(offset)
+            for view in views if view.ranges is not None
+            for offset in view.ranges.ravel().tolist()
+        })
+        
+        # Sentences, cut where they cross an anchor
+        units = []
+        for start, end in doc.sentence_spans.tolist():
+            first = np.searchsorted(anchors, start, side='right')
+            last = np.searchsorted(anchors, end, side='left')
+            cuts = [start] + anchors[first:last] + [end]
+            units.extend(zip(cuts[:-1], cuts[1:]))
+        
+        if units:
+            unit_spans = np.array(units, dtype=np.int64)
+            token_starts = doc.token_spans[:, 0]
+            word_counts = (
+                np.searchsorted(token_starts, unit_spans[:, 1], side='left')
+                - np.searchsorted(token_starts, unit_spans[:, 0], side='left')
+            )
+            segments = np.searchsorted(anchors, unit_spans[:, 0], side='right')
+            breaks = (np.flatnonzero(segments[1:] != segments[:-1]) + 1).tolist()
+            groups = pack_sentences(word_counts.tolist(), settings.LLM_CHUNK_SIZE, breaks)
+        else:
+            groups = []
+        
+        plan = [(units[first][0], units[last - 1][1]) for first, last in groups]
+        doc._cache[CHUNK_PLAN_KEY] = plan
+        return plan
+    
+    def document_chunks(self, doc: TokenizedDocument) -> List[str]:
+        """
+        Chunk texts of a document or range view
+        
+        A full document uses its chunk plan. A range view reuses every
+        chunk of its parent's plan that lies inside the view, and packs the
+        remaining sentences (e.g. short speaker turns) into chunks of its own.
+        
+        Args:
+            doc: Full document or range view
+            
+        Returns:
+            Chunk texts in document order
+        """
+        if doc.ranges is None:
+            plan = doc._cache.get(CHUNK_PLAN_KEY) or self.plan_chunks(doc)
+            return [doc.source[start:end] for start, end in plan]
+        
+        every_sentence = np.ones(doc.sentence_count, dtype=bool)
+        parent = doc.parent
+        if parent is None or parent.ranges is not None:
+            # Not a view of a full document: chunk its own sentences
+            return self._pack_view(doc, every_sentence)
+        
+        plan = parent._cache.get(CHUNK_PLAN_KEY) or self.plan_chunks(parent)
+        if not plan:
+            return self._pack_view(doc, every_sentence)
+        
+        plan_spans = np.array(plan, dtype=np.int64)
+        range_index = np.searchsorted(doc.ranges[:, 0], plan_spans[:, 0], side='right') - 1
+        inside = (range_index >= 0) & (
+            plan_spans[:, 1] <= doc.ranges[np.maximum(range_index, 0), 1]
         )
+        reused = plan_spans[inside]
         
-        segment_results = []
-        sentiment_scores = []
-        confidences = []
+        # View sentences not already inside a reused chunk
+        sentence_starts = doc.sentence_spans[:, 0]
+        chunk_index = np.searchsorted(reused[:, 0], sentence_starts, side='right') - 1
+        covered = (chunk_index >= 0) & (
+            sentence_starts < reused[np.maximum(chunk_index, 0), 1]
+        ) if len(reused) else np.zeros(len(sentence_starts), dtype=bool)
         
-        for i, chunk in enumerate(chunks):
+        chunks = [(int(start), doc.source[start:end]) for start, end in reused.tolist()]
+        chunks.extend(self._pack_view(doc, ~covered, with_offsets=True))
+        chunks.sort(key=lambda chunk: chunk[0])
+        return [text for _, text in chunks]
+    
+    def _pack_view(self, doc: TokenizedDocument, selected: np.ndarray, with_offsets: bool = False) -> List:
+        """Pack the selected sentences of a document into chunks"""
+        indices = np.flatnonzero(selected)
+        word_counts = np.diff(doc.sentence_bounds)[indices]
+        spans = doc.sentence_spans.tolist()
+        
+        chunks = []
+        for first, last in pack_sentences(word_counts.tolist(), settings.LLM_CHUNK_SIZE):
+            members = indices[first:last].tolist()
+            text = ' '.join(doc.source[spans[i][0]:spans[i][1]] for i in members)
+            chunks.append((spans[members[0]][0], text) if with_offsets else text)
+        return chunks
+    
+    def analyze_document(self, doc: TokenizedDocument) -> LLMSentimentScores:
+        """
+        Analyze sentiment of a document or range view from its chunks
+        
+        Chunk results are memoized, so the overall, section and speaker
+        passes over one transcript only send chunks not scored yet.
+        
+        Args:
+            doc: Full document or range view
+            
+        Returns:
+            LLMSentimentScores object
+        """
+        return self._aggregate(self._score_chunks(self.document_chunks(doc)))
+    
+    def _score_chunks(self, chunks: List[str]) -> List[Dict]:
+        """
+        Sentiment result of each chunk, from the memo, the result cache or the LLM
+        
+        Chunks not scored before are sent concurrently; a chunk whose
+        analysis fails, or that the client answered with its neutral
+        fallback, gets a neutral FallbackAssessment that is neither memoized
+        nor cached, so the chunk is sent again next time.
+        
+        Returns:
+            Result dict of each chunk, in order
+        """
+        results: Dict[str, Dict] = {}
+        pending = []
+        for chunk in chunks:
+            if chunk in results:
+                continue
+            result = self._chunk_results.get(chunk)
+            if result is None and self.cache:
+                result = self.cache.get(chunk, 'llm_sentiment_chunk')
+            if result is None:
+                results[chunk] = None
+                pending.append(chunk)
+            else:
+                results[chunk] = result
+                self._remember_chunk(chunk, result)
+        
+        for i, (chunk, result) in enumerate(zip(pending, self._analyze_all(pending))):
             try:
-                result = self.client.analyze_sentiment(chunk)
-                segment_results.append(result)
+                if isinstance(result, Exception):
+                    raise result
+                if isinstance(result, FallbackAssessment):
+                    logger.warning(f"Chunk {i} fell back to neutral: {result.get('reasoning')}")
+                    results[chunk] = result
+                    continue
                 
-                # Convert sentiment to numerical score
-                score = self.sentiment_map.get(result['sentiment'], 0.0)
-                sentiment_scores.append(score)
-                confidences.append(result['confidence'])
+                # Only well-formed results are kept
+                missing = {'sentiment', 'confidence'} - result.keys()
+                if missing:
+                    raise KeyError(', '.join(sorted(missing)))
                 
             except Exception as e:
                 logger.warning(f"Failed to analyze chunk {i}: {str(e)}")
                 # Add neutral default
-                segment_results.append({
+                results[chunk] = FallbackAssessment({
                     'sentiment': 'Neutral',
                     'confidence': 0.5,
                     'reasoning': f'Failed to analyze: {str(e)}'
                 })
-                sentiment_scores.append(0.0)
-                confidences.append(0.5)
+                continue
+            
+            results[chunk] = result
+            self._remember_chunk(chunk, result)
+            if self.cache:
+                self.cache.set(chunk, 'llm_sentiment_chunk', result)
+        
+        return [copy.copy(results[chunk]) for chunk in chunks]
+    
+    def _remember_chunk(self, chunk: str, result: Dict):
+        """Memoize a chunk result, dropping the least recently used beyond chunk_memo_size"""
+        self._chunk_results[chunk] = result
+        self._chunk_results.move_to_end(chunk)
+        while len(self._chunk_results) > self.chunk_memo_size:
+            self._chunk_results.popitem(last=False)
+    
+    def _aggregate(self, segment_results: List[Dict]) -> LLMSentimentScores:
+        """
+        Confidence-weighted overall sentiment of segment results
+        
+        Args:
+            segment_results: Result dict of each segment
+            
+        Returns:
+            Aggregated LLMSentimentScores
+        """
+        sentiment_scores = [self.sentiment_map.get(r['sentiment'], 0.0) for r in segment_results]
+        confidences = [r['confidence'] for r in segment_results]
         
         # Aggregate with confidence weighting
-        if sentiment_scores:
-            weighted_score = np.average(sentiment_scores, weights=confidences)
-            avg_confidence = np.mean(confidences)
+        if sentiment_scores and sum(confidences) > 0:
+            weighted_score = float(np.average(sentiment_scores, weights=confidences))
+            avg_confidence = float(np.mean(confidences))
             
             # Determine overall sentiment from weighted score
             if weighted_score > 0.2:
@@ -194,16 +407,17 @@ class LLMSentimentAnalyzer:
         sentences = tokenize_sentences(text)
         sentence_results = []
         
-        for i, sentence in enumerate(sentences):
-            if len(sentence.split()) < 5:  # Skip very short sentences
+        # Skip very short sentences
+        indices = [i for i, sentence in enumerate(sentences) if len(sentence.split()) >= 5]
+        results = self._analyze_all([sentences[i] for i in indices])
+        
+        for i, result in zip(indices, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to analyze sentence {i}: {str(result)}")
                 continue
             
-            try:
-                result = self.client.analyze_sentiment(sentence)
-                result['sentence'] = sentence
-                result['index'] = i
-                sentence_results.append(result)
-            except Exception as e:
-                logger.warning(f"Failed to analyze sentence {i}: {str(e)}")
+            result['sentence'] = sentences[i]
+            result['index'] = i
+            sentence_results.append(result)
         
         return sentence_results
@@ -2,5 +2,6 @@
 Cache module for storing expensive computation results
 """
 from src.cache.result_cache import ResultCache
+from src.cache.prompt_cache import PromptCache
 
-__all__ = ['ResultCache']
+__all__ = ['ResultCache', 'PromptCache']
@@ -0,0 +1,223 @@
+"""
+Persistent prompt-level cache for LLM responses
+Stores raw model output keyed by the full request (model, prompts and
+generation options) in a local SQLite file, so repeated prompts never reach
+the LLM server again
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from config.settings import settings
+
+
+class PromptCache:
+    """
+    SQLite-backed LLM response cache
+
+    Features:
+    - Content-addressed keys (SHA256 of the request)
+    - Primary-key lookups, recency index for eviction
+    - Size-bounded: least recently used entries are evicted once the entry
+      count or total response size exceeds its limit
+    - Safe to share between threads; WAL mode lets batch worker processes
+      share one file
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = True
+    ):
+        """
+        Initialize prompt cache
+
+        Args:
+            path: SQLite file (default: settings.LLM_CACHE_PATH)
+            max_entries: Maximum cached responses (default: settings.LLM_CACHE_MAX_ENTRIES)
+            max_bytes: Maximum total response size (default: settings.LLM_CACHE_MAX_BYTES)
+            enabled: Whether caching is enabled (default: settings.ENABLE_CACHING)
+        """
+        self.path = Path(path or settings.LLM_CACHE_PATH)
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.LLM_CACHE_MAX_BYTES
+        self.enabled = enabled and settings.ENABLE_CACHING
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.enabled:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " model TEXT NOT NULL,"
+                    " response TEXT NOT NULL,"
+                    " size INTEGER NOT NULL,"
+                    " created_at REAL NOT NULL,"
+                    " last_used REAL NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used)"
+                )
+
+    @staticmethod
+    def make_key(request: Sequence[Any]) -> str:
+        """
+        Cache key of a request
+
+        Args:
+            request: (model, system_prompt, prompt, temperature, max_tokens, json_mode)
+                as built by request_key()
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        encoded = json.dumps(list(request), ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Cached response for a key
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The response, or None if not cached
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return row[0]
+
+    def set(self, key: str, model: str, response: str) -> None:
+        """
+        Store a response, evicting old entries if the cache is over its limits
+
+        Args:
+            key: Key from make_key()
+            model: Model that produced the response
+            response: Raw model output
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both limits hold (lock held)"""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        excess = count - self.max_entries
+        if excess <= 0 and total <= self.max_bytes:
+            return
+
+        # Walk entries from the oldest until enough entries and bytes are freed
+        evicted = []
+        freed = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ):
+            if len(evicted) >= excess and total - freed <= self.max_bytes:
+                break
+            evicted.append((key,))
+            freed += size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self, model: Optional[str] = None) -> int:
+        """
+        Clear cache entries
+
+        Args:
+            model: If specified, only clear responses from this model
+
+        Returns:
+            Number of entries cleared
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock, self._conn:
+            if model is None:
+                cursor = self._conn.execute("DELETE FROM responses")
+            else:
+                cursor = self._conn.execute("DELETE FROM responses WHERE model = ?", (model,))
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with cache stats
+        """
+        if not self.enabled:
+            return {'enabled': False}
+
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            by_model = dict(self._conn.execute(
+                "SELECT model, COUNT(*) FROM responses GROUP BY model"
+            ).fetchall())
+
+        return {
+            'enabled': True,
+            'total_entries': count,
+            'total_size_mb': total / (1024 * 1024),
+            'max_entries': self.max_entries,
+            'max_size_mb': self.max_bytes / (1024 * 1024),
+            'by_model': by_model,
+            'path': str(self.path)
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self.enabled = False
+
+
+# Global cache instance
+_global_prompt_cache = None
+_global_prompt_cache_lock = threading.Lock()
+
+def get_prompt_cache() -> PromptCache:
+    """Get or create global prompt cache instance"""
+    global _global_prompt_cache
+    with _global_prompt_cache_lock:
+        if _global_prompt_cache is None:
+            _global_prompt_cache = PromptCache()
+        return _global_prompt_cache
@@ -0,0 +1,147 @@
+"""
+Shared spaCy Doc cache
+Texts are parsed once, in batches through nlp.pipe, and the Docs are shared
+by every consumer that asks for the same text
+"""
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SpacyDocCache:
+    """
+    LRU cache of parsed spaCy Docs keyed by text
+
+    Each consumer names the pipeline components it does not need (e.g.
+    ``ner`` for passive voice detection). A cached Doc remembers which
+    components ran on it; when a later consumer needs a component that was
+    skipped, only that component is run on the cached Doc instead of
+    re-parsing the text. Only leaf components (``ner``, ``lemmatizer``)
+    should be disabled, since a skipped component is added back without
+    re-running the components it depends on.
+    """
+
+    def __init__(
+        self,
+        nlp,
+        max_size: int = 512,
+        batch_size: int = 64,
+        n_process: int = 1
+    ):
+        """
+        Initialize cache
+
+        Args:
+            nlp: Loaded spaCy Language pipeline
+            max_size: Maximum number of Docs kept (least recently used are evicted)
+            batch_size: Texts per batch passed to nlp.pipe
+            n_process: Worker processes for nlp.pipe on large batches
+        """
+        self.nlp = nlp
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self._docs: 'OrderedDict[str, Tuple[object, FrozenSet[str]]]' = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, disable: Iterable[str] = ()):
+        """
+        Get the Doc for a single text
+
+        Args:
+            text: Text to parse
+            disable: Pipeline components the caller does not need
+
+        Returns:
+            spaCy Doc
+        """
+        return self.pipe([text], disable)[0]
+
+    def pipe(self, texts: Sequence[str], disable: Iterable[str] = ()) -> List:
+        """
+        Get Docs for many texts, parsing every uncached text in one nlp.pipe call
+
+        Args:
+            texts: Texts to parse (duplicates are parsed once)
+            disable: Pipeline components the caller does not need
+
+        Returns:
+            Docs in the order of texts
+        """
+        pipe_names = list(self.nlp.pipe_names)
+        disabled = frozenset(disable) & set(pipe_names)
+        needed = frozenset(pipe_names) - disabled
+
+        found: Dict[str, object] = {}
+        missing: List[str] = []
+        incomplete: List[Tuple[str, object, FrozenSet[str]]] = []
+
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                entry = self._docs.get(text)
+                if entry is None:
+                    missing.append(text)
+                    continue
+                self._docs.move_to_end(text)
+                doc, ran = entry
+                if needed <= ran:
+                    found[text] = doc
+                else:
+                    incomplete.append((text, doc, ran))
+            self.hits += len(found) + len(incomplete)
+            self.misses += len(missing)
+
+        if missing:
+            n_process = self.n_process if len(missing) > self.batch_size else 1
+            parsed = self.nlp.pipe(
+                missing,
+                batch_size=self.batch_size,
+                n_process=n_process,
+                disable=list(disabled)
+            )
+            ran = frozenset(needed)
+            for text, doc in zip(missing, parsed):
+                found[text] = doc
+                self._store(text, doc, ran)
+
+        for text, doc, ran in incomplete:
+            doc, ran = self._complete(doc, ran, needed)
+            found[text] = doc
+            self._store(text, doc, ran)
+
+        return [found[text] for text in texts]
+
+    def _complete(self, doc, ran: FrozenSet[str], needed: FrozenSet[str]) -> Tuple[object, FrozenSet[str]]:
+        """Run the components a cached Doc skipped, in pipeline order"""
+        for name, component in self.nlp.pipeline:
+            if name in needed and name not in ran:
+                doc = component(doc)
+        return doc, ran | needed
+
+    def _store(self, text: str, doc, ran: FrozenSet[str]):
+        with self._lock:
+            self._docs[text] = (doc, ran)
+            self._docs.move_to_end(text)
+            while len(self._docs) > self.max_size:
+                self._docs.popitem(last=False)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Cache statistics"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._docs),
+            'max_size': self.max_size,
+        }
+
+    def clear(self):
+        """Drop every cached Doc"""
+        with self._lock:
+            self._docs.clear()
+            self.hits = 0
+            self.misses = 0
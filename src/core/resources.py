@@ -0,0 +1,267 @@
+"""
+Lazy resource registry
+
+Heavy models and clients (NLTK data, the spaCy pipeline, the Ollama client)
+are registered by name and loaded once, on first use, then shared by every
+module in the process. Importing the package never loads any of them.
+"""
+import logging
+from threading import RLock
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# NLTK data packages and the path nltk.data.find checks for each
+NLTK_DATA_PATHS = {
+    'punkt': 'tokenizers/punkt',
+    'wordnet': 'corpora/wordnet',
+    'stopwords': 'corpora/stopwords',
+    'omw-1.4': 'corpora/omw-1.4',
+}
+
+SPACY_MODEL = 'en_core_web_sm'
+
+
+class ResourceRegistry:
+    """
+    Registry of lazily loaded, process-wide resources
+
+    A loader runs at most once per name (thread-safe); its result, including
+    None for an unavailable optional resource, is cached until reset.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._resources: Dict[str, Any] = {}
+        self._lock = RLock()
+
+    def register(self, name: str, loader: Callable[[], Any], replace: bool = False):
+        """
+        Register a loader for a resource
+
+        Args:
+            name: Resource name
+            loader: Zero-argument callable that builds the resource
+            replace: Replace an existing loader (drops any loaded instance)
+
+        Raises:
+            ValueError: If name is already registered and replace is False
+        """
+        with self._lock:
+            if name in self._loaders and not replace:
+                raise ValueError(f"Resource already registered: {name}")
+            self._loaders[name] = loader
+            self._resources.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a resource, loading it on first use
+
+        Args:
+            name: Resource name
+
+        Returns:
+            The loaded resource
+
+        Raises:
+            KeyError: If no loader is registered under name
+        """
+        try:
+            return self._resources[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if name not in self._resources:
+                if name not in self._loaders:
+                    raise KeyError(f"Unknown resource: {name}")
+                logger.debug(f"Loading resource: {name}")
+                self._resources[name] = self._loaders[name]()
+            return self._resources[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """True if the resource has already been loaded"""
+        return name in self._resources
+
+    def set(self, name: str, resource: Any):
+        """Install an already built resource (e.g. a test double)"""
+        with self._lock:
+            self._loaders.setdefault(name, lambda: resource)
+            self._resources[name] = resource
+
+    def reset(self, name: Optional[str] = None):
+        """Drop one loaded resource, or all of them (loaders are kept)"""
+        with self._lock:
+            if name is None:
+                self._resources.clear()
+            else:
+                self._resources.pop(name, None)
+
+
+def ensure_nltk_data(package: str) -> bool:
+    """
+    Make sure an NLTK data package is installed, downloading it if missing
+
+    Args:
+        package: NLTK package name (punkt, wordnet, stopwords, omw-1.4)
+
+    Returns:
+        True if the package is available
+    """
+    return registry.get(f'nltk_data:{package}')
+
+
+def _nltk_data_loader(package: str) -> Callable[[], bool]:
+    def load() -> bool:
+        import nltk
+
+        path = NLTK_DATA_PATHS.get(package, package)
+        try:
+            nltk.data.find(path)
+            return True
+        except LookupError:
+            pass
+
+        logger.info(f"Downloading NLTK data: {package}")
+        nltk.download(package, quiet=True)
+        try:
+            nltk.data.find(path)
+            return True
+        except LookupError:
+            logger.warning(f"NLTK data not available: {package}")
+            return False
+
+    return load
+
+
+def _load_punkt():
+    import nltk
+
+    ensure_nltk_data('punkt')
+    return nltk.data.load('tokenizers/punkt/english.pickle')
+
+
+def _load_word_tokenizer():
+    from nltk.tokenize.destructive import NLTKWordTokenizer
+
+    return NLTKWordTokenizer()
+
+
+def _load_spacy():
+    try:
+        import spacy
+    except ImportError:
+        logger.warning("spaCy not installed; falling back to rule-based processing")
+        return None
+
+    try:
+        return spacy.load(SPACY_MODEL)
+    except OSError:
+        logger.warning(
+            f"spaCy model '{SPACY_MODEL}' not found; falling back to rule-based processing. "
+            f"Install with: python -m spacy download {SPACY_MODEL}"
+        )
+        return None
+
+
+def _load_spacy_docs():
+    nlp = get_spacy_nlp()
+    if nlp is None:
+        return None
+
+    from config.settings import settings
+    from src.core.doc_cache import SpacyDocCache
+
+    return SpacyDocCache(
+        nlp,
+        max_size=getattr(settings, 'SPACY_DOC_CACHE_SIZE', 512),
+        batch_size=getattr(settings, 'SPACY_BATCH_SIZE', 64),
+        n_process=getattr(settings, 'SPACY_N_PROCESS', 1)
+    )
+
+
+def _load_contextualization_cues():
+    from config.settings import settings
+    from src.utils.keyword_matcher import KeywordMatcher
+
+    return KeywordMatcher({
+        'comparison': settings.CONTEXT_COMPARISON_CUES,
+        'explanation': settings.CONTEXT_EXPLANATION_CUES,
+        'implication': settings.CONTEXT_IMPLICATION_CUES,
+    })
+
+
+def _load_ollama_client():
+    from config.settings import settings
+
+    if getattr(settings, 'OLLAMA_ENDPOINTS', None):
+        from src.models.ollama_pool import get_pool
+
+        return get_pool().client()
+
+    from src.models.ollama_client import OllamaClient
+
+    return OllamaClient()
+
+
+# Global registry instance
+registry = ResourceRegistry()
+
+for _package in NLTK_DATA_PATHS:
+    registry.register(f'nltk_data:{_package}', _nltk_data_loader(_package))
+registry.register('punkt', _load_punkt)
+registry.register('word_tokenizer', _load_word_tokenizer)
+registry.register('spacy', _load_spacy)
+registry.register('spacy_docs', _load_spacy_docs)
+registry.register('contextualization_cues', _load_contextualization_cues)
+registry.register('ollama_client', _load_ollama_client)
+
+
+def get_punkt_tokenizer():
+    """Pretrained NLTK punkt sentence tokenizer (loaded once)"""
+    return registry.get('punkt')
+
+
+def get_word_tokenizer():
+    """NLTK Treebank word tokenizer, as used by word_tokenize (built once)"""
+    return registry.get('word_tokenizer')
+
+
+def get_spacy_nlp():
+    """
+    Shared spaCy pipeline
+
+    Returns:
+        The en_core_web_sm pipeline, or None if spaCy or the model is missing
+    """
+    return registry.get('spacy')
+
+
+def get_spacy_docs():
+    """
+    Shared spaCy Doc cache
+
+    Returns:
+        SpacyDocCache over the shared pipeline, or None if spaCy is unavailable
+    """
+    return registry.get('spacy_docs')
+
+
+def get_contextualization_cues():
+    """
+    Comparison / explanation / implication cue matcher (built once from settings)
+
+    Returns:
+        KeywordMatcher over the CONTEXT_*_CUES lists
+    """
+    return registry.get('contextualization_cues')
+
+
+def get_ollama_client():
+    """
+    Shared OllamaClient (created on first use)
+
+    Routed over the connection pool when settings.OLLAMA_ENDPOINTS lists
+    several servers.
+    """
+    return registry.get('ollama_client')
@@ -0,0 +1,180 @@
+"""
+Line-oriented speaker turn parser
+Finds "Name - Title:" / "Name (Title):" turn headers line by line on the raw
+transcript text, in time linear in the input size
+"""
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from src.core.text_ranges import SpeakerTurn, strip_range
+
+logger = logging.getLogger(__name__)
+
+# A turn header's colon must appear within this many characters of the
+# line start; longer prefixes are treated as ordinary text
+MAX_HEADER_LENGTH = 150
+
+# Speaker names are short runs of capitalized name-like words
+MAX_NAME_WORDS = 6
+_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ .'-")
+
+# Separators between name and title in "Name - Title:" headers
+_TITLE_SEPARATORS = (' - ', ' – ', ' — ')
+
+# Bare speaker labels recognized without a title
+_BARE_SPEAKERS = {'operator': 'operator'}
+
+# Standalone headings ("QUESTIONS AND ANSWERS") end the current turn
+MAX_HEADING_LENGTH = 60
+
+
+class SpeakerTurnParser:
+    """
+    Parse speaker turns from raw transcript text
+
+    Each line is inspected once: a line whose first colon (within
+    MAX_HEADER_LENGTH characters) is preceded by "Name - Title" or
+    "Name (Title)" opens a new turn. A turn runs until the next header or
+    standalone heading line. No pattern is applied to more than a bounded
+    prefix of a line, so parsing never backtracks across the document.
+    """
+
+    def __init__(self, role_patterns: Dict[str, str]):
+        """
+        Initialize parser
+
+        Args:
+            role_patterns: Dict of role -> regex matched against speaker titles
+        """
+        self.role_patterns = [
+            (role, re.compile(pattern, re.IGNORECASE))
+            for role, pattern in role_patterns.items()
+        ]
+
+    def parse(self, text: str) -> List[SpeakerTurn]:
+        """
+        Find every speaker turn in text
+
+        Args:
+            text: Raw transcript text (newlines intact)
+
+        Returns:
+            List of SpeakerTurn(speaker, role, start, end) in text order;
+            offsets index into text and exclude surrounding whitespace
+        """
+        turns: List[SpeakerTurn] = []
+        current: Optional[Tuple[str, Optional[str], int]] = None
+
+        position = 0
+        length = len(text)
+
+        while position < length:
+            line_end = text.find('\n', position)
+            if line_end == -1:
+                line_end = length
+
+            header = self._parse_header(text, position, line_end)
+
+            if header is not None or self._is_heading(text, position, line_end):
+                if current is not None:
+                    self._close_turn(turns, text, current, position)
+                    current = None
+
+                if header is not None:
+                    speaker, role, content_start = header
+                    current = (speaker, role, content_start)
+
+            position = line_end + 1
+
+        if current is not None:
+            self._close_turn(turns, text, current, length)
+
+        logger.debug(f"Parsed {len(turns)} speaker turns")
+        return turns
+
+    def _close_turn(
+        self,
+        turns: List[SpeakerTurn],
+        text: str,
+        current: Tuple[str, Optional[str], int],
+        end: int
+    ):
+        """Append the open turn, trimmed of surrounding whitespace"""
+        speaker, role, start = current
+        start, end = strip_range(text, start, end)
+        if end > start:
+            turns.append(SpeakerTurn(speaker, role, start, end))
+
+    def _parse_header(self, text: str, start: int, end: int) -> Optional[Tuple[str, Optional[str], int]]:
+        """
+        Parse a turn header at the start of a line
+
+        Returns:
+            (speaker, role, content_start) or None if the line is not a header
+        """
+        colon = text.find(':', start, min(end, start + MAX_HEADER_LENGTH))
+        if colon == -1:
+            return None
+
+        head = text[start:colon].strip()
+        if not head:
+            return None
+
+        bare_role = _BARE_SPEAKERS.get(head.lower())
+        if bare_role is not None:
+            return head, bare_role, colon + 1
+
+        name, title = self._split_head(head)
+        if name is None or not self._is_name(name):
+            return None
+
+        return name, self.categorize(title), colon + 1
+
+    @staticmethod
+    def _split_head(head: str) -> Tuple[Optional[str], str]:
+        """Split "Name - Title" or "Name (Title)" into (name, title)"""
+        if head.endswith(')'):
+            paren = head.find('(')
+            if paren > 0:
+                return head[:paren].strip(), head[paren + 1:-1].strip()
+
+        for separator in _TITLE_SEPARATORS:
+            index = head.find(separator)
+            if index > 0:
+                title = head[index + len(separator):].strip()
+                return (head[:index].strip(), title) if title else (None, '')
+
+        return None, ''
+
+    @staticmethod
+    def _is_name(name: str) -> bool:
+        """True for a short run of name characters starting with a capital"""
+        if not name or not name[0].isupper():
+            return False
+        if len(name.split()) > MAX_NAME_WORDS:
+            return False
+        return all(char in _NAME_CHARS for char in name)
+
+    @staticmethod
+    def _is_heading(text: str, start: int, end: int) -> bool:
+        """True for a short all-caps line such as "QUESTIONS AND ANSWERS" """
+        if end - start > MAX_HEADING_LENGTH:
+            return False
+        line = text[start:end].strip()
+        return len(line) > 3 and line.isupper() and ':' not in line
+
+    def categorize(self, title: str) -> Optional[str]:
+        """
+        Categorize a speaker by title
+
+        Args:
+            title: Speaker title or affiliation
+
+        Returns:
+            Role key (ceo, cfo, coo, analyst, ...) or None if no role matches
+        """
+        for role, pattern in self.role_patterns:
+            if pattern.search(title):
+                return role
+        return None
@@ -0,0 +1,131 @@
+"""
+Offset-range views over a transcript
+Sections, speakers and speaker turns are stored as (start, end) offsets into
+the cleaned transcript text and only materialized as strings on demand
+"""
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+Range = Tuple[int, int]
+
+
+class SpeakerTurn(NamedTuple):
+    """A single speaker turn located in the transcript text"""
+    speaker: str  # Speaker name as written in the turn header
+    role: Optional[str]  # ceo, cfo, coo, analyst, operator; None if unknown
+    start: int
+    end: int
+
+    @property
+    def key(self) -> str:
+        """Speaker key used to group turns: the role, else the name"""
+        return self.role or self.speaker
+
+
+def strip_range(text: str, start: int, end: int) -> Range:
+    """
+    Shrink a range so it excludes leading and trailing whitespace
+
+    Args:
+        text: Source text
+        start: Range start offset
+        end: Range end offset
+
+    Returns:
+        (start, end) of text[start:end].strip() within text
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+class TextRangeMap(Mapping):
+    """
+    Read-only mapping of name -> text, backed by offset ranges into a source
+
+    Looking up a name joins its ranges with ``joiner`` and caches the
+    string; iterating names, counting entries or reading ranges never
+    copies text.
+    """
+
+    def __init__(self, source: str, ranges: Dict[str, Sequence[Range]], joiner: str = ' '):
+        """
+        Initialize range map
+
+        Args:
+            source: Text the ranges point into
+            ranges: Dict of name -> ordered (start, end) ranges
+            joiner: Separator placed between ranges when materializing
+        """
+        self.source = source
+        self.joiner = joiner
+        self._ranges: Dict[str, List[Range]] = {
+            name: [(start, end) for start, end in spans if end > start]
+            for name, spans in ranges.items()
+        }
+        self._materialized: Dict[str, str] = {}
+
+    @classmethod
+    def from_texts(cls, texts: Mapping, joiner: str = ' ') -> 'TextRangeMap':
+        """
+        Build a range map from already materialized strings
+
+        The strings are laid end to end in a new source; used when a caller
+        supplies plain dicts instead of ranges.
+
+        Args:
+            texts: Dict of name -> text
+
+        Returns:
+            TextRangeMap over the concatenated texts
+        """
+        ranges = {}
+        pieces = []
+        offset = 0
+        for name, text in texts.items():
+            ranges[name] = [(offset, offset + len(text))]
+            pieces.append(text)
+            offset += len(text) + 1
+        return cls('\n'.join(pieces), ranges, joiner)
+
+    def __getitem__(self, name: str) -> str:
+        text = self._materialized.get(name)
+        if text is None:
+            spans = self._ranges[name]
+            text = self.joiner.join(self.source[start:end] for start, end in spans)
+            self._materialized[name] = text
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, name) -> bool:
+        return name in self._ranges
+
+    def __repr__(self) -> str:
+        return f"TextRangeMap({ {name: spans for name, spans in self._ranges.items()} })"
+
+    def ranges(self, name: str) -> List[Range]:
+        """Offset ranges of an entry"""
+        return self._ranges[name]
+
+    def range_items(self) -> Iterator[Tuple[str, List[Range]]]:
+        """Iterate (name, ranges) pairs without materializing text"""
+        return iter(self._ranges.items())
+
+    def has_text(self, name: str) -> bool:
+        """True when the entry exists and covers at least one character"""
+        return bool(self._ranges.get(name))
+
+    def char_count(self, name: str) -> int:
+        """Characters covered by an entry (joiners excluded)"""
+        return sum(end - start for start, end in self._ranges.get(name, ()))
+
+    def release(self):
+        """Drop materialized strings (ranges are kept)"""
+        self._materialized.clear()
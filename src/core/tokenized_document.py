@@ -0,0 +1,285 @@
+"""
+Shared tokenized document
+Tokenizes a transcript once so every analyzer reads the same sentence and token spans
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.utils.text_utils import tokenize_sentence_spans, tokenize_word_spans
+from src.utils.numeric_scanner import NumericIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class TokenizedDocument:
+    """
+    Sentence and token spans for a text, computed in a single pass
+
+    Spans are (start, end) character offsets into ``source``. Tokens are
+    stored in sentence order, so the tokens of sentence ``i`` are
+    ``tokens[sentence_bounds[i]:sentence_bounds[i + 1]]``.
+    """
+    source: str
+    sentence_spans: np.ndarray  # (n_sentences, 2) character offsets
+    token_spans: np.ndarray  # (n_tokens, 2) character offsets
+    sentence_bounds: np.ndarray  # (n_sentences + 1,) token offsets
+    tokens: List[str]  # Tokens exactly as the word tokenizer produced them
+    lower: List[str]  # Lowercased tokens
+    punct: np.ndarray  # True where the token is not alphanumeric
+
+    # Set on range views (see restrict): the (start, end) ranges of source
+    # the view covers. None for a document over the whole of source.
+    ranges: Optional[np.ndarray] = None
+
+    # Set on range views: the document the view was restricted from, and
+    # the (first, last) token offsets into it of each range
+    parent: Optional['TokenizedDocument'] = field(default=None, repr=False)
+    token_ranges: Optional[np.ndarray] = None
+
+    # Derived views, computed on first access
+    _cache: Dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_text(cls, text: str) -> 'TokenizedDocument':
+        """
+        Tokenize text into sentences and words
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            TokenizedDocument over text
+        """
+        sentence_spans = tokenize_sentence_spans(text)
+
+        tokens: List[str] = []
+        token_spans: List[tuple] = []
+        bounds = [0]
+
+        for start, end in sentence_spans:
+            sentence_tokens, spans = tokenize_word_spans(text[start:end])
+            tokens.extend(sentence_tokens)
+            token_spans.extend((start + s, start + e) for s, e in spans)
+            bounds.append(len(tokens))
+
+        logger.debug(f"Tokenized document: {len(sentence_spans)} sentences, {len(tokens)} tokens")
+
+        return cls(
+            source=text,
+            sentence_spans=np.array(sentence_spans, dtype=np.int64).reshape(-1, 2),
+            token_spans=np.array(token_spans, dtype=np.int64).reshape(-1, 2),
+            sentence_bounds=np.array(bounds, dtype=np.int64),
+            tokens=tokens,
+            lower=[token.lower() for token in tokens],
+            punct=np.array([not token.isalnum() for token in tokens], dtype=bool)
+        )
+
+    def restrict(self, ranges: Sequence[Tuple[int, int]]) -> 'TokenizedDocument':
+        """
+        View of the document limited to character ranges of source
+
+        Reuses this document's tokenization: the view holds the tokens that
+        start inside the ranges and the sentences clipped to the ranges, so
+        analyzers can run analyze_document on a section or speaker without
+        re-tokenizing or copying its text.
+
+        Args:
+            ranges: Ordered, non-overlapping (start, end) offsets into source
+
+        Returns:
+            TokenizedDocument sharing source with this document
+        """
+        ranges = np.array([(s, e) for s, e in ranges if e > s], dtype=np.int64).reshape(-1, 2)
+        token_starts = self.token_spans[:, 0]
+
+        # Tokens starting inside each range
+        first = np.searchsorted(token_starts, ranges[:, 0], side='left')
+        last = np.searchsorted(token_starts, ranges[:, 1], side='left')
+        lengths = last - first
+        range_ids = np.repeat(np.arange(len(ranges)), lengths)
+        token_ids = (
+            np.concatenate([np.arange(a, b) for a, b in zip(first.tolist(), last.tolist())])
+            if len(ranges) else np.zeros(0, dtype=np.int64)
+        ).astype(np.int64)
+
+        # A new sentence starts wherever the (range, sentence) pair changes
+        sentence_ids = np.searchsorted(self.sentence_bounds, token_ids, side='right') - 1
+        starts_new = np.ones(len(token_ids), dtype=bool)
+        starts_new[1:] = (sentence_ids[1:] != sentence_ids[:-1]) | (range_ids[1:] != range_ids[:-1])
+        group_starts = np.flatnonzero(starts_new)
+
+        group_sentences = sentence_ids[group_starts]
+        group_ranges = ranges[range_ids[group_starts]] if len(group_starts) else ranges[:0]
+        sentence_spans = np.stack([
+            np.maximum(self.sentence_spans[group_sentences, 0], group_ranges[:, 0]),
+            np.minimum(self.sentence_spans[group_sentences, 1], group_ranges[:, 1]),
+        ], axis=1) if len(group_starts) else np.zeros((0, 2), dtype=np.int64)
+
+        token_list = token_ids.tolist()
+        return TokenizedDocument(
+            source=self.source,
+            sentence_spans=sentence_spans,
+            token_spans=self.token_spans[token_ids],
+            sentence_bounds=np.append(group_starts, len(token_ids)).astype(np.int64),
+            tokens=[self.tokens[i] for i in token_list],
+            lower=[self.lower[i] for i in token_list],
+            punct=self.punct[token_ids],
+            ranges=ranges,
+            parent=self,
+            token_ranges=np.stack([first, last], axis=1).astype(np.int64).reshape(-1, 2)
+        )
+
+    @property
+    def text(self) -> str:
+        """
+        Document text
+
+        The whole source for a full document; for a range view, the covered
+        ranges joined with spaces (materialized on first access).
+        """
+        if self.ranges is None:
+            return self.source
+        if 'text' not in self._cache:
+            self._cache['text'] = ' '.join(self.source[s:e] for s, e in self.ranges.tolist())
+        return self._cache['text']
+
+    @property
+    def sentences(self) -> List[str]:
+        """Sentence strings (cached after first access)"""
+        if 'sentences' not in self._cache:
+            self._cache['sentences'] = [
+                self.source[start:end] for start, end in self.sentence_spans.tolist()
+            ]
+        return self._cache['sentences']
+
+    @property
+    def numeric_index(self) -> NumericIndex:
+        """
+        Numeric mentions of the document, keyed by sentence (scanned once)
+
+        A range view takes its mentions from the parent's index instead of
+        rescanning its text.
+        """
+        if 'numeric_index' not in self._cache:
+            if self.parent is not None:
+                self._cache['numeric_index'] = self.parent.numeric_index.restrict(self.sentence_spans)
+            else:
+                self._cache['numeric_index'] = NumericIndex.build(self.source, self.sentence_spans.tolist())
+        return self._cache['numeric_index']
+
+    def numerical_tokens(self) -> List[tuple]:
+        """
+        Numeric mentions paired with their sentence
+
+        Returns:
+            List of (number, context_sentence) tuples, as extract_numerical_tokens
+        """
+        index = self.numeric_index
+        sentences = self.sentences
+        return [(index.text_of(m), sentences[m.sentence_index]) for m in index.mentions]
+
+    @property
+    def sentence_count(self) -> int:
+        """Number of sentences"""
+        return len(self.sentence_spans)
+
+    @property
+    def token_count(self) -> int:
+        """Number of tokens, punctuation included"""
+        return len(self.tokens)
+
+    @property
+    def word_count(self) -> int:
+        """Number of alphanumeric tokens"""
+        return int(np.count_nonzero(~self.punct))
+
+    def words(self, lowercase: bool = True, remove_punct: bool = False) -> List[str]:
+        """
+        Word tokens, with the same options as tokenize_words
+
+        Args:
+            lowercase: Return lowercased tokens
+            remove_punct: Drop tokens that are not alphanumeric
+
+        Returns:
+            List of words (cached per option combination)
+        """
+        key = ('words', lowercase, remove_punct)
+        if key not in self._cache:
+            source = self.lower if lowercase else self.tokens
+            if remove_punct:
+                self._cache[key] = [w for w, p in zip(source, self.punct.tolist()) if not p]
+            else:
+                self._cache[key] = list(source)
+        return self._cache[key]
+
+    def sentence_words(self, index: int, lowercase: bool = True, remove_punct: bool = False) -> List[str]:
+        """
+        Word tokens of a single sentence
+
+        Args:
+            index: Sentence index
+            lowercase: Return lowercased tokens
+            remove_punct: Drop tokens that are not alphanumeric
+
+        Returns:
+            List of words in the sentence
+        """
+        start, end = int(self.sentence_bounds[index]), int(self.sentence_bounds[index + 1])
+        source = self.lower if lowercase else self.tokens
+        if not remove_punct:
+            return source[start:end]
+        return [source[i] for i in range(start, end) if not self.punct[i]]
+
+    def sentence_token_counts(self, remove_punct: bool = True) -> np.ndarray:
+        """
+        Token count of every sentence
+
+        Args:
+            remove_punct: Count only alphanumeric tokens
+
+        Returns:
+            Integer array with one count per sentence
+        """
+        key = ('sentence_token_counts', remove_punct)
+        if key not in self._cache:
+            if remove_punct:
+                cumulative = np.concatenate(([0], np.cumsum(~self.punct)))
+                self._cache[key] = cumulative[self.sentence_bounds[1:]] - cumulative[self.sentence_bounds[:-1]]
+            else:
+                self._cache[key] = np.diff(self.sentence_bounds)
+        return self._cache[key]
+
+
+def as_document(text: Union[str, TokenizedDocument]) -> TokenizedDocument:
+    """
+    Accept either raw text or an already tokenized document
+
+    Args:
+        text: Text or TokenizedDocument
+
+    Returns:
+        TokenizedDocument (tokenizing text only when needed)
+    """
+    if isinstance(text, TokenizedDocument):
+        return text
+    return TokenizedDocument.from_text(text)
+
+
+def is_blank(text: Union[str, TokenizedDocument]) -> bool:
+    """
+    True when text or a document has nothing to analyze
+
+    Args:
+        text: Text or TokenizedDocument
+
+    Returns:
+        True for whitespace-only text or a document without tokens
+    """
+    if isinstance(text, TokenizedDocument):
+        return text.token_count == 0
+    return not text.strip()
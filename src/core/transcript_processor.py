@@ -4,11 +4,14 @@ Enhanced with tokenization caching for performance
 """
 import re
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from functools import cached_property
-from src.utils.text_utils import clean_text, tokenize_sentences, tokenize_words
+from src.utils.text_utils import clean_text
+from src.core.tokenized_document import TokenizedDocument
+from src.core.text_ranges import SpeakerTurn, TextRangeMap, strip_range
+from src.core.speaker_parser import SpeakerTurnParser
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -30,32 +33,92 @@ class ProcessedTranscript:
     """
     Processed transcript with metadata and cached tokenization
 
-    Uses cached properties to avoid redundant tokenization operations
+    Uses cached properties to avoid redundant tokenization operations.
+    Sections and speakers are offset ranges into cleaned_text; their text
+    is only materialized when looked up.
     """
     raw_text: str
     cleaned_text: str
     metadata: TranscriptMetadata
-    speakers: Dict[str, str]  # speaker_name -> full text
-    sections: Dict[str, str]  # section_name -> full text
+    speakers: TextRangeMap  # speaker_name -> text (ranges of cleaned_text)
+    sections: TextRangeMap  # section_name -> text (ranges of cleaned_text)
+
+    # Speaker turns in transcript order
+    turns: List[SpeakerTurn] = field(default_factory=list, repr=False, compare=False)
+
+    # Shared tokenization of cleaned_text (built by TranscriptProcessor.process,
+    # otherwise on first access)
+    _document: Optional[TokenizedDocument] = field(default=None, repr=False, compare=False)
 
     # Cached tokenization (computed on first access)
     _sentences: Optional[List[str]] = field(default=None, repr=False, compare=False)
     _words: Optional[List[str]] = field(default=None, repr=False, compare=False)
 
+    def __post_init__(self):
+        # Accept plain name -> text dicts for sections and speakers
+        if not isinstance(self.speakers, TextRangeMap):
+            self.speakers = TextRangeMap.from_texts(self.speakers)
+        if not isinstance(self.sections, TextRangeMap):
+            self.sections = TextRangeMap.from_texts(self.sections)
+
+    @property
+    def document(self) -> TokenizedDocument:
+        """Get the tokenized document shared by all analyzers"""
+        if self._document is None:
+            logger.debug("Tokenizing document (first access)")
+            self._document = TokenizedDocument.from_text(self.cleaned_text)
+        return self._document
+
+    def section_documents(self) -> Dict[str, TokenizedDocument]:
+        """
+        Range views of the shared document, one per non-empty section
+
+        Returns:
+            Dict of section_name -> TokenizedDocument view
+        """
+        return self._range_documents('sections', self.sections)
+
+    def speaker_documents(self) -> Dict[str, TokenizedDocument]:
+        """
+        Range views of the shared document, one per speaker with text
+
+        Returns:
+            Dict of speaker_name -> TokenizedDocument view
+        """
+        return self._range_documents('speakers', self.speakers)
+
+    def _range_documents(self, key: str, range_map: TextRangeMap) -> Dict[str, TokenizedDocument]:
+        """Build (once) the document views of a range map"""
+        cache = self.document._cache
+        cache_key = ('range_documents', key)
+        if cache_key not in cache:
+            if range_map.source is self.cleaned_text:
+                cache[cache_key] = {
+                    name: self.document.restrict(ranges)
+                    for name, ranges in range_map.range_items()
+                    if ranges
+                }
+            else:
+                # Ranges point into some other text; tokenize each entry
+                cache[cache_key] = {
+                    name: TokenizedDocument.from_text(range_map[name])
+                    for name, ranges in range_map.range_items()
+                    if ranges
+                }
+        return cache[cache_key]
+
     @property
     def sentences(self) -> List[str]:
         """Get sentences (cached after first access)"""
         if self._sentences is None:
-            logger.debug("Tokenizing sentences (first access)")
-            self._sentences = tokenize_sentences(self.cleaned_text)
+            self._sentences = self.document.sentences
         return self._sentences
 
     @property
     def words(self) -> List[str]:
         """Get words (cached after first access)"""
         if self._words is None:
-            logger.debug("Tokenizing words (first access)")
-            self._words = tokenize_words(self.cleaned_text)
+            self._words = self.document.words()
         return self._words
 
     @property
@@ -83,6 +146,7 @@ class TranscriptProcessor:
             'coo': r'(?:Chief Operating Officer|COO)',
             'analyst': r'(?:Analyst)',
         }
+        self.speaker_parser = SpeakerTurnParser(self.speaker_patterns)
     
     def validate_file(self, file_path: str) -> None:
         """
@@ -224,33 +288,71 @@ class TranscriptProcessor:
         Identify and extract speaker segments
         
         Args:
-            text: Cleaned transcript text
+            text: Transcript text (raw, with line breaks)
             
         Returns:
             Dict mapping speaker names to their text segments
         """
         speakers = {}
         
-        # Pattern: "Speaker Name (Title): text"
-        # or "Speaker Name - Title: text"
-        speaker_pattern = r'([A-Z][a-zA-Z\s\.]+?)(?:\s*[-–]\s*|\s*\()(.*?)(?:\)|:)\s*([^\n]+(?:\n(?![A-Z][a-zA-Z\s\.]+?(?:\s*[-–]\s*|\s*\()[^\n]*).)*)'
+        for turn in self.identify_speaker_turns(text):
+            speakers.setdefault(turn.key, []).append(text[turn.start:turn.end])
         
-        matches = re.finditer(speaker_pattern, text, re.MULTILINE)
+        return speakers
+    
+    def identify_speaker_turns(self, text: str) -> List[SpeakerTurn]:
+        """
+        Locate speaker turns as offset ranges
         
-        for match in matches:
-            speaker_name = match.group(1).strip()
-            title = match.group(2).strip() if match.group(2) else ""
-            content = match.group(3).strip()
+        Headers are recognized line by line ("Name - Title: text" or
+        "Name (Title): text"), so this should run on the raw text before
+        clean_text collapses line breaks.
+        
+        Args:
+            text: Transcript text (raw, with line breaks)
             
-            # Categorize speaker
-            speaker_key = self._categorize_speaker(speaker_name, title)
+        Returns:
+            List of SpeakerTurn(speaker, role, start, end) in text order
+        """
+        return self.speaker_parser.parse(text)
+    
+    def align_turns(
+        self,
+        turns: List[SpeakerTurn],
+        raw_text: str,
+        cleaned_text: str
+    ) -> List[SpeakerTurn]:
+        """
+        Map turns found in raw_text onto offsets of cleaned_text
+        
+        Each turn's content is cleaned the same way as the full text and
+        located with a forward-only search, so alignment is linear overall.
+        
+        Args:
+            turns: Turns with offsets into raw_text
+            raw_text: Text the turns were parsed from
+            cleaned_text: clean_text(raw_text)
             
-            if speaker_key not in speakers:
-                speakers[speaker_key] = []
+        Returns:
+            Turns with offsets into cleaned_text (unlocatable turns dropped)
+        """
+        aligned = []
+        cursor = 0
+        
+        for turn in turns:
+            content = clean_text(raw_text[turn.start:turn.end])
+            if not content:
+                continue
+            
+            start = cleaned_text.find(content, cursor)
+            if start == -1:
+                logger.debug(f"Could not align turn of {turn.speaker} at {turn.start}")
+                continue
             
-            speakers[speaker_key].append(content)
+            cursor = start + len(content)
+            aligned.append(turn._replace(start=start, end=cursor))
         
-        return speakers
+        return aligned
     
     def _categorize_speaker(self, name: str, title: str) -> str:
         """
@@ -263,14 +365,8 @@ class TranscriptProcessor:
         Returns:
             Categorized speaker key (ceo, cfo, analyst, etc.)
         """
-        title_lower = title.lower()
-        
-        for role, pattern in self.speaker_patterns.items():
-            if re.search(pattern, title, re.IGNORECASE):
-                return role
-        
         # Default to name if no role match
-        return name
+        return self.speaker_parser.categorize(title) or name
     
     def split_sections(self, text: str) -> Dict[str, str]:
         """
@@ -282,8 +378,21 @@ class TranscriptProcessor:
         Returns:
             Dict with section names and content
         """
-        sections = {}
+        return {
+            name: text[start:end]
+            for name, (start, end) in self.split_section_ranges(text).items()
+        }
+    
+    def split_section_ranges(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Locate transcript sections (prepared remarks, Q&A) as offset ranges
         
+        Args:
+            text: Cleaned transcript text
+            
+        Returns:
+            Dict of section name -> (start, end) offsets into text
+        """
         # Look for common section markers
         qa_patterns = [
             r'Question[s]?\s+(?:and|&)\s+Answer[s]?',
@@ -300,14 +409,16 @@ class TranscriptProcessor:
                 break
         
         if qa_start:
-            sections['prepared_remarks'] = text[:qa_start].strip()
-            sections['qa'] = text[qa_start:].strip()
-        else:
-            # If no clear Q&A section, treat entire text as prepared remarks
-            sections['prepared_remarks'] = text
-            sections['qa'] = ""
+            return {
+                'prepared_remarks': strip_range(text, 0, qa_start),
+                'qa': strip_range(text, qa_start, len(text))
+            }
         
-        return sections
+        # If no clear Q&A section, treat entire text as prepared remarks
+        return {
+            'prepared_remarks': (0, len(text)),
+            'qa': (len(text), len(text))
+        }
     
     def process(self, file_path: str) -> ProcessedTranscript:
         """
@@ -331,26 +442,32 @@ class TranscriptProcessor:
         cleaned_text = clean_text(raw_text)
         logger.debug(f"Cleaned text: {len(cleaned_text)} chars")
 
-        # Identify speakers and sections (no tokenization yet - that's lazy)
-        speakers = self.identify_speakers(cleaned_text)
-        sections = self.split_sections(cleaned_text)
-        logger.debug(f"Found {len(speakers)} speakers, {len(sections)} sections")
+        # Tokenize once; every analyzer reuses these spans
+        document = TokenizedDocument.from_text(cleaned_text)
+        logger.debug(f"Tokenized {document.sentence_count} sentences, {document.token_count} tokens")
 
-        # Convert speaker lists to concatenated strings
-        speaker_texts = {
-            name: ' '.join(segments)
-            for name, segments in speakers.items()
-        }
+        # Parse speaker turns on the raw lines, then express them (and the
+        # sections) as ranges of cleaned_text
+        turns = self.align_turns(self.identify_speaker_turns(raw_text), raw_text, cleaned_text)
+        speaker_ranges: Dict[str, List[Tuple[int, int]]] = {}
+        for turn in turns:
+            speaker_ranges.setdefault(turn.key, []).append((turn.start, turn.end))
+
+        section_ranges = self.split_section_ranges(cleaned_text)
+        logger.debug(f"Found {len(speaker_ranges)} speakers, {len(section_ranges)} sections")
 
-        # Create transcript with lazy tokenization
-        # Note: sentences, words, word_count, sentence_count are now properties
-        # that are computed on first access
+        # Note: sentences, words, word_count, sentence_count are properties
+        # backed by the shared document
         return ProcessedTranscript(
             raw_text=raw_text,
             cleaned_text=cleaned_text,
             metadata=metadata,
-            speakers=speaker_texts,
-            sections=sections
+            speakers=TextRangeMap(cleaned_text, speaker_ranges),
+            sections=TextRangeMap(cleaned_text, {
+                name: [span] for name, span in section_ranges.items()
+            }),
+            turns=turns,
+            _document=document
         )
     
     def validate_transcript(self, transcript: ProcessedTranscript) -> List[str]:
@@ -385,7 +502,7 @@ class TranscriptProcessor:
             warnings.append("No speakers identified. Results may be less accurate.")
         
         # Check for section split
-        if not transcript.sections.get('qa'):
+        if not transcript.sections.has_text('qa'):
             warnings.append("No Q&A section identified. May affect analysis.")
         
         return warnings
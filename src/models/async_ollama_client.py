@@ -0,0 +1,367 @@
+"""
+Asynchronous Ollama client
+Sends many LLM requests concurrently, with a bounded number in flight, using
+the same prompts, JSON parsing and fallbacks as OllamaClient
+"""
+import asyncio
+import logging
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from config.settings import settings
+from src.models.ollama_client import OllamaClient, cached_response, request_key, store_response
+from src.models.ollama_pool import OllamaConnectionPool, RoutedOllamaClient
+from src.utils.adaptive_limit import AdaptiveLimit, AsyncAdaptiveLimiter
+from src.utils.retry import exponential_backoff_retry
+from src.utils.single_flight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by every async client, running on a daemon thread"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='ollama-async', daemon=True).start()
+        return _loop
+
+
+class AsyncOllamaClient:
+    """
+    Ollama client for concurrent requests
+
+    A semaphore caps the requests in flight at max_concurrency, or, when
+    adaptive, a limit that starts there and follows the observed latency
+    and errors (see AdaptiveLimit); requests waiting for a retry do not
+    hold a slot, and identical requests in flight
+    at the same time share one call. Responses go through the same
+    persistent prompt cache as OllamaClient. Coroutines run on one shared
+    background event loop, so synchronous analyzers fan out with run_all()
+    without managing a loop of their own.
+
+    A client built around a connection pool (pool) sends each request to the
+    endpoint the pool picks, taking its slot from the pool, so the pool's
+    limit, adaptive or pool_size + max_overflow, is the only cap on the
+    fan-out and max_concurrency is not used.
+
+    A client built around a synchronous one (sync_client) runs that
+    client's blocking methods on worker threads under a fixed semaphore,
+    which keeps subclasses and stand-ins of OllamaClient working (their
+    latency includes retries and cache hits, so it does not drive a limit).
+    """
+
+    _wrapped: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    _wrapped_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: str = None,
+        timeout: int = None,
+        max_retries: int = 3,
+        max_concurrency: int = None,
+        sync_client: Any = None,
+        use_cache: bool = True,
+        adaptive: bool = None,
+        pool: OllamaConnectionPool = None
+    ):
+        """
+        Initialize async Ollama client
+
+        Args:
+            host: Ollama server URL
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts (default: 3)
+            max_concurrency: Requests in flight at once (default: settings.LLM_MAX_CONCURRENCY)
+            sync_client: Synchronous client to delegate to instead of calling Ollama directly
+            use_cache: Answer repeated prompts from the persistent prompt cache
+                (a delegating client leaves caching to sync_client)
+            adaptive: Adapt the concurrency limit to latency
+                (default: settings.LLM_ADAPTIVE_CONCURRENCY; never for a delegating
+                or pooled client, the pool has its own limit)
+            pool: Connection pool to route requests through and take slots from
+        """
+        if pool is not None:
+            host = 'pool:' + ','.join(endpoint.url for endpoint in pool.endpoints)
+        self.host = host or getattr(sync_client, 'host', None) or settings.OLLAMA_HOST
+        self.timeout = timeout or settings.OLLAMA_TIMEOUT
+        self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency or settings.LLM_MAX_CONCURRENCY)
+        self.sync_client = sync_client
+        self.pool = pool
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._limiter: Optional[AsyncAdaptiveLimiter] = None
+        if adaptive is None:
+            adaptive = getattr(settings, 'LLM_ADAPTIVE_CONCURRENCY', False)
+        if adaptive and sync_client is None and pool is None:
+            self._limiter = AsyncAdaptiveLimiter(
+                AdaptiveLimit('llm_concurrency', initial_limit=self.max_concurrency)
+            )
+        self._inflight = AsyncSingleFlight('llm_requests')
+
+        self.client = None
+        self._endpoint_clients: Dict[str, Any] = {}
+        self.cache = None
+        if sync_client is None:
+            # Imported here so importing this module stays cheap
+            import ollama
+            if pool is None:
+                self.client = ollama.AsyncClient(host=self.host, timeout=self.timeout)
+            else:
+                self._endpoint_clients = {
+                    endpoint.url: ollama.AsyncClient(host=endpoint.url, timeout=self.timeout)
+                    for endpoint in pool.endpoints
+                }
+            if use_cache:
+                from src.cache.prompt_cache import get_prompt_cache
+                self.cache = get_prompt_cache()
+        if pool is not None:
+            concurrency = f"pool limit={pool._capacity()}, adaptive={pool.limiter is not None}"
+        else:
+            concurrency = f"max_concurrency={self.max_concurrency}, adaptive={self._limiter is not None}"
+        logger.info(f"Initialized async Ollama client: {self.host}, {concurrency}")
+
+    @classmethod
+    def for_client(cls, client: Any) -> 'AsyncOllamaClient':
+        """
+        Async counterpart of a synchronous client (one per client)
+
+        A plain OllamaClient gets a native async client for the same host,
+        a RoutedOllamaClient one for the same pool; anything else (subclasses, fakes, test doubles) is delegated to.
+
+        Args:
+            client: Synchronous client
+
+        Returns:
+            AsyncOllamaClient
+        """
+        with cls._wrapped_lock:
+            async_client = cls._wrapped.get(client)
+            if async_client is None:
+                if type(client) is OllamaClient:
+                    async_client = cls(
+                        client.host, client.timeout, client.max_retries,
+                        use_cache=client.cache is not None
+                    )
+                elif type(client) is RoutedOllamaClient:
+                    async_client = cls(
+                        timeout=client.timeout, max_retries=client.max_retries,
+                        use_cache=client.cache is not None, pool=client.pool
+                    )
+                else:
+                    async_client = cls(sync_client=client)
+                cls._wrapped[client] = async_client
+            return async_client
+
+    # ----- running coroutines from synchronous code -----
+
+    def run(self, coroutine: Awaitable) -> Any:
+        """
+        Run a coroutine on the shared event loop and wait for its result
+
+        Raises:
+            RuntimeError: If called from a coroutine running on that loop
+        """
+        loop = _background_loop()
+        if asyncio._get_running_loop() is loop:
+            coroutine.close()
+            raise RuntimeError("AsyncOllamaClient.run() called from its own event loop; await instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def run_all(self, coroutines: Iterable[Awaitable], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run coroutines concurrently and wait for all of them
+
+        Args:
+            coroutines: Coroutines to run
+            return_exceptions: Return exceptions in place of results instead of raising
+
+        Returns:
+            Results in the order of coroutines
+        """
+        coroutines = list(coroutines)
+        if not coroutines:
+            return []
+
+        async def gather():
+            return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+        return self.run(gather())
+
+    # ----- requests -----
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one request slot, yielding the ollama.AsyncClient to send the request with"""
+        if self.pool is not None:
+            async with self.pool.endpoint_slot() as endpoint:
+                yield self._endpoint_clients[endpoint.url]
+        elif self._limiter is not None:
+            async with self._limiter.slot():
+                yield self.client
+        else:
+            async with self._semaphore:
+                yield self.client
+
+    async def _call(self, method: Callable, *args) -> Any:
+        """Run a blocking client method on a worker thread, holding a slot"""
+        async with self._semaphore:
+            return await asyncio.to_thread(method, *args)
+
+    async def generate(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = None,
+        max_tokens: int = None,
+        json_mode: bool = False
+    ) -> str:
+        """
+        Generate completion from Ollama model with retry logic
+
+        Args:
+            model: Model name (e.g., 'llama3.1:8b')
+            prompt: User prompt
+            system_prompt: System instructions
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            json_mode: Whether to request JSON output
+
+        Returns:
+            Generated text or JSON string
+
+        Raises:
+            RuntimeError: If generation fails after all retries
+        """
+        if self.sync_client is not None:
+            return await self._call(
+                self.sync_client.generate, model, prompt, system_prompt, temperature, max_tokens, json_mode
+            )
+
+        temperature = temperature or settings.LLM_TEMPERATURE
+        max_tokens = max_tokens or settings.LLM_MAX_TOKENS
+        request = request_key(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+        # SQLite lookups take microseconds, so they run on the loop directly
+        cached = cached_response(self.cache, request)
+        if cached is not None:
+            return cached
+        return await self._inflight.do(request, self._fetch, request)
+
+    async def _fetch(self, request: tuple) -> str:
+        """Send a request to Ollama and cache the response"""
+        model, system_prompt, prompt, temperature, max_tokens, json_mode = request
+        response = await self._chat(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+        store_response(self.cache, request, response)
+        return response
+
+    @exponential_backoff_retry(
+        max_attempts=3,
+        initial_delay=2.0,
+        exceptions=(ConnectionError, TimeoutError, RuntimeError),
+        log_attempts=True
+    )
+    async def _chat(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool
+    ) -> str:
+        """One chat request to the Ollama server"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        options = {
+            "temperature": temperature,
+            "num_predict": max_tokens,
+        }
+
+        async with self._slot() as client:
+            try:
+                logger.debug(f"Calling Ollama (async): model={model}, json_mode={json_mode}")
+                response = await client.chat(
+                    model=model,
+                    messages=messages,
+                    options=options,
+                    format="json" if json_mode else ''
+                )
+                content = response['message']['content']
+                logger.debug(f"Ollama response received: {len(content)} chars")
+                return content
+
+            except ConnectionError as e:
+                logger.error(f"Connection error to Ollama: {e}")
+                raise RuntimeError(f"Cannot connect to Ollama at {self.host}: {str(e)}")
+            except (TimeoutError, asyncio.TimeoutError) as e:
+                logger.error(f"Ollama request timed out: {e}")
+                raise RuntimeError(f"Ollama request timed out after {self.timeout}s: {str(e)}")
+            except KeyError as e:
+                logger.error(f"Invalid Ollama response format: {e}")
+                raise RuntimeError(f"Invalid response from Ollama: missing {str(e)}")
+            except Exception as e:
+                logger.error(f"Ollama generation failed: {e}", exc_info=True)
+                raise RuntimeError(f"Ollama generation failed: {str(e)}")
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment (see OllamaClient.analyze_sentiment)
+
+        Returns:
+            Dict with sentiment label and confidence (neutral fallback on failure)
+        """
+        if self.sync_client is not None:
+            return await self._call(self.sync_client.analyze_sentiment, text)
+        try:
+            response = await self.generate(**OllamaClient._sentiment_request(text))
+            return OllamaClient._parse_sentiment(response)
+        except Exception as e:
+            return OllamaClient._sentiment_failure(e)
+
+    async def assess_contextualization(self, number: str, context: str) -> Dict[str, Any]:
+        """
+        Assess how well a number is contextualized (see OllamaClient.assess_contextualization)
+
+        Raises:
+            RuntimeError: If the LLM call fails
+        """
+        if self.sync_client is not None:
+            return await self._call(self.sync_client.assess_contextualization, number, context)
+        response = await self.generate(**OllamaClient._contextualization_request(number, context))
+        return OllamaClient._parse_contextualization(response)
+
+    async def assess_contextualization_batch(self, numbers: List[str], context: str) -> List[Dict[str, Any]]:
+        """
+        Assess every number of a sentence with one prompt
+        (see OllamaClient.assess_contextualization_batch)
+
+        Raises:
+            RuntimeError: If the LLM call fails
+        """
+        if self.sync_client is not None:
+            return await self._call(self.sync_client.assess_contextualization_batch, numbers, context)
+        response = await self.generate(**OllamaClient._contextualization_batch_request(numbers, context))
+        return OllamaClient._parse_contextualization_batch(response, len(numbers))
+
+    async def score_relevance(self, question: str, response: str) -> float:
+        """
+        Score how well a response addresses a question (see OllamaClient.score_relevance)
+
+        Raises:
+            RuntimeError: If the LLM call fails
+            ValueError: If the response is not valid JSON
+        """
+        if self.sync_client is not None:
+            return await self._call(self.sync_client.score_relevance, question, response)
+        result = await self.generate(**OllamaClient._relevance_request(question, response))
+        return OllamaClient._parse_relevance(result)
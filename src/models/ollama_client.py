@@ -5,17 +5,100 @@ Enhanced with retry logic and comprehensive error handling
 import json
 import logging
 from typing import Dict, Any, List, Optional
-import ollama
 from config.settings import settings
 from src.utils.retry import exponential_backoff_retry, with_fallback
+from src.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Identical requests in flight at the same time (from any client on the
+# same host) share one call to Ollama
+_inflight = SingleFlight('llm_requests')
+
+CONTEXTUALIZATION_SYSTEM_PROMPT = """You are a financial communication analyst.
+        Assess whether numbers in earnings calls are well-contextualized.
+        
+        A well-contextualized number should have:
+        1. Comparison (vs prior period, target, benchmark)
+        2. Explanation (driver or reason)
+        3. Implication (what it means for the business)"""
+
+RELEVANCE_SYSTEM_PROMPT = """You are an expert analyst evaluating earnings call Q&A sessions.
+Your task is to determine how well a management response addresses an analyst's question."""
+
+
+def request_key(
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    json_mode: bool
+) -> tuple:
+    """Identity of a generate() request (with defaults already applied)"""
+    return (model, system_prompt or '', prompt, temperature, max_tokens, bool(json_mode))
+
+
+def cached_response(cache, request: tuple) -> Optional[str]:
+    """
+    Response to a request from the prompt cache, counting hits and misses
+
+    Args:
+        cache: PromptCache, or None when caching is off
+        request: request_key() tuple
+
+    Returns:
+        The cached response, or None
+    """
+    if cache is None or not cache.enabled:
+        return None
+
+    from src.utils.performance import get_monitor
+
+    response = cache.get(cache.make_key(request))
+    get_monitor().increment('llm_cache_hits' if response is not None else 'llm_cache_misses')
+    return response
+
+
+def store_response(cache, request: tuple, response: str) -> None:
+    """
+    Save a response in the prompt cache
+
+    JSON-mode responses that are not valid JSON are not stored, so a
+    malformed answer is asked for again next time instead of pinning the
+    fallback result.
+    """
+    if cache is None or not cache.enabled:
+        return
+
+    if request[-1]:
+        try:
+            json.loads(response)
+        except (TypeError, ValueError):
+            return
+    cache.set(cache.make_key(request), request[0], response)
+
+
+class FallbackAssessment(dict):
+    """
+    Neutral default standing in for a result the LLM did not give
+
+    Compares equal to the plain default dict; callers check for this type
+    to avoid caching a result that only reflects a failed call or a
+    malformed response.
+    """
+
 
 class OllamaClient:
     """Wrapper for Ollama API interactions"""
     
-    def __init__(self, host: str = None, timeout: int = None, max_retries: int = 3):
+    def __init__(
+        self,
+        host: str = None,
+        timeout: int = None,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ):
         """
         Initialize Ollama client
 
@@ -23,19 +106,21 @@ class OllamaClient:
             host: Ollama server URL
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts (default: 3)
+            use_cache: Answer repeated prompts from the persistent prompt cache
         """
         self.host = host or settings.OLLAMA_HOST
         self.timeout = timeout or settings.OLLAMA_TIMEOUT
         self.max_retries = max_retries
+        self.cache = None
+        if use_cache:
+            from src.cache.prompt_cache import get_prompt_cache
+            self.cache = get_prompt_cache()
+
+        # Imported here so importing this module stays cheap
+        import ollama
         self.client = ollama.Client(host=self.host)
         logger.info(f"Initialized Ollama client: {self.host}, max_retries={max_retries}")
     
-    @exponential_backoff_retry(
-        max_attempts=3,
-        initial_delay=2.0,
-        exceptions=(ConnectionError, TimeoutError, RuntimeError),
-        log_attempts=True
-    )
     def generate(
         self,
         model: str,
@@ -48,6 +133,11 @@ class OllamaClient:
         """
         Generate completion from Ollama model with retry logic
 
+        Responses are cached by model, prompts and options, so a repeated
+        request is answered without calling Ollama. Concurrent calls with the
+        same host, model, prompts and options are coalesced into a single
+        request whose result they all receive.
+
         Args:
             model: Model name (e.g., 'llama3.1:8b')
             prompt: User prompt
@@ -65,6 +155,47 @@ class OllamaClient:
         temperature = temperature or settings.LLM_TEMPERATURE
         max_tokens = max_tokens or settings.LLM_MAX_TOKENS
 
+        request = request_key(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+        cached = cached_response(self.cache, request)
+        if cached is not None:
+            return cached
+        return _inflight.do((self.host,) + request, self._fetch, request)
+
+    def _fetch(self, request: tuple) -> str:
+        """Send a request to Ollama and cache the response"""
+        model, system_prompt, prompt, temperature, max_tokens, json_mode = request
+        response = self._generate(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+        store_response(self.cache, request, response)
+        return response
+
+    @exponential_backoff_retry(
+        max_attempts=3,
+        initial_delay=2.0,
+        exceptions=(ConnectionError, TimeoutError, RuntimeError),
+        log_attempts=True
+    )
+    def _generate(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool
+    ) -> str:
+        """_chat with retries"""
+        return self._chat(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+
+    def _chat(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool
+    ) -> str:
+        """One chat request to the Ollama server"""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -113,6 +244,15 @@ class OllamaClient:
         Returns:
             Dict with sentiment label and confidence
         """
+        try:
+            response = self.generate(**self._sentiment_request(text))
+            return self._parse_sentiment(response)
+        except Exception as e:
+            return self._sentiment_failure(e)
+
+    @staticmethod
+    def _sentiment_request(text: str) -> Dict[str, Any]:
+        """generate() arguments for sentiment analysis of a segment"""
         system_prompt = """You are a financial sentiment analyzer.
         Analyze the sentiment of earnings call transcript segments.
         Classify as: Positive, Negative, or Neutral.
@@ -129,31 +269,36 @@ Respond in JSON format:
     "reasoning": "brief explanation"
 }}"""
 
-        try:
-            response = self.generate(
-                model=settings.SENTIMENT_MODEL,
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                json_mode=True
-            )
-
-            result = json.loads(response)
-
-            # Validate response structure
-            self._validate_sentiment_response(result)
-            return result
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse LLM JSON response: {e}")
-            return self._neutral_sentiment_fallback("JSON parse error")
-        except RuntimeError as e:
-            logger.warning(f"LLM call failed: {e}")
-            return self._neutral_sentiment_fallback("LLM unavailable")
-        except Exception as e:
-            logger.error(f"Unexpected error in sentiment analysis: {e}", exc_info=True)
-            return self._neutral_sentiment_fallback("Unexpected error")
+        return {
+            'model': settings.SENTIMENT_MODEL,
+            'prompt': user_prompt,
+            'system_prompt': system_prompt,
+            'json_mode': True,
+        }
 
-    def _validate_sentiment_response(self, result: Dict[str, Any]) -> None:
+    @classmethod
+    def _parse_sentiment(cls, response: str) -> Dict[str, Any]:
+        """Parse and validate a sentiment response (raises on malformed JSON)"""
+        result = json.loads(response)
+
+        # Validate response structure
+        cls._validate_sentiment_response(result)
+        return result
+
+    @classmethod
+    def _sentiment_failure(cls, error: Exception) -> Dict[str, Any]:
+        """Neutral fallback for a failed sentiment call, by kind of failure"""
+        if isinstance(error, json.JSONDecodeError):
+            logger.warning(f"Failed to parse LLM JSON response: {error}")
+            return cls._neutral_sentiment_fallback("JSON parse error")
+        if isinstance(error, RuntimeError):
+            logger.warning(f"LLM call failed: {error}")
+            return cls._neutral_sentiment_fallback("LLM unavailable")
+        logger.error(f"Unexpected error in sentiment analysis: {error}", exc_info=error)
+        return cls._neutral_sentiment_fallback("Unexpected error")
+
+    @staticmethod
+    def _validate_sentiment_response(result: Dict[str, Any]) -> None:
         """Validate sentiment analysis response"""
         required_keys = ['sentiment', 'confidence']
         for key in required_keys:
@@ -168,14 +313,15 @@ Respond in JSON format:
             logger.warning(f"Invalid confidence: {result['confidence']}, clamping to [0,1]")
             result['confidence'] = max(0.0, min(1.0, result['confidence']))
 
-    def _neutral_sentiment_fallback(self, reason: str) -> Dict[str, Any]:
+    @staticmethod
+    def _neutral_sentiment_fallback(reason: str) -> Dict[str, Any]:
         """Return neutral sentiment as fallback"""
         logger.info(f"Using neutral sentiment fallback: {reason}")
-        return {
+        return FallbackAssessment({
             "sentiment": "Neutral",
             "confidence": 0.5,
             "reasoning": f"Fallback due to: {reason}"
-        }
+        })
     
     def assess_contextualization(self, number: str, context: str) -> Dict[str, Any]:
         """
@@ -188,14 +334,12 @@ Respond in JSON format:
         Returns:
             Dict with contextualization score and components
         """
-        system_prompt = """You are a financial communication analyst.
-        Assess whether numbers in earnings calls are well-contextualized.
-        
-        A well-contextualized number should have:
-        1. Comparison (vs prior period, target, benchmark)
-        2. Explanation (driver or reason)
-        3. Implication (what it means for the business)"""
-        
+        response = self.generate(**self._contextualization_request(number, context))
+        return self._parse_contextualization(response)
+    
+    @staticmethod
+    def _contextualization_request(number: str, context: str) -> Dict[str, Any]:
+        """generate() arguments for assessing one number"""
         user_prompt = f"""Assess the contextualization of this number:
 
 Number: {number}
@@ -215,34 +359,162 @@ Respond in JSON:
     "category": "Well-Contextualized|Moderately Contextualized|Minimally Contextualized|Undercontextualized"
 }}"""
         
-        response = self.generate(
-            model=settings.CONTEXTUALIZATION_MODEL,
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            json_mode=True
-        )
-        
+        return {
+            'model': settings.CONTEXTUALIZATION_MODEL,
+            'prompt': user_prompt,
+            'system_prompt': CONTEXTUALIZATION_SYSTEM_PROMPT,
+            'json_mode': True,
+        }
+    
+    @classmethod
+    def _parse_contextualization(cls, response: str) -> Dict[str, Any]:
+        """Parse a contextualization response (neutral default if malformed)"""
         try:
-            result = json.loads(response)
-            return result
+            return json.loads(response)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse contextualization response: {e}")
-            return {
-                "has_comparison": 0.5,
-                "has_explanation": 0.5,
-                "has_implication": 0.5,
-                "overall_score": 1.5,
-                "category": "Moderately Contextualized"
-            }
+            return cls._default_contextualization()
         except Exception as e:
             logger.error(f"Contextualization analysis failed: {e}")
-            return {
-                "has_comparison": 0.5,
-                "has_explanation": 0.5,
-                "has_implication": 0.5,
-                "overall_score": 1.5,
-                "category": "Moderately Contextualized"
-            }
+            return cls._default_contextualization()
+    
+    def assess_contextualization_batch(self, numbers: List[str], context: str) -> List[Dict[str, Any]]:
+        """
+        Assess the contextualization of every number in one sentence with a single prompt
+        
+        Args:
+            numbers: Numerical values occurring in the sentence (in order)
+            context: The sentence
+            
+        Returns:
+            One assessment dict per number, in the order of numbers
+            (the neutral default for any the model did not score)
+        """
+        response = self.generate(**self._contextualization_batch_request(numbers, context))
+        return self._parse_contextualization_batch(response, len(numbers))
+    
+    @staticmethod
+    def _contextualization_batch_request(numbers: List[str], context: str) -> Dict[str, Any]:
+        """generate() arguments for assessing all numbers of a sentence"""
+        user_prompt = f"""Assess the contextualization of each number in this sentence:
+
+Numbers: {json.dumps(numbers)}
+Context: "{context}"
+
+For each number, in the order listed, rate each component (0-1):
+- has_comparison: Does it compare to something?
+- has_explanation: Is there a reason/driver?
+- has_implication: Is the business impact stated?
+
+Respond in JSON with one entry per number in the "assessments" array:
+{{
+    "assessments": [
+        {{
+            "number": "the number as listed",
+            "has_comparison": 0.0-1.0,
+            "has_explanation": 0.0-1.0,
+            "has_implication": 0.0-1.0,
+            "overall_score": 0.0-3.0,
+            "category": "Well-Contextualized|Moderately Contextualized|Minimally Contextualized|Undercontextualized"
+        }}
+    ]
+}}"""
+        
+        return {
+            'model': settings.CONTEXTUALIZATION_MODEL,
+            'prompt': user_prompt,
+            'system_prompt': CONTEXTUALIZATION_SYSTEM_PROMPT,
+            'json_mode': True,
+        }
+    
+    @classmethod
+    def _parse_contextualization_batch(cls, response: str, count: int) -> List[Dict[str, Any]]:
+        """Parse a batch contextualization response into count assessments"""
+        try:
+            result = json.loads(response)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse batch contextualization response: {e}")
+            result = []
+        
+        # JSON mode usually wraps the array in an object; accept a bare array too
+        assessments = result.get('assessments', []) if isinstance(result, dict) else result
+        if not isinstance(assessments, list):
+            assessments = []
+        if len(assessments) != count:
+            logger.warning(
+                f"Batch contextualization returned {len(assessments)} assessments "
+                f"for {count} numbers"
+            )
+        
+        return [
+            assessments[i] if i < len(assessments) and isinstance(assessments[i], dict)
+            else cls._default_contextualization()
+            for i in range(count)
+        ]
+    
+    def score_relevance(self, question: str, response: str) -> float:
+        """
+        Score how well a management response addresses an analyst question
+        
+        Args:
+            question: Analyst question
+            response: Management response
+            
+        Returns:
+            Relevance score (0-1)
+            
+        Raises:
+            RuntimeError: If the LLM call fails
+            ValueError: If the response is not valid JSON
+        """
+        return self._parse_relevance(self.generate(**self._relevance_request(question, response)))
+    
+    @staticmethod
+    def _relevance_request(question: str, response: str) -> Dict[str, Any]:
+        """generate() arguments for scoring one Q&A pair"""
+        user_prompt = f"""Rate how well this response addresses the analyst's question.
+
+Question: "{question}"
+
+Response: "{response}"
+
+Evaluate:
+1. Does the response directly address the core question?
+2. Are specific details provided?
+3. Is there deflection or topic changing?
+
+Score from 0.0 (completely evasive/non-responsive) to 1.0 (directly and thoroughly addresses all aspects).
+
+Respond ONLY with valid JSON in this exact format:
+{{
+\t"relevance_score": 0.75,
+\t"addresses_question": true,
+\t"reasoning": "Response provides specific details but deflects slightly"
+}}"""
+        
+        return {
+            'model': settings.SENTIMENT_MODEL,
+            'prompt': user_prompt,
+            'system_prompt': RELEVANCE_SYSTEM_PROMPT,
+            'json_mode': True,
+            'temperature': 0.1,
+        }
+    
+    @staticmethod
+    def _parse_relevance(response: str) -> float:
+        """Relevance score from a response (0.5 if the model omitted it)"""
+        return json.loads(response).get('relevance_score', 0.5)
+    
+    @staticmethod
+    def _default_contextualization() -> Dict[str, Any]:
+        """Neutral contextualization assessment used when the LLM gives none"""
+        return FallbackAssessment({
+            "has_comparison": 0.5,
+            "has_explanation": 0.5,
+            "has_implication": 0.5,
+            "overall_score": 1.5,
+            "category": "Moderately Contextualized"
+        })
     
     def check_model_availability(self, model: str) -> bool:
         """
@@ -277,5 +549,14 @@ Respond in JSON:
             raise RuntimeError(f"Failed to pull model {model}: {str(e)}")
 
 
-# Global client instance
-ollama_client = OllamaClient()
+def __getattr__(name: str):
+    """
+    Resolve the module-level ``ollama_client`` lazily
+
+    The global client now lives in the resource registry and is only
+    created the first time it is used.
+    """
+    if name == 'ollama_client':
+        from src.core.resources import get_ollama_client
+        return get_ollama_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
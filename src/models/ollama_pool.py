@@ -3,19 +3,116 @@ Ollama Connection Pool
 
 Manages a pool of Ollama client connections for concurrent LLM requests.
 Prevents connection exhaustion and improves performance under load.
+Requests are spread over one or more Ollama servers, each request going to
+the healthy server with the fewest outstanding requests.
 """
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-from queue import Queue, Empty
-from threading import Lock
+from typing import Optional, Dict, Any, List, Mapping, Sequence, Tuple, Union
+from collections import deque
+from threading import Condition, Lock, Thread
+import statistics
 import time
-from contextlib import contextmanager
+import urllib.request
+from contextlib import asynccontextmanager, contextmanager
 
 from src.models.ollama_client import OllamaClient
+from src.utils.adaptive_limit import AdaptiveLimit
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Endpoints as accepted by OllamaConnectionPool: url -> weight, or a
+# sequence of urls and (url, weight) pairs
+EndpointSpec = Union[Mapping[str, float], Sequence[Union[str, Tuple[str, float]]]]
+
+
+class OllamaEndpoint:
+    """One Ollama server in the pool, with its routing state and statistics"""
+
+    def __init__(self, url: str, weight: float = 1.0, latency_window: int = 200):
+        """
+        Initialize endpoint
+
+        Args:
+            url: Ollama server URL
+            weight: Relative capacity (an endpoint of weight 2 takes twice the load)
+            latency_window: Number of recent request latencies kept
+
+        Raises:
+            ValueError: If weight is not positive
+        """
+        if weight <= 0:
+            raise ValueError(f"Endpoint weight must be positive: {url}={weight}")
+
+        self.url = url.rstrip('/')
+        self.weight = float(weight)
+
+        # Routing state
+        self.outstanding = 0
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.next_probe = 0.0
+        self.probing = False
+        self.credit = 0.0  # Smooth weighted round-robin between equally loaded endpoints
+
+        # Kept connections to this endpoint (in use or idle), and the idle ones
+        self.connections = 0
+        self.idle: List[Dict[str, Any]] = []
+
+        # Statistics
+        self.requests = 0
+        self.errors = 0
+        self.ejections = 0
+        self.latencies: deque = deque(maxlen=latency_window)
+
+    def load(self) -> float:
+        """Outstanding requests per unit of weight"""
+        return self.outstanding / self.weight
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Endpoint statistics
+
+        Returns:
+            Dictionary with routing state, request counts and latencies (seconds)
+        """
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            'weight': self.weight,
+            'healthy': self.healthy,
+            'outstanding': self.outstanding,
+            'connections': self.connections,
+            'requests': self.requests,
+            'errors': self.errors,
+            'error_rate': self.errors / self.requests if self.requests else 0.0,
+            'consecutive_failures': self.consecutive_failures,
+            'ejections': self.ejections,
+            'avg_latency': statistics.mean(latencies) if count else 0.0,
+            'p50_latency': latencies[count // 2] if count else 0.0,
+            'p95_latency': latencies[int(count * 0.95)] if count else 0.0,
+        }
+
+
+def probe_endpoint(url: str, timeout: float = 5.0) -> bool:
+    """
+    Check that an Ollama server answers
+
+    Args:
+        url: Ollama server URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        True if GET /api/tags succeeds
+    """
+    try:
+        with urllib.request.urlopen(f"{url}/api/tags", timeout=timeout) as response:
+            return response.status == 200
+    except Exception as e:
+        logger.debug(f"Probe of {url} failed: {e}")
+        return False
+
 
 class OllamaConnectionPool:
     """
@@ -27,6 +124,12 @@ class OllamaConnectionPool:
     - Thread-safe operations
     - Connection health checking
     - Configurable pool size
+    - Several weighted endpoints, least-outstanding-requests routing
+    - Ejection of failing endpoints, re-admission after a successful probe
+    - Adaptive concurrency: the number of requests in flight starts at
+      pool_size + max_overflow and follows the observed latency and errors
+      (see AdaptiveLimit); pool_size still bounds the connections kept per
+      endpoint, requests beyond it use overflow connections
     """
 
     def __init__(
@@ -34,25 +137,58 @@ class OllamaConnectionPool:
         pool_size: int = 4,
         max_overflow: int = 2,
         timeout: float = 30.0,
-        recycle_after: int = 100
+        recycle_after: int = 100,
+        endpoints: Optional[EndpointSpec] = None,
+        eject_after: int = 3,
+        probe_interval: float = 30.0,
+        probe_timeout: float = 5.0,
+        adaptive: Optional[bool] = None
     ):
         """
         Initialize connection pool
 
         Args:
-            pool_size: Number of connections to maintain
+            pool_size: Number of connections to maintain per endpoint
             max_overflow: Additional connections allowed when pool is exhausted
             timeout: Timeout for acquiring connection (seconds)
             recycle_after: Recycle connection after N uses
+            endpoints: Ollama servers and their weights
+                (default: settings.OLLAMA_ENDPOINTS, or settings.OLLAMA_HOST alone)
+            eject_after: Consecutive failed requests that eject an endpoint
+            probe_interval: Seconds between probes of an ejected endpoint
+            probe_timeout: Timeout of a single probe (seconds)
+            adaptive: Adapt the concurrency limit to latency
+                (default: settings.LLM_ADAPTIVE_CONCURRENCY)
         """
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.timeout = timeout
         self.recycle_after = recycle_after
+        self.eject_after = eject_after
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+
+        self.endpoints: List[OllamaEndpoint] = [
+            OllamaEndpoint(url, weight) for url, weight in self._parse_endpoints(endpoints)
+        ]
+        if not self.endpoints:
+            raise ValueError("OllamaConnectionPool needs at least one endpoint")
+
+        # Requests allowed in flight
+        if adaptive is None:
+            adaptive = getattr(settings, 'LLM_ADAPTIVE_CONCURRENCY', False)
+        self.limiter: Optional[AdaptiveLimit] = None
+        if adaptive:
+            self.limiter = AdaptiveLimit(
+                'llm_pool_concurrency',
+                initial_limit=pool_size + max_overflow,
+                max_limit=max(pool_size + max_overflow, getattr(settings, 'LLM_CONCURRENCY_MAX', 32))
+            )
 
         # Pool management
-        self._pool: Queue = Queue(maxsize=pool_size + max_overflow)
         self._lock = Lock()
+        self._released = Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
         self._created_connections = 0
         self._overflow_connections = 0
 
@@ -63,44 +199,283 @@ class OllamaConnectionPool:
 
         logger.info(
             f"Initialized Ollama connection pool: "
-            f"size={pool_size}, overflow={max_overflow}"
+            f"size={pool_size}, overflow={max_overflow}, adaptive={bool(adaptive)}, "
+            f"endpoints={[endpoint.url for endpoint in self.endpoints]}"
         )
 
-        # Pre-populate pool
-        self._populate_pool()
-
-    def _populate_pool(self):
-        """Pre-create connections to fill the pool"""
-        with self._lock:
-            for _ in range(self.pool_size):
-                conn = self._create_connection()
-                self._pool.put(conn)
+    @staticmethod
+    def _parse_endpoints(endpoints: Optional[EndpointSpec]) -> List[Tuple[str, float]]:
+        """Normalize an endpoint spec to (url, weight) pairs"""
+        if endpoints is None:
+            endpoints = getattr(settings, 'OLLAMA_ENDPOINTS', None) or {settings.OLLAMA_HOST: 1.0}
+        if isinstance(endpoints, Mapping):
+            return [(url, weight) for url, weight in endpoints.items()]
+        return [(spec, 1.0) if isinstance(spec, str) else tuple(spec) for spec in endpoints]
 
-    def _create_connection(self) -> Dict[str, Any]:
+    def _create_connection(self, endpoint: OllamaEndpoint) -> Dict[str, Any]:
         """
         Create a new connection wrapper
 
+        Args:
+            endpoint: Endpoint the connection talks to
+
         Returns:
             Dictionary with client and metadata
         """
-        client = OllamaClient()
+        client = OllamaClient(host=endpoint.url)
         connection = {
             'client': client,
+            'endpoint': endpoint,
             'created_at': time.time(),
             'use_count': 0,
             'last_used': time.time()
         }
 
-        self._created_connections += 1
-        logger.debug(f"Created connection #{self._created_connections}")
+        with self._lock:
+            self._created_connections += 1
+        logger.debug(f"Created connection #{self._created_connections} to {endpoint.url}")
 
         return connection
 
+    def _capacity(self) -> int:
+        """Requests allowed in flight at once"""
+        if self.limiter is not None:
+            return self.limiter.limit
+        return self.pool_size + self.max_overflow
+
+    def _select_endpoint(self) -> OllamaEndpoint:
+        """Healthy endpoint with the least weighted load (lock held)"""
+        now = time.monotonic()
+        for endpoint in self.endpoints:
+            if not endpoint.healthy and not endpoint.probing and now >= endpoint.next_probe:
+                endpoint.probing = True
+                Thread(target=self._probe, args=(endpoint,), daemon=True).start()
+
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.healthy]
+        if not candidates:
+            # Everything is ejected; keep trying rather than failing outright
+            logger.warning("No healthy Ollama endpoints, routing to the least loaded one")
+            candidates = self.endpoints
+
+        # Least outstanding load wins; ties are shared by smooth weighted
+        # round-robin so idle endpoints still split traffic by weight
+        least = min(endpoint.load() for endpoint in candidates)
+        tied = [endpoint for endpoint in candidates if endpoint.load() == least]
+        for endpoint in tied:
+            endpoint.credit += endpoint.weight
+        chosen = max(tied, key=lambda endpoint: endpoint.credit)
+        chosen.credit -= sum(endpoint.weight for endpoint in tied)
+        return chosen
+
+    def _reserve(self) -> Optional[OllamaEndpoint]:
+        """
+        Reserve a slot on the chosen endpoint if the limit allows (lock held)
+
+        Returns:
+            Endpoint the slot is on, or None if full
+        """
+        if self.active_connections >= self._capacity():
+            return None
+
+        endpoint = self._select_endpoint()
+        endpoint.outstanding += 1
+        self.active_connections += 1
+        self.total_requests += 1
+        return endpoint
+
+    def _exhausted(self) -> TimeoutError:
+        """Error raised when no slot frees up in time"""
+        return TimeoutError(
+            f"Connection pool exhausted and max overflow reached. "
+            f"Pool size: {self.pool_size}, "
+            f"Overflow: {self.max_overflow}, "
+            f"Concurrency limit: {self._capacity()}"
+        )
+
+    def _acquire(self) -> Tuple[Dict[str, Any], bool]:
+        """
+        Reserve a slot and a connection to the chosen endpoint
+
+        An idle kept connection is reused; otherwise a new one is kept while
+        the endpoint has fewer than pool_size, and beyond that an overflow
+        connection is created and discarded after use.
+
+        Returns:
+            (connection wrapper, whether it is an overflow connection)
+
+        Raises:
+            TimeoutError: If no slot frees up within timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._lock:
+            while True:
+                endpoint = self._reserve()
+                if endpoint is not None:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._released.wait(remaining):
+                    raise self._exhausted()
+
+            connection = endpoint.idle.pop() if endpoint.idle else None
+            is_overflow = connection is None and endpoint.connections >= self.pool_size
+            if is_overflow:
+                self._overflow_connections += 1
+                self.pool_exhausted_count += 1
+                # Under an adaptive limit running past pool_size is routine
+                log = logger.debug if self.limiter is not None else logger.warning
+                log(
+                    f"Pool exhausted on {endpoint.url}, created overflow connection "
+                    f"({self._overflow_connections} in use)"
+                )
+            elif connection is None:
+                endpoint.connections += 1
+
+        try:
+            # Check if connection needs recycling
+            if connection is not None and connection['use_count'] >= self.recycle_after:
+                logger.info(f"Recycling connection after {connection['use_count']} uses")
+                connection = None
+            if connection is None:
+                connection = self._create_connection(endpoint)
+        except BaseException:
+            if not is_overflow:
+                with self._lock:
+                    endpoint.connections -= 1
+            self._release_slot(endpoint, is_overflow)
+            raise
+
+        # Update connection metadata
+        connection['use_count'] += 1
+        connection['last_used'] = time.time()
+        connection['acquired_at'] = time.monotonic()
+        return connection, is_overflow
+
+    def _record(self, endpoint: OllamaEndpoint, latency: float, error: Optional[BaseException]):
+        """Record a request outcome for the endpoint and the limit (lock held)"""
+        endpoint.requests += 1
+        endpoint.latencies.append(latency)
+        if error is None:
+            endpoint.consecutive_failures = 0
+        else:
+            endpoint.errors += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and endpoint.consecutive_failures >= self.eject_after:
+                self._eject(endpoint, f"{endpoint.consecutive_failures} consecutive failures")
+
+        if self.limiter is not None and self.limiter.record(
+            latency, self.active_connections, isinstance(error, Exception)
+        ):
+            # A higher limit can admit several waiters at once
+            self._released.notify_all()
+            self._wake_async_waiters()
+
+    def _release(
+        self,
+        connection: Dict[str, Any],
+        is_overflow: bool,
+        error: Optional[BaseException] = None
+    ):
+        """Record the request outcome and return the connection"""
+        endpoint: OllamaEndpoint = connection['endpoint']
+        latency = time.monotonic() - connection['acquired_at']
+
+        with self._lock:
+            self._record(endpoint, latency, error)
+            if not is_overflow:
+                endpoint.idle.append(connection)
+                logger.debug("Returned connection to pool")
+            else:
+                # Don't return overflow connections to pool
+                logger.debug("Discarded overflow connection")
+
+        self._release_slot(endpoint, is_overflow)
+
+    def _release_slot(self, endpoint: OllamaEndpoint, is_overflow: bool = False):
+        """Free a reserved slot"""
+        with self._lock:
+            endpoint.outstanding -= 1
+            self.active_connections -= 1
+            if is_overflow:
+                self._overflow_connections -= 1
+            self._released.notify()
+            self._wake_async_waiters()
+
+    def _wake_async_waiters(self):
+        """Let every coroutine waiting for a slot try again (lock held)"""
+        for loop, event in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop closed; its waiters are gone
+        self._async_waiters.clear()
+
+    async def _acquire_async(self) -> OllamaEndpoint:
+        """
+        Reserve a slot without blocking the event loop
+
+        Returns:
+            Endpoint the slot is on
+
+        Raises:
+            TimeoutError: If no slot frees up within timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            event = asyncio.Event()
+            with self._lock:
+                endpoint = self._reserve()
+                if endpoint is None:
+                    self._async_waiters.append((loop, event))
+            if endpoint is not None:
+                return endpoint
+
+            try:
+                await asyncio.wait_for(event.wait(), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                with self._lock:
+                    if (loop, event) in self._async_waiters:
+                        self._async_waiters.remove((loop, event))
+                raise self._exhausted() from None
+            except BaseException:
+                with self._lock:
+                    if (loop, event) in self._async_waiters:
+                        self._async_waiters.remove((loop, event))
+                raise
+
+    def _eject(self, endpoint: OllamaEndpoint, reason: str):
+        """Stop routing to an endpoint until a probe succeeds (lock held)"""
+        endpoint.healthy = False
+        endpoint.ejections += 1
+        endpoint.next_probe = time.monotonic() + self.probe_interval
+        logger.warning(f"Ejected Ollama endpoint {endpoint.url}: {reason}")
+
+    def _probe(self, endpoint: OllamaEndpoint) -> bool:
+        """Probe an endpoint and update its health"""
+        ok = probe_endpoint(endpoint.url, self.probe_timeout)
+        with self._lock:
+            endpoint.probing = False
+            if ok:
+                if not endpoint.healthy:
+                    logger.info(f"Re-admitted Ollama endpoint {endpoint.url}")
+                    endpoint.credit = 0.0
+                endpoint.healthy = True
+                endpoint.consecutive_failures = 0
+            elif endpoint.healthy:
+                self._eject(endpoint, "health check failed")
+            else:
+                endpoint.next_probe = time.monotonic() + self.probe_interval
+        return ok
+
     @contextmanager
     def get_connection(self):
         """
         Get a connection from the pool (context manager)
 
+        The connection goes to the healthy endpoint with the fewest
+        outstanding requests (relative to its weight). An exception raised
+        inside the block counts as a failed request for that endpoint.
+
         Usage:
             with pool.get_connection() as client:
                 result = client.analyze_sentiment(text)
@@ -111,69 +486,50 @@ class OllamaConnectionPool:
         Raises:
             TimeoutError: If no connection available within timeout
         """
-        connection = None
-        is_overflow = False
+        connection, is_overflow = self._acquire()
+        logger.debug(f"Acquired connection to {connection['endpoint'].url}")
 
         try:
-            # Try to get connection from pool
-            try:
-                connection = self._pool.get(timeout=self.timeout)
-                logger.debug("Acquired connection from pool")
-
-            except Empty:
-                # Pool exhausted, try to create overflow connection
-                with self._lock:
-                    if self._overflow_connections < self.max_overflow:
-                        self._overflow_connections += 1
-                        is_overflow = True
-                        connection = self._create_connection()
-                        logger.warning(
-                            f"Pool exhausted, created overflow connection "
-                            f"({self._overflow_connections}/{self.max_overflow})"
-                        )
-                        self.pool_exhausted_count += 1
-                    else:
-                        raise TimeoutError(
-                            f"Connection pool exhausted and max overflow reached. "
-                            f"Pool size: {self.pool_size}, "
-                            f"Overflow: {self.max_overflow}"
-                        )
-
-            # Update metrics
-            self.total_requests += 1
-            self.active_connections += 1
+            # Yield the client
+            yield connection['client']
+        except BaseException as e:
+            self._release(connection, is_overflow, e)
+            raise
+        else:
+            self._release(connection, is_overflow)
+
+    @asynccontextmanager
+    async def endpoint_slot(self):
+        """
+        Hold a request slot from a coroutine (async context manager)
 
-            # Check if connection needs recycling
-            if connection['use_count'] >= self.recycle_after:
-                logger.info(
-                    f"Recycling connection after {connection['use_count']} uses"
-                )
-                connection = self._create_connection()
+        Async counterpart of get_connection for clients that keep their own
+        connection per endpoint: the slot counts against the same limit and
+        goes to the same endpoint get_connection would pick, and an
+        exception raised inside the block counts as a failed request.
 
-            # Update connection metadata
-            connection['use_count'] += 1
-            connection['last_used'] = time.time()
+        Usage:
+            async with pool.endpoint_slot() as endpoint:
+                response = await clients[endpoint.url].chat(...)
 
-            # Yield the client
-            yield connection['client']
+        Yields:
+            OllamaEndpoint to send the request to
 
+        Raises:
+            TimeoutError: If no slot frees up within timeout
+        """
+        endpoint = await self._acquire_async()
+        start = time.monotonic()
+        error: Optional[BaseException] = None
+        try:
+            yield endpoint
+        except BaseException as e:
+            error = e
+            raise
         finally:
-            # Return connection to pool
-            if connection is not None:
-                self.active_connections -= 1
-
-                if is_overflow:
-                    # Don't return overflow connections to pool
-                    with self._lock:
-                        self._overflow_connections -= 1
-                    logger.debug("Discarded overflow connection")
-                else:
-                    # Return to pool
-                    try:
-                        self._pool.put_nowait(connection)
-                        logger.debug("Returned connection to pool")
-                    except Exception as e:
-                        logger.error(f"Failed to return connection to pool: {e}")
+            with self._lock:
+                self._record(endpoint, time.monotonic() - start, error)
+            self._release_slot(endpoint)
 
     def get_client(self) -> OllamaClient:
         """
@@ -184,73 +540,77 @@ class OllamaConnectionPool:
         Returns:
             Tuple of (OllamaClient, connection_wrapper)
         """
-        try:
-            connection = self._pool.get(timeout=self.timeout)
-            self.active_connections += 1
-            self.total_requests += 1
-            connection['use_count'] += 1
-            connection['last_used'] = time.time()
-            return connection['client'], connection
-
-        except Empty:
-            raise TimeoutError("Connection pool exhausted")
+        connection, is_overflow = self._acquire()
+        connection['overflow'] = is_overflow
+        return connection['client'], connection
 
-    def return_client(self, connection: Dict[str, Any]):
+    def return_client(self, connection: Dict[str, Any], error: Optional[BaseException] = None):
         """
         Return a client to the pool
 
         Args:
             connection: Connection wrapper from get_client()
+            error: Exception the request failed with, if any
+        """
+        self._release(connection, connection.pop('overflow', False), error)
+
+    def client(self, use_cache: bool = True) -> 'RoutedOllamaClient':
+        """
+        OllamaClient that sends each request through this pool
+
+        Args:
+            use_cache: Answer repeated prompts from the persistent prompt cache
+
+        Returns:
+            RoutedOllamaClient
         """
-        self.active_connections -= 1
-        self._pool.put(connection)
+        return RoutedOllamaClient(self, use_cache=use_cache)
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get pool statistics
 
         Returns:
-            Dictionary with pool metrics
+            Dictionary with pool metrics, and per-endpoint routing state,
+            request and error counts and latencies under 'endpoints'
         """
-        return {
-            'pool_size': self.pool_size,
-            'max_overflow': self.max_overflow,
-            'active_connections': self.active_connections,
-            'available_connections': self._pool.qsize(),
-            'total_requests': self.total_requests,
-            'pool_exhausted_count': self.pool_exhausted_count,
-            'created_connections': self._created_connections,
-            'overflow_connections': self._overflow_connections
-        }
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'max_overflow': self.max_overflow,
+                'active_connections': self.active_connections,
+                'available_connections': sum(len(endpoint.idle) for endpoint in self.endpoints),
+                'total_requests': self.total_requests,
+                'pool_exhausted_count': self.pool_exhausted_count,
+                'created_connections': self._created_connections,
+                'overflow_connections': self._overflow_connections,
+                'concurrency_limit': self._capacity(),
+                'healthy_endpoints': sum(endpoint.healthy for endpoint in self.endpoints),
+                'endpoints': {endpoint.url: endpoint.stats() for endpoint in self.endpoints}
+            }
 
     def health_check(self) -> bool:
         """
-        Perform health check on pool
+        Probe every endpoint, ejecting or re-admitting it
 
         Returns:
-            True if pool is healthy
+            True if at least one endpoint is healthy
         """
-        try:
-            with self.get_connection() as client:
-                # Try a simple operation
-                client.check_model_availability(settings.SENTIMENT_MODEL)
-            return True
-        except Exception as e:
-            logger.error(f"Pool health check failed: {e}")
-            return False
+        results = [self._probe(endpoint) for endpoint in self.endpoints]
+        if not any(results):
+            logger.error("Pool health check failed: no Ollama endpoint answered")
+        return any(results)
 
     def shutdown(self):
         """Shutdown the connection pool and cleanup resources"""
         logger.info("Shutting down Ollama connection pool")
 
         # Drain the pool
-        while not self._pool.empty():
-            try:
-                connection = self._pool.get_nowait()
-                # Cleanup connection if needed
-                # (OllamaClient doesn't have explicit cleanup currently)
-            except Empty:
-                break
+        # (OllamaClient doesn't have explicit cleanup currently)
+        with self._lock:
+            for endpoint in self.endpoints:
+                endpoint.connections -= len(endpoint.idle)
+                endpoint.idle.clear()
 
         logger.info(
             f"Pool shutdown complete. "
@@ -267,6 +627,70 @@ class OllamaConnectionPool:
         return False
 
 
+class RoutedOllamaClient(OllamaClient):
+    """
+    OllamaClient whose requests are spread over a pool's endpoints
+
+    Every attempt, including each retry, is routed again, so a retry after
+    a failure normally lands on another endpoint.
+    """
+
+    def __init__(self, pool: OllamaConnectionPool, max_retries: int = 3, use_cache: bool = True):
+        """
+        Initialize routed client
+
+        Args:
+            pool: Pool to send requests through
+            max_retries: Maximum number of retry attempts (default: 3)
+            use_cache: Answer repeated prompts from the persistent prompt cache
+        """
+        self.pool = pool
+        self.host = 'pool:' + ','.join(endpoint.url for endpoint in pool.endpoints)
+        self.timeout = settings.OLLAMA_TIMEOUT
+        self.max_retries = max_retries
+        self.client = None
+        self.cache = None
+        if use_cache:
+            from src.cache.prompt_cache import get_prompt_cache
+            self.cache = get_prompt_cache()
+
+    def _chat(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool
+    ) -> str:
+        """One chat request to the least loaded endpoint"""
+        with self.pool.get_connection() as client:
+            return client._chat(model, prompt, system_prompt, temperature, max_tokens, json_mode)
+
+    def check_model_availability(self, model: str) -> bool:
+        """
+        Check if a model is available on the endpoint a request would go to
+
+        Args:
+            model: Model name
+
+        Returns:
+            True if model is available
+        """
+        with self.pool.get_connection() as client:
+            return client.check_model_availability(model)
+
+    def pull_model(self, model: str) -> None:
+        """
+        Pull a model on every endpoint
+
+        Args:
+            model: Model name to pull
+        """
+        for endpoint in self.pool.endpoints:
+            OllamaClient(host=endpoint.url, use_cache=False).pull_model(model)
+
+
 # Global connection pool instance
 _global_pool: Optional[OllamaConnectionPool] = None
 _pool_lock = Lock()
@@ -300,7 +724,9 @@ def get_pool(
 
                 _global_pool = OllamaConnectionPool(
                     pool_size=pool_size,
-                    max_overflow=max_overflow
+                    max_overflow=max_overflow,
+                    eject_after=getattr(settings, 'OLLAMA_EJECT_AFTER_FAILURES', 3),
+                    probe_interval=getattr(settings, 'OLLAMA_PROBE_INTERVAL', 30.0)
                 )
 
     return _global_pool
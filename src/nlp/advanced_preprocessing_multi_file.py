@@ -6,35 +6,7 @@ import re
 import json
 from typing import List, Dict, Tuple, Set, Optional, Union
 from pathlib import Path
-import nltk
-from nltk.stem import WordNetLemmatizer
-from nltk.corpus import stopwords
-
-# Download required NLTK data
-try:
-    nltk.data.find('corpora/wordnet')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/omw-1.4')
-except LookupError:
-    nltk.download('wordnet', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('omw-1.4', quiet=True)
-
-# Try to import spaCy for NER
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-    try:
-        nlp = spacy.load('en_core_web_sm')
-    except OSError:
-        print("Warning: spaCy model 'en_core_web_sm' not found. NER will be disabled.")
-        print("Install with: python -m spacy download en_core_web_sm")
-        SPACY_AVAILABLE = False
-        nlp = None
-except ImportError:
-    print("Warning: spaCy not installed. NER will be disabled.")
-    SPACY_AVAILABLE = False
-    nlp = None
+from src.core.resources import ensure_nltk_data, get_spacy_nlp
 
 
 class FinancialPhraseDetector:
@@ -226,6 +198,8 @@ class FinancialStopwords:
             custom_stopwords_file: Path to JSON with custom stopwords config
         """
         # Get standard English stopwords
+        ensure_nltk_data('stopwords')
+        from nltk.corpus import stopwords
         self.standard_stopwords = set(stopwords.words('english'))
         
         # Words to preserve (sentiment-bearing or important)
@@ -270,7 +244,8 @@ class NamedEntityRecognizer:
     
     def __init__(self):
         """Initialize NER"""
-        self.enabled = SPACY_AVAILABLE and nlp is not None
+        self.nlp = get_spacy_nlp()
+        self.enabled = self.nlp is not None
         if self.enabled:
             print("✓ Named Entity Recognition enabled (spaCy)")
         else:
@@ -289,7 +264,7 @@ class NamedEntityRecognizer:
         if not self.enabled:
             return {}
         
-        doc = nlp(text)
+        doc = self.nlp(text)
         
         entities = {
             'companies': [],
@@ -334,7 +309,7 @@ class NamedEntityRecognizer:
             return text
         
         entity_types = entity_types or []
-        doc = nlp(text)
+        doc = self.nlp(text)
         
         # Create mapping of entity types to mask tokens
         mask_map = {
@@ -383,6 +358,9 @@ class AdvancedTextPreprocessor:
         
         self.enable_lemmatization = enable_lemmatization
         if enable_lemmatization:
+            ensure_nltk_data('wordnet')
+            ensure_nltk_data('omw-1.4')
+            from nltk.stem import WordNetLemmatizer
             self.lemmatizer = WordNetLemmatizer()
             print("✓ Lemmatization enabled")
         else:
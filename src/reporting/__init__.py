@@ -10,9 +10,15 @@ Author: Earnings Call Analyzer Team
 Version: 2.0.0-phase2c
 """
 
-from .pdf_generator import PDFReportGenerator
-from .html_dashboard import HTMLDashboardGenerator
-from .excel_exporter import ExcelExporter
+import importlib
+
+# Generators are imported on first access: WeasyPrint, Plotly and openpyxl
+# are heavy and only needed when a report is actually produced
+_LAZY_EXPORTS = {
+    'PDFReportGenerator': '.pdf_generator',
+    'HTMLDashboardGenerator': '.html_dashboard',
+    'ExcelExporter': '.excel_exporter',
+}
 
 __all__ = [
     'PDFReportGenerator',
@@ -21,3 +27,15 @@ __all__ = [
 ]
 
 __version__ = '2.0.0-phase2c'
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -0,0 +1,256 @@
+"""
+Adaptive concurrency limit
+Finds how many requests a server can take at once from the latencies and
+errors it returns (AIMD: additive increase, multiplicative decrease)
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from config.settings import settings
+
+
+class AdaptiveLimit:
+    """
+    Thread-safe AIMD concurrency limit driven by observed latency
+
+    Every completed request reports its latency. Once a window of samples
+    is complete, its median (p50) is compared with the baseline, the
+    latency the server answers in when it is not queueing:
+
+    - p50 within tolerance of the baseline and the limit was reached during
+      the window: the server has headroom, the limit grows by one
+    - p50 above baseline * tolerance: requests are queueing on the server,
+      the limit is multiplied by backoff
+    - a failed request (timeout, server error) backs off at once, at most
+      once per window, so a burst of failures does not collapse the limit
+
+    The baseline is a moving average that falls towards lower p50s, so one
+    window of short prompts does not set a bar that ordinary windows then
+    miss. Higher p50s do not raise it, or queueing caused by a growing
+    limit would become the new norm, with one exception: when p50 stays
+    above tolerance through two backoffs in a row (the window right after a
+    backoff still holds requests admitted before it), less concurrency did
+    not help, the requests themselves got slower (longer prompts, another
+    model), and the baseline catches up, so a change in prompt mix does not
+    pin the limit at its minimum.
+
+    The limit does not block anything itself; the pool or client that owns
+    it admits requests while fewer than ``limit`` are in flight.
+
+    Gauges (``<name>_limit``, ``<name>_p50_latency``,
+    ``<name>_baseline_latency``, ``<name>_window``) and counters
+    (``<name>_increases``, ``<name>_decreases``) are reported to a
+    PerformanceMonitor.
+    """
+
+    def __init__(
+        self,
+        name: str = 'llm_concurrency',
+        initial_limit: int = None,
+        min_limit: int = None,
+        max_limit: int = None,
+        window: int = None,
+        tolerance: float = None,
+        backoff: float = 0.75,
+        smoothing: float = 0.05,
+        catch_up: float = 0.5,
+        monitor=None
+    ):
+        """
+        Initialize adaptive limit
+
+        Args:
+            name: Prefix of the PerformanceMonitor gauges and counters
+            initial_limit: Starting limit (default: settings.LLM_MAX_CONCURRENCY)
+            min_limit: Lowest limit (default: settings.LLM_CONCURRENCY_MIN)
+            max_limit: Highest limit (default: settings.LLM_CONCURRENCY_MAX)
+            window: Completed requests per adjustment (default: settings.LLM_LATENCY_WINDOW)
+            tolerance: p50 / baseline ratio treated as overload (default: settings.LLM_LATENCY_TOLERANCE)
+            backoff: Factor applied to the limit on overload
+            smoothing: Weight of a lower window p50 in the baseline (moving average)
+            catch_up: Fraction of the gap to p50 the baseline closes when backing
+                off did not bring latency down
+            monitor: Monitor to report to (default: the global monitor)
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit or getattr(settings, 'LLM_CONCURRENCY_MIN', 1))
+        self.max_limit = max(self.min_limit, max_limit or getattr(settings, 'LLM_CONCURRENCY_MAX', 32))
+        self.window = max(1, window or getattr(settings, 'LLM_LATENCY_WINDOW', 20))
+        self.tolerance = tolerance or getattr(settings, 'LLM_LATENCY_TOLERANCE', 1.5)
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.catch_up = catch_up
+        self.monitor = monitor
+
+        initial_limit = initial_limit or settings.LLM_MAX_CONCURRENCY
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._lock = threading.Lock()
+
+        # Current window
+        self._samples: List[float] = []
+        self._saturated = False
+        self._backed_off = False
+        self._overloaded_windows = 0  # Consecutive windows above tolerance
+
+        # Latency history
+        self.baseline: Optional[float] = None
+        self.last_p50: Optional[float] = None
+        self.recent: deque = deque(maxlen=self.window)
+
+        self._report()
+
+    @property
+    def limit(self) -> int:
+        """Requests allowed in flight at once"""
+        return int(self._limit)
+
+    def record(self, latency: float, in_flight: int, error: bool = False) -> bool:
+        """
+        Report a completed request
+
+        Args:
+            latency: Seconds the request took
+            in_flight: Requests in flight when it completed, itself included
+            error: Whether the request failed
+
+        Returns:
+            True if the limit changed
+        """
+        with self._lock:
+            before = self.limit
+            self.recent.append(latency)
+            if in_flight >= before:
+                self._saturated = True
+
+            if error:
+                if not self._backed_off:
+                    self._decrease()
+                    self._backed_off = True
+            else:
+                self._samples.append(latency)
+                if len(self._samples) >= self.window:
+                    self._adjust()
+
+            changed = self.limit != before
+        self._report()
+        return changed
+
+    def _adjust(self):
+        """Close the window and move the limit (lock held)"""
+        samples = sorted(self._samples)
+        p50 = samples[len(samples) // 2]
+        self.last_p50 = p50
+
+        if self.baseline is None:
+            self.baseline = p50
+
+        if p50 > self.baseline * self.tolerance:
+            self._overloaded_windows += 1
+            if self._overloaded_windows > 2:
+                # Backing off did not bring latency down: not queueing
+                self.baseline += (p50 - self.baseline) * self.catch_up
+            self._decrease()
+        else:
+            self._overloaded_windows = 0
+            if self._saturated and not self._backed_off:
+                self._increase()
+
+        if p50 < self.baseline:
+            self.baseline += (p50 - self.baseline) * self.smoothing
+
+        self._samples = []
+        self._saturated = False
+        self._backed_off = False
+
+    def _increase(self):
+        """Additive increase (lock held)"""
+        if self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1)
+            self._count('increases')
+
+    def _decrease(self):
+        """Multiplicative decrease (lock held)"""
+        if self._limit > self.min_limit:
+            self._limit = max(self.min_limit, math.floor(self._limit * self.backoff))
+            self._count('decreases')
+
+    def _get_monitor(self):
+        if self.monitor is None:
+            from src.utils.performance import get_monitor
+            return get_monitor()
+        return self.monitor
+
+    def _count(self, event: str):
+        self._get_monitor().increment(f"{self.name}_{event}")
+
+    def _report(self):
+        """Export the limit and latency window as gauges"""
+        monitor = self._get_monitor()
+        monitor.set_gauge(f"{self.name}_limit", self.limit)
+        monitor.set_gauge(f"{self.name}_window", len(self.recent))
+        if self.last_p50 is not None:
+            monitor.set_gauge(f"{self.name}_p50_latency", self.last_p50)
+        if self.baseline is not None:
+            monitor.set_gauge(f"{self.name}_baseline_latency", self.baseline)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Limit statistics
+
+        Returns:
+            Dictionary with the limit, its bounds and the recent latency window
+        """
+        with self._lock:
+            return {
+                'limit': self.limit,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'p50_latency': self.last_p50,
+                'baseline_latency': self.baseline,
+                'latency_window': list(self.recent)
+            }
+
+
+class AsyncAdaptiveLimiter:
+    """
+    Admits coroutines while fewer than an AdaptiveLimit are in flight
+
+    Drop-in for an asyncio.Semaphore used as ``async with limiter.slot():``;
+    each slot reports its latency, and whether it raised, to the limit.
+    """
+
+    def __init__(self, limit: AdaptiveLimit):
+        """
+        Initialize limiter
+
+        Args:
+            limit: Limit to enforce and feed
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the limited slots for the duration of the block"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit.limit)
+            self.in_flight += 1
+
+        start = time.monotonic()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            async with self._condition:
+                self.limit.record(time.monotonic() - start, self.in_flight, error)
+                self.in_flight -= 1
+                self._condition.notify_all()
@@ -0,0 +1,104 @@
+"""
+Multi-category keyword matcher
+Finds which keyword categories occur in a text, for substring cue lists such
+as the forward/backward-looking keywords and the contextualization cues
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Joins texts for the batch scan; never part of a cue, so no cue can match
+# across two texts
+_SEPARATOR = '\0'
+
+
+class KeywordMatcher:
+    """
+    Substring cue matcher over several categories at once
+
+    The result equals testing ``any(cue in text for cue in cues)`` for every
+    category, with the substring tests done by str methods:
+
+    - mask() lowercases nothing and skips cues whose categories are already
+      found, stopping once every category is found
+    - masks() lowercases each text once, joins them and runs one str.find
+      per cue over the joined text, jumping to the next text after a hit
+    """
+
+    def __init__(self, categories: Mapping[str, Sequence[str]]):
+        """
+        Build the matcher
+
+        Args:
+            categories: Category name -> cue strings; the category order
+                defines the bit positions (bit i = i-th category)
+        """
+        self.categories: Tuple[str, ...] = tuple(categories)
+        self.bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(self.categories)}
+        self.all_bits = (1 << len(self.categories)) - 1
+
+        cue_bits: Dict[str, int] = {}
+        for name, cues in categories.items():
+            for cue in cues:
+                if cue and _SEPARATOR not in cue:
+                    cue_bits[cue] = cue_bits.get(cue, 0) | self.bits[name]
+        self._cues: List[Tuple[str, int]] = list(cue_bits.items())
+
+    def mask(self, text: str) -> int:
+        """
+        Bitmask of the categories with at least one cue in text (case sensitive)
+
+        Args:
+            text: Text to scan (lowercase it first for lowercase cues)
+
+        Returns:
+            Category bitmask
+        """
+        found = 0
+        for cue, bits in self._cues:
+            if bits & ~found and cue in text:
+                found |= bits
+                if found == self.all_bits:
+                    break
+        return found
+
+    def masks(self, texts: Iterable[str], lowercase: bool = True) -> np.ndarray:
+        """
+        Category bitmask of every text
+
+        Args:
+            texts: Texts to scan
+            lowercase: Lowercase each text before scanning
+
+        Returns:
+            Array of bitmasks, one per text (uint8 for up to 8 categories)
+        """
+        texts = [text.lower() for text in texts] if lowercase else list(texts)
+        dtype = np.uint8 if len(self.categories) <= 8 else np.uint32
+
+        starts: List[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        joined = _SEPARATOR.join(texts)
+        count = len(texts)
+
+        values = [0] * count
+        find = joined.find
+        for cue, bits in self._cues:
+            pos = find(cue)
+            while pos != -1:
+                index = bisect_right(starts, pos) - 1
+                values[index] |= bits
+                if index + 1 == count:
+                    break
+                # Presence is all that matters; continue in the next text
+                pos = find(cue, starts[index + 1])
+
+        return np.array(values, dtype=dtype)
+
+    def has(self, found: int, category: str) -> bool:
+        """True if a bitmask from mask() includes category"""
+        return bool(found & self.bits[category])
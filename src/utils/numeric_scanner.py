@@ -0,0 +1,213 @@
+"""
+Offset-indexed numeric token scanner
+Finds every numeric mention of a text in one pass and maps it to its sentence
+"""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# Same alternation extract_numerical_tokens has always used, with named
+# groups so the scanner can report which kind of number matched
+NUMERIC_MENTION_PATTERN = re.compile(
+    r'(?P<currency>\$\s*\d+(?:\.\d+)?(?:\s*(?:million|billion|trillion|M|B|T))?)'
+    r'|(?P<percent>\d+(?:\.\d+)?%)'
+    r'|(?P<plain>\d+(?:\.\d+)?(?P<scale>\s*(?:million|billion|trillion|M|B|T))?)'
+    r'|(?P<grouped>\d+(?:,\d{3})*(?:\.\d+)?)',
+    re.IGNORECASE
+)
+
+YEAR_PATTERN = re.compile(r'^\d{4}$')
+
+
+class NumericMention(NamedTuple):
+    """A numeric mention located in the source text"""
+    start: int
+    end: int
+    kind: str  # currency, percent, scaled, number
+    sentence_index: int
+
+
+def _mention_kind(match: re.Match) -> str:
+    """Classify a match by the alternative that produced it"""
+    group = match.lastgroup
+    if group == 'currency':
+        return 'currency'
+    if group == 'percent':
+        return 'percent'
+    if group == 'plain' and match.group('scale'):
+        return 'scaled'
+    return 'number'
+
+
+def scan_numeric_mentions(
+    text: str,
+    sentence_spans: Sequence[Tuple[int, int]]
+) -> List[NumericMention]:
+    """
+    Find every numeric mention of text in a single left-to-right scan
+
+    Matches are confined to sentences exactly as if each sentence had been
+    scanned on its own: text between sentences is skipped and a match that
+    would run past its sentence end is re-matched inside the sentence.
+    Bare four-digit years are skipped.
+
+    Args:
+        text: Source text
+        sentence_spans: Ordered (start, end) sentence offsets into text
+
+    Returns:
+        List of NumericMention records in text order
+    """
+    starts = [start for start, _ in sentence_spans]
+    ends = [end for _, end in sentence_spans]
+    mentions: List[NumericMention] = []
+
+    if not starts:
+        return mentions
+
+    search = NUMERIC_MENTION_PATTERN.search
+    pos = starts[0]
+
+    while True:
+        match = search(text, pos)
+        if match is None:
+            break
+
+        index = bisect_right(starts, match.start()) - 1
+
+        if index < 0 or match.start() >= ends[index]:
+            # Match begins between sentences; resume at the next sentence
+            if index + 1 >= len(starts):
+                break
+            pos = starts[index + 1]
+            continue
+
+        sentence_end = ends[index]
+        if match.end() > sentence_end:
+            match = search(text, match.start(), sentence_end)
+            if match is None:
+                pos = sentence_end
+                continue
+
+        pos = match.end()
+        if YEAR_PATTERN.match(match.group().strip()):
+            continue
+
+        mentions.append(NumericMention(match.start(), match.end(), _mention_kind(match), index))
+
+    return mentions
+
+
+@dataclass(eq=False)
+class NumericIndex:
+    """Numeric mentions of a text, ordered by position and keyed by sentence"""
+    source: str
+    mentions: List[NumericMention]
+    sentence_count: int
+
+    _counts: np.ndarray = field(default=None, repr=False)
+    _offsets: Tuple[np.ndarray, np.ndarray] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, text: str, sentence_spans: Sequence[Tuple[int, int]]) -> 'NumericIndex':
+        """
+        Scan text once and index the mentions
+
+        Args:
+            text: Source text
+            sentence_spans: Ordered (start, end) sentence offsets into text
+
+        Returns:
+            NumericIndex over text
+        """
+        return cls(
+            source=text,
+            mentions=scan_numeric_mentions(text, sentence_spans),
+            sentence_count=len(sentence_spans)
+        )
+
+    def restrict(self, sentence_spans: np.ndarray) -> 'NumericIndex':
+        """
+        Index of the mentions inside sub-spans of this index's sentences
+
+        Mentions lying wholly inside a span are reused from this index; only
+        spans that cut through a mention or a word are rescanned, so the
+        result equals building a new index over the spans.
+
+        Args:
+            sentence_spans: Ordered (n, 2) array of (start, end) offsets, each
+                within one sentence of this index (e.g. a range view's sentences)
+
+        Returns:
+            NumericIndex over the spans, with sentence indices into them
+        """
+        spans = np.asarray(sentence_spans, dtype=np.int64).reshape(-1, 2)
+        starts, ends = self._mention_offsets()
+
+        # Mentions [first, last) lie inside each span
+        first = np.searchsorted(starts, spans[:, 0], side='left')
+        last = np.maximum(np.searchsorted(ends, spans[:, 1], side='right'), first)
+
+        # A span cuts a mention if the one before it runs into it or the one after it starts inside it
+        previous = np.maximum(first - 1, 0)
+        following = np.minimum(last, len(starts) - 1)
+        cut = np.zeros(len(spans), dtype=bool)
+        if len(starts):
+            cut = ((first > 0) & (ends[previous] > spans[:, 0])) | \
+                  ((last < len(starts)) & (starts[following] < spans[:, 1]))
+
+        # Spans starting or ending inside a word are rescanned too, since a
+        # skipped year there would leave a partial number to find
+        source = self.source
+        cut |= np.array([
+            (0 < start < len(source) and not source[start - 1].isspace() and not source[start].isspace()) or
+            (0 < end < len(source) and not source[end - 1].isspace() and not source[end].isspace())
+            for start, end in spans.tolist()
+        ], dtype=bool).reshape(-1)
+
+        mentions: List[NumericMention] = []
+        for index, (lo, hi, rescan) in enumerate(zip(first.tolist(), last.tolist(), cut.tolist())):
+            if rescan:
+                start, end = spans[index].tolist()
+                mentions.extend(
+                    mention._replace(sentence_index=index)
+                    for mention in scan_numeric_mentions(self.source, [(start, end)])
+                )
+            else:
+                mentions.extend(mention._replace(sentence_index=index) for mention in self.mentions[lo:hi])
+
+        return NumericIndex(source=self.source, mentions=mentions, sentence_count=len(spans))
+
+    def _mention_offsets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end offsets of every mention (both ascending)"""
+        if self._offsets is None:
+            offsets = np.array([(m.start, m.end) for m in self.mentions], dtype=np.int64).reshape(-1, 2)
+            self._offsets = (offsets[:, 0], offsets[:, 1])
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.mentions)
+
+    def text_of(self, mention: NumericMention) -> str:
+        """Matched text of a mention"""
+        return self.source[mention.start:mention.end]
+
+    def texts(self) -> List[str]:
+        """Matched text of every mention, in order"""
+        return [self.source[m.start:m.end] for m in self.mentions]
+
+    def counts_per_sentence(self) -> np.ndarray:
+        """Number of mentions in each sentence"""
+        if self._counts is None:
+            sentence_ids = np.fromiter(
+                (m.sentence_index for m in self.mentions), dtype=np.int64, count=len(self.mentions)
+            )
+            self._counts = np.bincount(sentence_ids, minlength=self.sentence_count)
+        return self._counts
+
+    def of_kind(self, kind: str) -> List[NumericMention]:
+        """Mentions of a given kind (currency, percent, scaled, number)"""
+        return [m for m in self.mentions if m.kind == kind]
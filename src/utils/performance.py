@@ -6,6 +6,7 @@ insights into system performance.
 """
 import time
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
@@ -56,6 +57,8 @@ class PerformanceMonitor:
     - Bottleneck identification
     - Export to JSON/CSV
     - Real-time alerts
+    - Event counters
+    - Gauges (latest value of a changing quantity)
     """
 
     def __init__(
@@ -83,6 +86,13 @@ class PerformanceMonitor:
         # Alerts
         self.alerts: List[Dict[str, Any]] = []
 
+        # Event counters
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._counter_lock = threading.Lock()
+
+        # Gauges (guarded by the counter lock)
+        self.gauges: Dict[str, float] = {}
+
         logger.info(
             f"Performance monitor initialized: "
             f"enabled={enabled}, alert_threshold={alert_threshold}s"
@@ -151,6 +161,66 @@ class PerformanceMonitor:
             self.metrics = self.metrics[trim_count:]
             logger.debug(f"Trimmed {trim_count} old metrics")
 
+    def increment(self, counter: str, amount: int = 1):
+        """
+        Add to an event counter
+
+        Args:
+            counter: Counter name (e.g. 'llm_requests_issued')
+            amount: Amount to add
+        """
+        if not self.enabled:
+            return
+
+        with self._counter_lock:
+            self.counters[counter] += amount
+
+    def get_counters(self, prefix: Optional[str] = None) -> Dict[str, int]:
+        """
+        Get event counters
+
+        Args:
+            prefix: Only counters whose name starts with prefix (None = all)
+
+        Returns:
+            Dictionary mapping counter -> value
+        """
+        with self._counter_lock:
+            return {
+                name: value for name, value in self.counters.items()
+                if prefix is None or name.startswith(prefix)
+            }
+
+    def set_gauge(self, gauge: str, value: float):
+        """
+        Set a gauge to its current value
+
+        Args:
+            gauge: Gauge name (e.g. 'llm_concurrency_limit')
+            value: Current value
+        """
+        if not self.enabled:
+            return
+
+        with self._counter_lock:
+            self.gauges[gauge] = value
+
+    def get_gauges(self, prefix: Optional[str] = None) -> Dict[str, float]:
+        """
+        Get gauges
+
+        Args:
+            prefix: Only gauges whose name starts with prefix (None = all)
+
+        Returns:
+            Dictionary mapping gauge -> latest value
+        """
+        with self._counter_lock:
+            return {
+                name: value for name, value in self.gauges.items()
+                if prefix is None or name.startswith(prefix)
+            }
+
     def _trigger_alert(
         self,
         operation: str,
@@ -287,6 +357,8 @@ class PerformanceMonitor:
                 for op, stat in self.get_stats().items()
             },
             'bottlenecks': self.identify_bottlenecks(),
+            'counters': self.get_counters(),
+            'gauges': self.get_gauges(),
             'alerts': self.alerts,
             'recent_metrics': [
                 asdict(m) for m in self.metrics[-100:]  # Last 100 metrics
@@ -308,11 +380,27 @@ class PerformanceMonitor:
         print("="*80)
 
         stats = self.get_stats()
+        counters = self.get_counters()
+        gauges = self.get_gauges()
 
-        if not stats:
+        if not stats and not counters and not gauges:
             print("No metrics recorded")
             return
 
+        if counters:
+            print(f"\nCounters:")
+            for name, value in sorted(counters.items()):
+                print(f"  {name}: {value}")
+
+        if gauges:
+            print(f"\nGauges:")
+            for name, value in sorted(gauges.items()):
+                print(f"  {name}: {value:g}")
+
+        if not stats:
+            print("="*80 + "\n")
+            return
+
         # Overall stats
         total_operations = sum(s.count for s in stats.values())
         total_time = sum(s.total_time for s in stats.values())
@@ -366,6 +454,9 @@ class PerformanceMonitor:
         self.metrics.clear()
         self.operation_metrics.clear()
         self.alerts.clear()
+        with self._counter_lock:
+            self.counters.clear()
+            self.gauges.clear()
         logger.info("Cleared all performance metrics")
 
     def get_slowest_operations(self, n: int = 10) -> List[PerformanceMetric]:
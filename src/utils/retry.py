@@ -5,6 +5,7 @@ Provides decorators and utilities for retrying failed operations,
 particularly useful for LLM API calls that may timeout or fail temporarily.
 """
 import time
+import asyncio
 import logging
 from functools import wraps
 from typing import Callable, TypeVar, Tuple, Type, Optional
@@ -36,7 +37,8 @@ def exponential_backoff_retry(
         log_attempts: Whether to log retry attempts (default: True)
 
     Returns:
-        Decorated function with retry logic
+        Decorated function with retry logic (coroutine functions get an
+        async wrapper that waits with asyncio.sleep)
 
     Example:
         @exponential_backoff_retry(max_attempts=3, initial_delay=2.0)
@@ -45,6 +47,36 @@ def exponential_backoff_retry(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                delay = initial_delay
+
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == max_attempts:
+                            if log_attempts:
+                                logger.error(
+                                    f"{func.__name__} failed after {max_attempts} attempts: {e}"
+                                )
+                            if fallback_value is not None:
+                                logger.warning(f"Returning fallback value for {func.__name__}")
+                                return fallback_value
+                            raise
+
+                        if log_attempts:
+                            logger.warning(
+                                f"{func.__name__} attempt {attempt} failed: {e}. "
+                                f"Retrying in {delay:.1f}s..."
+                            )
+
+                        await asyncio.sleep(delay)
+                        delay = min(delay * exponential_base, max_delay)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
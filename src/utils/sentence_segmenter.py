@@ -0,0 +1,199 @@
+"""
+Sentence Segmentation Backends
+
+Pluggable sentence splitters returning (start, end) character spans.
+The backend is selected with settings.SENTENCE_SEGMENTER:
+
+- "nltk":  NLTK punkt, the reference segmenter
+- "regex": compiled-regex splitter aware of financial abbreviations
+"""
+import logging
+import re
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import settings
+from src.core.resources import get_punkt_tokenizer
+
+logger = logging.getLogger(__name__)
+
+Span = Tuple[int, int]
+
+# Abbreviations whose period never ends a sentence
+TITLE_ABBREVIATIONS = frozenset({
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'no', 'nos', 'vs',
+    'e.g', 'i.e', 'cf', 'fig', 'approx', 'est', 'dept', 'vol', 'pp',
+})
+
+# Abbreviations that usually continue the sentence, but may end it when
+# followed by a typical sentence opener ("... in the U.S. We expect ...")
+FINANCIAL_ABBREVIATIONS = frozenset({
+    'inc', 'corp', 'co', 'ltd', 'llc', 'plc', 'lp', 'llp', 'bros', 'hldgs',
+    'u.s', 'u.k', 'e.u', 'u.s.a', 'etc', 'avg', 'yr', 'yrs', 'qtr', 'mo',
+    'q1', 'q2', 'q3', 'q4', 'h1', 'h2', 'fy', 'ytd',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept',
+    'oct', 'nov', 'dec', 'mln', 'bln', 'mn', 'bn',
+})
+
+# Capitalized words that start a new sentence after an abbreviation
+SENTENCE_STARTERS = frozenset({
+    'we', 'our', 'i', 'the', 'this', 'that', 'these', 'those', 'it', 'its',
+    'in', 'on', 'as', 'and', 'but', 'so', 'for', 'with', 'at', 'now',
+    'thank', 'thanks', 'turning', 'looking', 'overall', 'finally', 'next',
+    'operator', 'yes', 'no', 'okay', 'sure', 'great', 'let', 'there', 'you',
+})
+
+# Terminal punctuation, optional closing quotes/brackets, then whitespace.
+# Periods inside numbers ("3.5%", "$1.2 billion") have no whitespace after
+# them and are never candidates.
+_BOUNDARY = re.compile(r'([.!?]+)["\')\]”’]*(\s+)(?=(\S+))')
+_LEADING_PUNCT = '"\'([“‘'
+_WORD_PREFIX = re.compile(r'[A-Za-z]+')
+
+
+class PunktSegmenter:
+    """Reference backend: NLTK's pretrained punkt model"""
+
+    name = 'nltk'
+
+    def spans(self, text: str) -> List[Span]:
+        """
+        Split text into sentence spans
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of (start, end) offsets, one per sentence
+        """
+        return list(get_punkt_tokenizer().span_tokenize(text))
+
+
+class RegexSegmenter:
+    """
+    Rule-based backend: a single compiled-regex scan over the text
+
+    A candidate boundary is terminal punctuation followed by whitespace.
+    As with punkt, a period after an ordinary word always ends the sentence.
+    It is rejected when the preceding word is a single initial or a title
+    abbreviation, or a financial abbreviation not followed by a sentence
+    opener. An ellipsis ends a sentence only before a capitalized word.
+    """
+
+    name = 'regex'
+
+    def __init__(
+        self,
+        titles: frozenset = TITLE_ABBREVIATIONS,
+        abbreviations: frozenset = FINANCIAL_ABBREVIATIONS,
+        starters: frozenset = SENTENCE_STARTERS
+    ):
+        self.titles = titles
+        self.abbreviations = abbreviations
+        self.starters = starters
+
+    def spans(self, text: str) -> List[Span]:
+        """
+        Split text into sentence spans
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of (start, end) offsets, one per sentence
+        """
+        spans: List[Span] = []
+        start = len(text) - len(text.lstrip())
+        end_of_text = len(text.rstrip())
+
+        if start >= end_of_text:
+            return spans
+
+        for match in _BOUNDARY.finditer(text, start, end_of_text):
+            if not self._is_boundary(text, match, start):
+                continue
+
+            end = match.start(2)
+            spans.append((start, end))
+            start = match.end(2)
+
+        spans.append((start, end_of_text))
+        return spans
+
+    def _is_boundary(self, text: str, match: re.Match, sentence_start: int) -> bool:
+        """Decide whether a candidate match ends the current sentence"""
+        punct = match.group(1)
+        next_word = match.group(3).lstrip(_LEADING_PUNCT)
+
+        if punct != '.':
+            # "!", "?" always end a sentence; an ellipsis only before a capital
+            return not (punct.startswith('..') and next_word[:1].islower())
+
+        # Word immediately before the period
+        period = match.start(1)
+        word_start = max(
+            text.rfind(' ', sentence_start, period),
+            text.rfind('\n', sentence_start, period),
+            sentence_start - 1
+        ) + 1
+        previous = text[word_start:period].lstrip(_LEADING_PUNCT).lower()
+
+        if not previous:
+            return True
+
+        if len(previous) == 1 and previous.isalpha():
+            # Single initial ("J. Smith")
+            return False
+
+        if previous in self.titles:
+            return False
+
+        if previous in self.abbreviations:
+            opener = _WORD_PREFIX.match(next_word)
+            return opener is not None and opener.group().lower() in self.starters
+
+        return True
+
+
+_SEGMENTERS = {
+    PunktSegmenter.name: PunktSegmenter,
+    RegexSegmenter.name: RegexSegmenter,
+}
+
+_instances: Dict[str, object] = {}
+_segmenter_lock = Lock()
+
+
+def available_segmenters() -> List[str]:
+    """Names of the registered segmentation backends"""
+    return list(_SEGMENTERS)
+
+
+def get_segmenter(name: Optional[str] = None):
+    """
+    Get the sentence segmenter for a backend
+
+    Args:
+        name: Backend name (default: settings.SENTENCE_SEGMENTER)
+
+    Returns:
+        Shared segmenter instance exposing spans(text)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    name = (name or getattr(settings, 'SENTENCE_SEGMENTER', 'nltk')).lower()
+
+    segmenter = _instances.get(name)
+    if segmenter is None:
+        if name not in _SEGMENTERS:
+            raise ValueError(
+                f"Unknown sentence segmenter '{name}'. Available: {', '.join(_SEGMENTERS)}"
+            )
+        with _segmenter_lock:
+            segmenter = _instances.get(name)
+            if segmenter is None:
+                segmenter = _instances[name] = _SEGMENTERS[name]()
+                logger.debug(f"Sentence segmenter: {name}")
+
+    return segmenter
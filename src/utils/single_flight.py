@@ -0,0 +1,173 @@
+"""
+In-flight request coalescing
+Concurrent calls with the same key share one execution and its result
+(threads with SingleFlight, coroutines with AsyncSingleFlight)
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class _Call:
+    """One execution in flight and the callers waiting for it"""
+
+    __slots__ = ('done', 'result', 'error', 'followers')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class _CounterMixin:
+    """Reports issued / coalesced / saved counters to a PerformanceMonitor"""
+
+    def __init__(self, counter_prefix: str, monitor=None):
+        self.counter_prefix = counter_prefix
+        self.monitor = monitor
+
+    def _count(self, event: str):
+        monitor = self.monitor
+        if monitor is None:
+            from src.utils.performance import get_monitor
+            monitor = get_monitor()
+        monitor.increment(f"{self.counter_prefix}_{event}")
+
+
+class SingleFlight(_CounterMixin):
+    """
+    Thread-safe single-flight group
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it runs wait and receive its result, or
+    its exception. Nothing is remembered once the call completes.
+
+    Counters (``<prefix>_issued``, ``<prefix>_coalesced``, ``<prefix>_saved``):
+    executions started, executions shared by more than one caller, and
+    callers served by another caller's execution.
+    """
+
+    def __init__(self, counter_prefix: str = 'requests', monitor=None):
+        """
+        Initialize single-flight group
+
+        Args:
+            counter_prefix: Prefix of the PerformanceMonitor counters
+            monitor: Monitor to report to (default: the global monitor)
+        """
+        super().__init__(counter_prefix, monitor)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) unless a call with the same key is in flight
+
+        Args:
+            key: Identity of the request
+            func: Function to run
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+
+        if not leader:
+            self._count('saved')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self._count('issued')
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                followers = call.followers
+            call.done.set()
+            if followers:
+                self._count('coalesced')
+
+    def in_flight(self) -> int:
+        """Number of keys currently executing"""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight(_CounterMixin):
+    """
+    Single-flight group for coroutines on one event loop
+
+    Same semantics and counters as SingleFlight. A waiting caller that is
+    cancelled does not cancel the shared call.
+    """
+
+    def __init__(self, counter_prefix: str = 'requests', monitor=None):
+        """
+        Initialize single-flight group
+
+        Args:
+            counter_prefix: Prefix of the PerformanceMonitor counters
+            monitor: Monitor to report to (default: the global monitor)
+        """
+        super().__init__(counter_prefix, monitor)
+        self._calls: Dict[Hashable, List] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable], *args, **kwargs) -> Any:
+        """
+        Await func(*args, **kwargs) unless a call with the same key is in flight
+
+        Args:
+            key: Identity of the request
+            func: Coroutine function to run
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        entry = self._calls.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self._count('saved')
+            return await asyncio.shield(entry[0])
+
+        future = asyncio.get_running_loop().create_future()
+        entry = self._calls[key] = [future, 0]
+        self._count('issued')
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            if not entry[1]:
+                # Nobody else awaits it; mark the exception as retrieved
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            if entry[1]:
+                self._count('coalesced')
+
+    def in_flight(self) -> int:
+        """Number of keys currently executing"""
+        return len(self._calls)
@@ -0,0 +1,200 @@
+"""
+Syllable Counting Engine
+
+Memoizes rule-based syllable counts per distinct word type in a bounded,
+process-wide table so repeated vocabulary is only counted once.
+"""
+import logging
+import re
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_NON_ALPHA = re.compile(r'[^a-z]')
+_VOWELS = frozenset("aeiouy")
+
+
+def compute_syllables(word: str) -> int:
+    """
+    Count syllables of a normalized (lowercased, stripped) word
+
+    Uncached rule-based count: vowel groups, minus a silent trailing 'e',
+    plus one for a consonant + 'le' ending. Exceptions are handled by
+    SyllableCounter, not here.
+
+    Args:
+        word: Lowercased, stripped word
+
+    Returns:
+        Number of syllables (0 for words without letters)
+    """
+    word = _NON_ALPHA.sub('', word)
+
+    if not word:
+        return 0
+
+    # Count vowel groups
+    syllable_count = 0
+    previous_was_vowel = False
+
+    for char in word:
+        is_vowel = char in _VOWELS
+        if is_vowel and not previous_was_vowel:
+            syllable_count += 1
+        previous_was_vowel = is_vowel
+
+    # Adjust for silent 'e'
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+
+    # Special cases
+    if word.endswith('le') and len(word) > 2 and word[-3] not in _VOWELS:
+        syllable_count += 1
+
+    # Every word has at least one syllable
+    return max(1, syllable_count)
+
+
+class SyllableCounter:
+    """
+    Bounded memo table of syllable counts
+
+    Counts are keyed by the normalized word. The exception table is always
+    consulted first and never evicted; learned entries are evicted oldest
+    first once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = 50000, exceptions: Optional[Dict[str, int]] = None):
+        """
+        Initialize syllable counter
+
+        Args:
+            max_size: Maximum number of learned entries to keep
+            exceptions: Fixed word -> syllable count overrides
+        """
+        self.max_size = max(0, max_size)
+        self._exceptions: Dict[str, int] = dict(exceptions or {})
+        self._table: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def count(self, word: str) -> int:
+        """
+        Syllable count of a single word
+
+        Args:
+            word: Word to analyze
+
+        Returns:
+            Number of syllables
+        """
+        key = word.lower().strip()
+
+        value = self._exceptions.get(key)
+        if value is not None:
+            self._hits += 1
+            return value
+
+        value = self._table.get(key)
+        if value is not None:
+            self._hits += 1
+            return value
+
+        self._misses += 1
+        value = compute_syllables(key)
+        self._store(key, value)
+        return value
+
+    def count_batch(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Syllable counts for a token stream
+
+        Each distinct token is counted once; the result is aligned to words.
+
+        Args:
+            words: Sequence of words
+
+        Returns:
+            Integer array with one syllable count per word
+        """
+        words = words if isinstance(words, list) else list(words)
+
+        counts: Dict[str, int] = {}
+        for word in words:
+            if word not in counts:
+                counts[word] = self.count(word)
+
+        return np.fromiter((counts[word] for word in words), dtype=np.int64, count=len(words))
+
+    def _store(self, key: str, value: int):
+        """Insert a learned count, evicting the oldest entry when full"""
+        if self.max_size == 0:
+            return
+
+        table = self._table
+        if len(table) >= self.max_size:
+            try:
+                del table[next(iter(table))]
+            except (StopIteration, KeyError, RuntimeError):
+                # Another thread evicted concurrently; the table stays bounded
+                pass
+        table[key] = value
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get memo table statistics
+
+        Returns:
+            Dict with hits, misses, size, max_size and exceptions
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': len(self._table),
+            'max_size': self.max_size,
+            'exceptions': len(self._exceptions)
+        }
+
+    def clear(self):
+        """Drop learned entries (exceptions are kept)"""
+        self._table.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# Global syllable counter instance
+_global_counter: Optional[SyllableCounter] = None
+_counter_lock = Lock()
+
+
+def get_syllable_counter() -> SyllableCounter:
+    """
+    Get or create the process-wide syllable counter
+
+    Returns:
+        Global SyllableCounter seeded from settings.SYLLABLE_EXCEPTIONS
+    """
+    global _global_counter
+
+    if _global_counter is None:
+        with _counter_lock:
+            if _global_counter is None:  # Double-check locking
+                _global_counter = SyllableCounter(
+                    max_size=getattr(settings, 'SYLLABLE_CACHE_SIZE', 50000),
+                    exceptions=settings.SYLLABLE_EXCEPTIONS
+                )
+
+    return _global_counter
+
+
+def reset_syllable_counter():
+    """Reset the global syllable counter (useful for testing)"""
+    global _global_counter
+
+    with _counter_lock:
+        _global_counter = None
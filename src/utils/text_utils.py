@@ -2,16 +2,36 @@
 Text processing utilities
 """
 import re
-from typing import List, Tuple
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from config.settings import settings
+from typing import List, Optional, Sequence, Tuple
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+import numpy as np
+
+from src.core.resources import get_word_tokenizer
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.numeric_scanner import scan_numeric_mentions
+from src.utils.sentence_segmenter import get_segmenter
+from src.utils.syllables import get_syllable_counter
+
+# Tokens the word tokenizer emits in place of a double quote
+_QUOTE_TOKENS = ('``', "''", '"')
+
+FORWARD_KEYWORDS = [
+    'expect', 'anticipate', 'forecast', 'guidance', 'outlook',
+    'will', 'plan to', 'intend', 'project', 'estimate',
+    'believe', 'target', 'goal', 'objective', 'future'
+]
+
+BACKWARD_KEYWORDS = [
+    'was', 'were', 'had', 'did', 'reported', 'achieved',
+    'completed', 'delivered', 'generated', 'posted',
+    'last quarter', 'previous', 'prior', 'historical'
+]
+
+# Forward/backward keywords as one matcher: a sentence is lowercased once and
+# tested for both lists (classify_temporal batches all sentences)
+TEMPORAL_CUES = KeywordMatcher({'forward': FORWARD_KEYWORDS, 'backward': BACKWARD_KEYWORDS})
+FORWARD_BIT = TEMPORAL_CUES.bits['forward']
+BACKWARD_BIT = TEMPORAL_CUES.bits['backward']
 
 
 def clean_text(text: str) -> str:
@@ -47,7 +67,60 @@ def tokenize_sentences(text: str) -> List[str]:
     Returns:
         List of sentences
     """
-    return sent_tokenize(text)
+    return [text[start:end] for start, end in tokenize_sentence_spans(text)]
+
+
+def tokenize_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into sentences, returning character offsets
+    
+    Args:
+        text: Input text
+        
+    Uses the backend selected by settings.SENTENCE_SEGMENTER.
+    
+    Returns:
+        List of (start, end) offsets, one per sentence
+    """
+    return get_segmenter().spans(text)
+
+
+def tokenize_word_spans(sentence: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a single sentence into word tokens with character offsets
+    
+    Tokens match what word_tokenize produces for the sentence; offsets
+    locate each token in the sentence (quote tokens map to the quote
+    character they replaced).
+    
+    Args:
+        sentence: Sentence text
+        
+    Returns:
+        Tuple of (tokens, list of (start, end) offsets)
+    """
+    tokens = get_word_tokenizer().tokenize(sentence)
+    spans = []
+    cursor = 0
+    
+    for token in tokens:
+        candidates = _QUOTE_TOKENS if token in _QUOTE_TOKENS else (token,)
+        start = -1
+        match = token
+        for candidate in candidates:
+            index = sentence.find(candidate, cursor)
+            if index != -1 and (start == -1 or index < start):
+                start, match = index, candidate
+        
+        if start == -1:
+            # Token was rewritten by the tokenizer; pin it to the cursor
+            spans.append((cursor, cursor))
+            continue
+        
+        cursor = start + len(match)
+        spans.append((start, cursor))
+    
+    return tokens, spans
 
 
 def tokenize_words(text: str, lowercase: bool = True, remove_punct: bool = False) -> List[str]:
@@ -62,7 +135,13 @@ def tokenize_words(text: str, lowercase: bool = True, remove_punct: bool = False
     Returns:
         List of words
     """
-    words = word_tokenize(text)
+    # Equivalent to word_tokenize, with sentences from the configured segmenter
+    tokenizer = get_word_tokenizer()
+    words = [
+        word
+        for start, end in tokenize_sentence_spans(text)
+        for word in tokenizer.tokenize(text[start:end])
+    ]
     
     if lowercase:
         words = [w.lower() for w in words]
@@ -77,45 +156,31 @@ def count_syllables(word: str) -> int:
     """
     Count syllables in a word using rule-based approach
     
+    Counts are memoized per word type by the process-wide syllable counter.
+    
     Args:
         word: Word to analyze
         
     Returns:
         Number of syllables
     """
-    word = word.lower().strip()
-    
-    # Check exceptions first
-    if word in settings.SYLLABLE_EXCEPTIONS:
-        return settings.SYLLABLE_EXCEPTIONS[word]
-    
-    # Remove non-alphabetic characters
-    word = re.sub(r'[^a-z]', '', word)
-    
-    if len(word) == 0:
-        return 0
-    
-    # Count vowel groups
-    vowels = "aeiouy"
-    syllable_count = 0
-    previous_was_vowel = False
-    
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
-    
-    # Adjust for silent 'e'
-    if word.endswith('e') and syllable_count > 1:
-        syllable_count -= 1
-    
-    # Special cases
-    if word.endswith('le') and len(word) > 2 and word[-3] not in vowels:
-        syllable_count += 1
+    return get_syllable_counter().count(word)
+
+
+def find_numerical_tokens(sentence: str) -> List[str]:
+    """
+    Find numerical tokens in a single sentence
     
-    # Every word has at least one syllable
-    return max(1, syllable_count)
+    Args:
+        sentence: Sentence text
+        
+    Returns:
+        List of matched numbers, excluding bare years
+    """
+    return [
+        sentence[mention.start:mention.end]
+        for mention in scan_numeric_mentions(sentence, [(0, len(sentence))])
+    ]
 
 
 def extract_numerical_tokens(text: str) -> List[Tuple[str, str]]:
@@ -128,27 +193,13 @@ def extract_numerical_tokens(text: str) -> List[Tuple[str, str]]:
     Returns:
         List of tuples (number, context_sentence)
     """
-    sentences = tokenize_sentences(text)
-    numerical_tokens = []
-    
-    # Patterns for different number types
-    patterns = [
-        r'\$\s*\d+(?:\.\d+)?(?:\s*(?:million|billion|trillion|M|B|T))?',  # Currency
-        r'\d+(?:\.\d+)?%',  # Percentages
-        r'\d+(?:\.\d+)?(?:\s*(?:million|billion|trillion|M|B|T))?',  # Plain numbers with scale
-        r'\d+(?:,\d{3})*(?:\.\d+)?',  # Numbers with commas
-    ]
-    
-    combined_pattern = '|'.join(patterns)
+    spans = tokenize_sentence_spans(text)
+    sentences = [text[start:end] for start, end in spans]
     
-    for sentence in sentences:
-        matches = re.findall(combined_pattern, sentence, re.IGNORECASE)
-        for match in matches:
-            # Skip dates (simple heuristic)
-            if not re.match(r'^\d{4}$', match.strip()):
-                numerical_tokens.append((match, sentence))
-    
-    return numerical_tokens
+    return [
+        (text[mention.start:mention.end], sentences[mention.sentence_index])
+        for mention in scan_numeric_mentions(text, spans)
+    ]
 
 
 def count_complex_words(words: List[str]) -> int:
@@ -212,6 +263,67 @@ def split_into_chunks(text: str, chunk_size: int = 512, overlap: int = 128) -> L
     return chunks
 
 
+def pack_sentences(
+    word_counts: Sequence[int],
+    chunk_size: int = 512,
+    breaks: Sequence[int] = ()
+) -> List[Tuple[int, int]]:
+    """
+    Group consecutive sentences into chunks of at most chunk_size words
+    
+    Sentences are never split (a sentence longer than chunk_size is a chunk
+    of its own) and no chunk spans a break. Chunks are filled greedily from
+    each break, so the same run of sentences always yields the same chunks.
+    
+    Args:
+        word_counts: Words in each sentence
+        chunk_size: Maximum chunk size in words
+        breaks: Sentence indices that must start a new chunk
+        
+    Returns:
+        List of (first, last) sentence indices, last exclusive
+    """
+    breaks = set(breaks)
+    chunks = []
+    
+    start = 0
+    size = 0
+    for i, count in enumerate(word_counts):
+        if i > start and (i in breaks or size + count > chunk_size):
+            chunks.append((start, i))
+            start = i
+            size = 0
+        size += count
+    
+    if start < len(word_counts):
+        chunks.append((start, len(word_counts)))
+    
+    return chunks
+
+
+def split_into_sentence_chunks(text: str, chunk_size: int = 512) -> List[str]:
+    """
+    Split text into chunks of whole sentences for LLM processing
+    
+    Args:
+        text: Input text
+        chunk_size: Maximum chunk size in words
+        
+    Returns:
+        List of text chunks (contiguous slices of text)
+    """
+    spans = tokenize_sentence_spans(text)
+    word_counts = [
+        len(tokenize_words(text[start:end], lowercase=False, remove_punct=False))
+        for start, end in spans
+    ]
+    
+    return [
+        text[spans[first][0]:spans[last - 1][1]]
+        for first, last in pack_sentences(word_counts, chunk_size)
+    ]
+
+
 def calculate_word_character_ratio(text: str) -> Tuple[float, float]:
     """
     Calculate characters per word for Coleman-Liau Index
@@ -225,6 +337,20 @@ def calculate_word_character_ratio(text: str) -> Tuple[float, float]:
     words = tokenize_words(text, lowercase=False, remove_punct=False)
     sentences = tokenize_sentences(text)
     
+    return word_character_ratio(words, len(sentences))
+
+
+def word_character_ratio(words: List[str], sentence_count: int) -> Tuple[float, float]:
+    """
+    Calculate Coleman-Liau ratios from already tokenized words
+    
+    Args:
+        words: All word tokens (punctuation included)
+        sentence_count: Number of sentences
+        
+    Returns:
+        Tuple of (chars per 100 words, sentences per 100 words)
+    """
     if len(words) == 0:
         return 0.0, 0.0
     
@@ -232,60 +358,67 @@ def calculate_word_character_ratio(text: str) -> Tuple[float, float]:
     total_chars = sum(len(re.sub(r'[^a-zA-Z]', '', word)) for word in words)
     
     l = (total_chars / len(words)) * 100  # Letters per 100 words
-    s = (len(sentences) / len(words)) * 100  # Sentences per 100 words
+    s = (sentence_count / len(words)) * 100  # Sentences per 100 words
     
     return l, s
 
 
-def identify_forward_looking_statements(text: str) -> List[str]:
+def is_forward_looking(sentence: str) -> bool:
+    """Check whether a sentence contains forward-looking language"""
+    return bool(TEMPORAL_CUES.mask(sentence.lower()) & FORWARD_BIT)
+
+
+def is_backward_looking(sentence: str) -> bool:
+    """Check whether a sentence contains backward-looking language"""
+    return bool(TEMPORAL_CUES.mask(sentence.lower()) & BACKWARD_BIT)
+
+
+def classify_temporal(sentences: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify every sentence as forward- and/or backward-looking in one pass
+
+    Args:
+        sentences: Sentence strings
+
+    Returns:
+        Tuple of (forward, backward) boolean arrays over the sentence index
+    """
+    masks = TEMPORAL_CUES.masks(sentences)
+    forward = (masks & FORWARD_BIT) != 0
+    backward = (masks & BACKWARD_BIT) != 0
+
+    return forward, backward
+
+
+def identify_forward_looking_statements(text: str, sentences: Optional[List[str]] = None) -> List[str]:
     """
     Identify sentences containing forward-looking language
     
     Args:
         text: Input text
+        sentences: Pre-split sentences of text (avoids re-tokenizing)
         
     Returns:
         List of forward-looking sentences
     """
-    forward_keywords = [
-        'expect', 'anticipate', 'forecast', 'guidance', 'outlook',
-        'will', 'plan to', 'intend', 'project', 'estimate',
-        'believe', 'target', 'goal', 'objective', 'future'
-    ]
+    if sentences is None:
+        sentences = tokenize_sentences(text)
     
-    sentences = tokenize_sentences(text)
-    forward_sentences = []
-    
-    for sentence in sentences:
-        sentence_lower = sentence.lower()
-        if any(keyword in sentence_lower for keyword in forward_keywords):
-            forward_sentences.append(sentence)
-    
-    return forward_sentences
+    return [sentence for sentence in sentences if is_forward_looking(sentence)]
 
 
-def identify_backward_looking_statements(text: str) -> List[str]:
+def identify_backward_looking_statements(text: str, sentences: Optional[List[str]] = None) -> List[str]:
     """
     Identify sentences containing backward-looking language
     
     Args:
         text: Input text
+        sentences: Pre-split sentences of text (avoids re-tokenizing)
         
     Returns:
         List of backward-looking sentences
     """
-    backward_keywords = [
-        'was', 'were', 'had', 'did', 'reported', 'achieved',
-        'completed', 'delivered', 'generated', 'posted',
-        'last quarter', 'previous', 'prior', 'historical'
-    ]
-    
-    sentences = tokenize_sentences(text)
-    backward_sentences = []
-    
-    for sentence in sentences:
-        sentence_lower = sentence.lower()
-        if any(keyword in sentence_lower for keyword in backward_keywords):
-            backward_sentences.append(sentence)
+    if sentences is None:
+        sentences = tokenize_sentences(text)
     
-    return backward_sentences
+    return [sentence for sentence in sentences if is_backward_looking(sentence)]
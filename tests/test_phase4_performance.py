@@ -0,0 +1,2004 @@
+"""
+Test script for Phase 4 performance work
+
+Tests:
+1. Shared TokenizedDocument consumed by every analyzer
+2. Offset-indexed numeric scanner
+3. Memoized syllable engine
+4. Regex sentence segmenter backend
+5. Zero-copy section and speaker range views
+6. Line-oriented speaker turn parser
+7. Lazy resource registry and import-time budget
+8. Shared spaCy Doc cache with nlp.pipe batching
+9. Synthetic transcript generator and pipeline benchmark
+10. Compiled Loughran-McDonald lexicon with per-word category bitmask
+11. Vectorized multi-document lexicon scoring
+12. Single-pass readability kernel with range reductions
+13. Prefix-sum per-sentence complexity for hotspot detection
+14. Sentence-indexed forward/backward numeric classification
+15. Batched, cached LLM contextualization per sentence
+16. Keyword matcher for contextualization and temporal cues
+17. Shared sentence density vector with vectorized statistics
+18. Cumulative-sum cluster detection with configurable and multi-scale windows
+19. Incremental sentence density accumulator
+20. Async Ollama client with bounded fan-out
+21. In-flight coalescing of identical LLM requests
+22. Persistent prompt-level LLM response cache
+23. Sentence-aligned LLM chunks shared by overall, section and speaker sentiment
+24. Multi-endpoint Ollama pool with least-outstanding routing, ejection and async slots
+25. Adaptive LLM concurrency limit driven by latency and errors
+"""
+import logging
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Setup logging
+from config.logging_config import setup_logging
+setup_logging(log_level='INFO')
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SAMPLE_TRANSCRIPT = PROJECT_ROOT / "data" / "transcripts" / "sample_earnings_call.txt"
+
+# Import-time budget for `cli.py --help` (cumulative microseconds of
+# top-level imports reported by `python -X importtime`)
+CLI_IMPORT_BUDGET_US = 750_000
+
+# Modules that must only be imported on first use
+HEAVY_MODULES = ('spacy', 'nltk', 'ollama', 'httpx', 'weasyprint', 'plotly', 'openpyxl')
+
+SAMPLE_TEXT = (
+    "Revenue for Q3 was $1.5 billion, up 15% year-over-year. "
+    "We expect operating margin of approximately 22.5% next quarter. "
+    "This was driven by strong demand in our cloud segment, which we believe will continue. "
+    "Perhaps the results could have been somewhat better, but the company delivered. "
+    "Gross margin improved to 45.3% compared to 42.1% last year."
+)
+
+
+def _punkt_available() -> bool:
+    try:
+        import nltk
+        nltk.data.find('tokenizers/punkt')
+        return True
+    except LookupError:
+        return False
+
+
+requires_punkt = pytest.mark.skipif(not _punkt_available(), reason="NLTK punkt data not installed")
+
+
+@requires_punkt
+def test_tokenized_document_matches_tokenizers():
+    """TokenizedDocument reproduces tokenize_sentences/tokenize_words exactly"""
+    from src.core.tokenized_document import TokenizedDocument
+    from src.utils.text_utils import tokenize_sentences, tokenize_words
+
+    doc = TokenizedDocument.from_text(SAMPLE_TEXT)
+
+    assert doc.sentences == tokenize_sentences(SAMPLE_TEXT)
+    for lowercase in (True, False):
+        for remove_punct in (True, False):
+            assert doc.words(lowercase, remove_punct) == tokenize_words(SAMPLE_TEXT, lowercase, remove_punct)
+
+    # Spans point back at the token text
+    for token, (start, end) in zip(doc.tokens, doc.token_spans.tolist()):
+        assert SAMPLE_TEXT[start:end] == token
+
+    # Per-sentence views agree with tokenizing each sentence on its own
+    counts = doc.sentence_token_counts(remove_punct=True)
+    for i, sentence in enumerate(doc.sentences):
+        words = tokenize_words(sentence, lowercase=False, remove_punct=True)
+        assert doc.sentence_words(i, lowercase=False, remove_punct=True) == words
+        assert counts[i] == len(words)
+
+    logger.info("✅ TokenizedDocument matches NLTK tokenization")
+
+
+@requires_punkt
+def test_analyze_document_matches_analyze():
+    """Every analyzer's analyze_document agrees with analyze(text)"""
+    from src.core.tokenized_document import TokenizedDocument
+    from src.analysis.complexity.readability import ComplexityAnalyzer
+    from src.analysis.numerical.transparency import NumericalAnalyzer
+    from src.analysis.sentiment.lexicon_analyzer import LexiconSentimentAnalyzer
+    from src.analysis.numerical.sentence_density import SentenceLevelDensityAnalyzer
+    from src.analysis.deception.evasiveness import EvasivenessAnalyzer
+
+    doc = TokenizedDocument.from_text(SAMPLE_TEXT)
+
+    analyzers = [
+        (ComplexityAnalyzer(), 'analyze'),
+        (NumericalAnalyzer(use_llm_contextualization=False), 'analyze'),
+        (LexiconSentimentAnalyzer(), 'analyze'),
+        (SentenceLevelDensityAnalyzer(), 'analyze_sentence_density'),
+        (EvasivenessAnalyzer(), 'analyze'),
+    ]
+
+    for analyzer, method in analyzers:
+        expected = asdict(getattr(analyzer, method)(SAMPLE_TEXT))
+        actual = asdict(analyzer.analyze_document(doc))
+        assert actual == expected, analyzer.__class__.__name__
+
+    logger.info("✅ analyze_document matches analyze for all analyzers")
+
+
+@requires_punkt
+def test_transcript_processor_builds_document_once():
+    """ProcessedTranscript carries one document shared by its token views"""
+    from src.core.transcript_processor import TranscriptProcessor
+
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+
+    assert transcript._document is not None
+    doc = transcript.document
+    assert transcript.document is doc
+    assert transcript.sentences is doc.sentences
+    assert transcript.word_count == doc.token_count
+
+    logger.info("✅ Transcript tokenized once during processing")
+
+
+def test_numeric_scanner_records():
+    """Scanner returns (start, end, kind, sentence_index) records in one pass"""
+    from src.utils.numeric_scanner import NumericIndex, scan_numeric_mentions
+
+    text = "Revenue was $1.5 billion in 2023. Margin rose 45.3% on 12 stores. Thanks."
+    spans = [(0, 33), (34, 65), (66, 73)]
+
+    mentions = scan_numeric_mentions(text, spans)
+
+    assert [(text[m.start:m.end], m.kind, m.sentence_index) for m in mentions] == [
+        ("$1.5 billion", "currency", 0),
+        ("45.3%", "percent", 1),
+        ("12", "number", 1),
+    ]
+
+    index = NumericIndex.build(text, spans)
+    assert index.counts_per_sentence().tolist() == [1, 2, 0]
+    assert index.texts() == ["$1.5 billion", "45.3%", "12"]
+
+    logger.info("✅ Numeric scanner records mentions with sentence indices")
+
+
+def test_numeric_scanner_respects_sentence_boundaries():
+    """Matches never cross a sentence end, as with per-sentence scanning"""
+    from src.utils.numeric_scanner import scan_numeric_mentions
+
+    # "5 M" would match as a scaled number if the boundary were ignored
+    text = "We closed 5 Many stores opened."
+    spans = [(0, 11), (12, 31)]
+
+    mentions = scan_numeric_mentions(text, spans)
+
+    assert [(text[m.start:m.end], m.kind, m.sentence_index) for m in mentions] == [("5", "number", 0)]
+
+    logger.info("✅ Numeric scanner confines matches to sentences")
+
+
+def test_syllable_counter_batch_and_cache():
+    """Batch counts align with tokens and each word type is counted once"""
+    from src.utils.syllables import SyllableCounter, compute_syllables
+
+    counter = SyllableCounter(max_size=3, exceptions={'ebitda': 4})
+    words = ["Revenue", "revenue", "EBITDA", "growth", "table", "revenue"]
+
+    counts = counter.count_batch(words)
+    assert counts.tolist() == [2, 2, 4, 1, 2, 2]
+    assert counts.tolist() == [counter.count(w) for w in words]
+
+    info = counter.cache_info()
+    # "Revenue" and "revenue" share a normalized entry; exceptions are not stored
+    assert info['misses'] == 3
+    assert info['size'] == 3
+
+    # Bounded: the oldest learned entry is evicted, exceptions never are
+    counter.count("quarterly")
+    assert counter.cache_info()['size'] == 3
+    assert counter.count("ebitda") == 4
+    assert compute_syllables("") == 0
+
+    logger.info("✅ Syllable engine memoizes per word type")
+
+
+def test_regex_segmenter_financial_abbreviations():
+    """Regex backend keeps abbreviations and decimals inside sentences"""
+    from src.utils.sentence_segmenter import get_segmenter
+
+    text = (
+        "Acme Corp. grew revenue to $1.2 billion, up 3.5% in the U.S. "
+        "We expect Q1. margins near 22.5%. Mr. Smith of Widgets Inc. agreed! "
+        "Any questions?"
+    )
+
+    spans = get_segmenter('regex').spans(text)
+
+    assert [text[start:end] for start, end in spans] == [
+        "Acme Corp. grew revenue to $1.2 billion, up 3.5% in the U.S.",
+        "We expect Q1. margins near 22.5%.",
+        "Mr. Smith of Widgets Inc. agreed!",
+        "Any questions?",
+    ]
+
+    logger.info("✅ Regex segmenter handles financial abbreviations")
+
+
+def test_segmenter_backend_selected_from_settings(monkeypatch):
+    """tokenize_sentences and tokenize_words route through the configured backend"""
+    from config.settings import settings
+    from src.utils.text_utils import tokenize_sentences, tokenize_words
+
+    monkeypatch.setattr(settings, 'SENTENCE_SEGMENTER', 'regex')
+
+    assert len(tokenize_sentences(SAMPLE_TEXT)) == 5
+    words = tokenize_words(SAMPLE_TEXT, lowercase=False, remove_punct=True)
+    assert words[:4] == ["Revenue", "for", "Q3", "was"]
+
+    monkeypatch.setattr(settings, 'SENTENCE_SEGMENTER', 'unknown')
+    with pytest.raises(ValueError):
+        tokenize_sentences(SAMPLE_TEXT)
+
+    logger.info("✅ Sentence segmenter selected from settings")
+
+
+def test_text_range_map_materializes_lazily():
+    """Range maps keep offsets and only build strings on lookup"""
+    from src.core.text_ranges import TextRangeMap
+
+    source = "Intro text. CEO: Revenue grew. Analyst: Why? CEO: Demand."
+    ranges = TextRangeMap(source, {'ceo': [(17, 30), (50, 57)], 'analyst': [(40, 44)], 'cfo': []})
+
+    assert len(ranges) == 3 and 'ceo' in ranges
+    assert not ranges._materialized
+    assert ranges.ranges('ceo') == [(17, 30), (50, 57)]
+    assert ranges.char_count('ceo') == 20
+    assert not ranges.has_text('cfo')
+
+    assert ranges['ceo'] == "Revenue grew. Demand."
+    assert ranges['cfo'] == ""
+    assert dict(ranges) == {'ceo': "Revenue grew. Demand.", 'analyst': "Why?", 'cfo': ""}
+
+    logger.info("✅ TextRangeMap materializes on demand")
+
+
+def test_document_restrict_reuses_tokens():
+    """A range view holds the covered tokens and clipped sentences"""
+    from src.core.tokenized_document import TokenizedDocument
+
+    doc = TokenizedDocument.from_text(SAMPLE_TEXT)
+    second, fourth = doc.sentence_spans[1].tolist(), doc.sentence_spans[3].tolist()
+
+    view = doc.restrict([second, fourth])
+
+    assert view.source is doc.source
+    assert view.sentences == [doc.sentences[1], doc.sentences[3]]
+    assert view.words(False, True) == doc.sentence_words(1, False, True) + doc.sentence_words(3, False, True)
+    assert view.text == doc.sentences[1] + ' ' + doc.sentences[3]
+    assert view.numeric_index.texts() == ["22.5%"]
+
+    # A range inside a sentence clips it
+    start = SAMPLE_TEXT.index("operating margin")
+    clipped = doc.restrict([(start, start + len("operating margin"))])
+    assert clipped.sentences == ["operating margin"]
+    assert clipped.words() == ["operating", "margin"]
+
+    logger.info("✅ Document range views reuse tokenization")
+
+
+@requires_punkt
+def test_transcript_sections_are_range_views():
+    """Sections and speakers are ranges of cleaned_text analyzed as views"""
+    from src.core.text_ranges import TextRangeMap
+    from src.core.transcript_processor import TranscriptProcessor
+    from src.analysis.complexity.readability import ComplexityAnalyzer
+    from src.utils.text_utils import clean_text
+
+    processor = TranscriptProcessor()
+    transcript = processor.process(str(SAMPLE_TRANSCRIPT))
+
+    assert isinstance(transcript.sections, TextRangeMap)
+    assert transcript.sections.source is transcript.cleaned_text
+    assert dict(transcript.sections) == processor.split_sections(transcript.cleaned_text)
+    assert dict(transcript.speakers) == {
+        name: ' '.join(clean_text(segment) for segment in segments)
+        for name, segments in processor.identify_speakers(transcript.raw_text).items()
+    }
+
+    views = transcript.section_documents()
+    assert transcript.section_documents() is views
+    analyzer = ComplexityAnalyzer()
+    for name, view in views.items():
+        assert view.source is transcript.cleaned_text
+        assert asdict(analyzer.analyze_document(view)) == asdict(analyzer.analyze(transcript.sections[name]))
+
+    logger.info("✅ Section and speaker views analyzed without re-tokenizing")
+
+
+def test_speaker_turn_parser_lines():
+    """Turn headers are recognized per line and turns end at the next header"""
+    from src.core.transcript_processor import TranscriptProcessor
+
+    raw = (
+        "Company: Acme\n"
+        "\n"
+        "PREPARED REMARKS\n"
+        "Jane Doe - Chief Executive Officer: Revenue grew 10%.\n"
+        "Margins held.\n"
+        "\n"
+        "QUESTIONS AND ANSWERS\n"
+        "Operator: First question.\n"
+        "Bob Lee (Analyst): Why?\n"
+        "Sam Roe - Chief Financial Officer: Demand.\n"
+    )
+
+    turns = TranscriptProcessor().identify_speaker_turns(raw)
+
+    assert [(t.speaker, t.role, raw[t.start:t.end]) for t in turns] == [
+        ("Jane Doe", "ceo", "Revenue grew 10%.\nMargins held."),
+        ("Operator", "operator", "First question."),
+        ("Bob Lee", "analyst", "Why?"),
+        ("Sam Roe", "cfo", "Demand."),
+    ]
+
+    logger.info("✅ Speaker turns parsed line by line")
+
+
+def test_speaker_turn_parser_pathological_input_is_linear():
+    """Inputs that made the old regex backtrack parse in bounded time"""
+    import time
+    from src.core.transcript_processor import TranscriptProcessor
+
+    processor = TranscriptProcessor()
+    # Header-like fragments with no colon, on one line and on many lines
+    one_line = "Aaa Bbb - (Ccc " * 100_000
+    many_lines = "Aaa Bbb - Ccc (Ddd\n" * 100_000
+
+    for text in (one_line, many_lines):
+        start = time.perf_counter()
+        assert processor.identify_speaker_turns(text) == []
+        assert time.perf_counter() - start < 5.0
+
+    logger.info("✅ Speaker parser runs in linear time on pathological input")
+
+
+def _import_profile(*args):
+    """Run python -X importtime and return {top-level module: cumulative us}"""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imported[name.rstrip()] = int(cumulative)
+    return imported
+
+
+def test_resource_registry_loads_once():
+    """Registered loaders run once and the result is shared"""
+    from src.core.resources import ResourceRegistry
+
+    registry = ResourceRegistry()
+    calls = []
+    registry.register('model', lambda: calls.append(1) or object())
+
+    assert not registry.is_loaded('model')
+    first = registry.get('model')
+    assert registry.get('model') is first
+    assert calls == [1]
+
+    registry.reset('model')
+    assert registry.get('model') is not first
+    assert calls == [1, 1]
+
+    with pytest.raises(KeyError):
+        registry.get('missing')
+
+    logger.info("✅ Resource registry loads each resource once")
+
+
+def test_cli_help_import_budget():
+    """cli.py --help stays within its import-time budget and loads no models"""
+    imported = _import_profile('cli.py', '--help')
+
+    top_level = {name: us for name, us in imported.items() if not name.startswith(' ')}
+    total = sum(top_level.values())
+    loaded = {name.strip().split('.')[0] for name in imported}
+
+    assert total < CLI_IMPORT_BUDGET_US, f"cli.py --help imports took {total / 1000:.0f} ms"
+    assert not loaded & set(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
+
+    logger.info(f"✅ cli.py --help imports in {total / 1000:.0f} ms")
+
+
+def test_analysis_import_is_lazy():
+    """Importing the analysis pipeline does not load NLP models or clients"""
+    imported = _import_profile('-c', 'import src.analysis.aggregator, src.reporting')
+    loaded = {name.strip().split('.')[0] for name in imported}
+
+    assert not loaded & set(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
+
+    logger.info("✅ Analysis modules import without heavy dependencies")
+
+
+class _FakeDoc(list):
+    """Stand-in for a spaCy Doc: no tokens, entities or noun chunks"""
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.ran = []
+        self.ents = []
+        self.noun_chunks = []
+
+
+class _FakePipeline:
+    """Stand-in for a spaCy Language that records what it parses"""
+
+    pipe_names = ['tagger', 'parser', 'lemmatizer', 'ner']
+
+    def __init__(self):
+        self.piped = []
+        self.pipeline = [(name, self._component(name)) for name in self.pipe_names]
+
+    @staticmethod
+    def _component(name):
+        def component(doc):
+            doc.ran.append(name)
+            return doc
+        return component
+
+    def pipe(self, texts, batch_size, n_process, disable):
+        texts = list(texts)
+        self.piped.append((texts, sorted(disable)))
+        for text in texts:
+            doc = _FakeDoc(text)
+            doc.ran.extend(name for name in self.pipe_names if name not in disable)
+            yield doc
+
+
+def test_spacy_doc_cache_batches_and_completes():
+    """Texts are parsed once per batch; skipped components are added on demand"""
+    from src.core.doc_cache import SpacyDocCache
+
+    nlp = _FakePipeline()
+    cache = SpacyDocCache(nlp, max_size=2, batch_size=8)
+
+    docs = cache.pipe(['a', 'b', 'a'], disable=('ner', 'unknown'))
+    assert nlp.piped == [(['a', 'b'], ['ner'])]
+    assert docs[0] is docs[2]
+
+    # A consumer needing ner reuses the Doc and only runs ner on it
+    doc = cache.get('a', disable=('lemmatizer',))
+    assert doc is docs[0]
+    assert doc.ran == ['tagger', 'parser', 'lemmatizer', 'ner']
+    assert len(nlp.piped) == 1
+
+    # LRU eviction
+    cache.get('c')
+    assert cache.cache_info()['size'] == 2
+    cache.get('b')
+    assert nlp.piped[-1][0] == ['b']
+
+    logger.info("✅ spaCy Doc cache batches and completes Docs")
+
+
+def test_deception_modules_share_spacy_docs():
+    """Passive voice detection and topic extraction share parsed Docs"""
+    from src.core.doc_cache import SpacyDocCache
+    from src.core.resources import registry
+    from src.analysis.deception.linguistic_markers import LinguisticDeceptionMarkers
+    from src.analysis.deception.question_evasion import QuestionEvasionDetector
+
+    nlp = _FakePipeline()
+    registry.set('spacy_docs', SpacyDocCache(nlp))
+    try:
+        question = "What drove the margin expansion this quarter?"
+        response = "Lower input costs and pricing drove most of the expansion."
+        qa_text = f"Analyst - Firm\n{question}\n\nCFO - Company\n{response}"
+
+        detector = QuestionEvasionDetector()
+        detector.use_llm = False
+        detector.analyze_qa_section(qa_text)
+
+        # Questions and responses are parsed in a single batch
+        assert nlp.piped == [([question, response], ['lemmatizer'])]
+
+        LinguisticDeceptionMarkers().detect_passive_voice(response)
+        assert len(nlp.piped) == 1
+    finally:
+        registry.reset('spacy_docs')
+
+    logger.info("✅ Deception modules share spaCy Docs")
+
+
+def test_synthetic_transcript_generator():
+    """Generated transcripts hit the word budget and parse into speakers and Q&A"""
+    from benchmarks.synthetic_transcript import SentencePool, generate_transcript
+    from src.core.transcript_processor import TranscriptProcessor
+    from src.utils.text_utils import clean_text
+
+    pool = SentencePool()
+    text = generate_transcript(5000, speakers=3, qa_pairs=6, numeric_density=0.5, seed=7, pool=pool)
+
+    assert text == generate_transcript(5000, speakers=3, qa_pairs=6, numeric_density=0.5, seed=7, pool=pool)
+    assert 4500 <= len(text.split()) <= 5000
+
+    processor = TranscriptProcessor()
+    turns = processor.identify_speaker_turns(text)
+    roles = {turn.role for turn in turns}
+    assert {'ceo', 'cfo', 'coo', 'operator'} <= roles
+    assert sum(1 for turn in turns if turn.role is None) == 6
+
+    sections = processor.split_section_ranges(clean_text(text))
+    assert sections['qa'][1] > sections['qa'][0]
+
+    logger.info("✅ Synthetic transcript generator")
+
+
+def test_pipeline_benchmark_smoke():
+    """The pipeline benchmark times every stage with and without the fake LLM"""
+    from benchmarks.pipeline import run
+
+    report = run([1000], ['no_llm', 'fake_llm'], memory=False)
+    by_mode = {r['mode']: r for r in report['results']}
+
+    assert by_mode['no_llm']['llm_calls'] == 0
+    assert by_mode['fake_llm']['llm_calls'] > 0
+    for result in by_mode.values():
+        assert {'transcript_preprocessing', 'sentiment_analysis', 'insights_generation'} <= set(result['stages'])
+        assert result['words_per_second'] > 0
+
+    logger.info("✅ Pipeline benchmark runs in both modes")
+
+
+def test_compiled_lexicon_round_trip(tmp_path, monkeypatch):
+    """The binary lexicon matches the word lists and is rebuilt when they change"""
+    import os
+    from src.analysis.sentiment import compiled_lexicon
+    from src.analysis.sentiment.compiled_lexicon import CompiledLexicon, load_lexicon
+    from config.settings import settings
+
+    source = tmp_path / "lm"
+    source.mkdir()
+    (source / "negative.txt").write_text("LOSS\ndecline\n")
+    (source / "uncertainty.txt").write_text("may\ndecline\n")
+    compiled_path = tmp_path / "lm.bin"
+
+    lexicon = load_lexicon(source, compiled_path)
+    assert compiled_path.exists()
+    assert lexicon.bitmasks == {'loss': 0b1, 'decline': 0b101, 'may': 0b100}
+
+    loaded = CompiledLexicon.load(compiled_path)
+    assert loaded.bitmasks == lexicon.bitmasks
+    assert loaded.fingerprint == lexicon.fingerprint
+
+    # Editing a word list invalidates the compiled file
+    (source / "positive.txt").write_text("growth\n")
+    assert load_lexicon(source, compiled_path).bitmasks['growth'] == 0b10
+    assert CompiledLexicon.load(compiled_path).bitmasks['growth'] == 0b10
+
+    # Unchanged stats: the word lists are not read at all
+    def unexpected(*args):
+        raise AssertionError("word lists read")
+
+    with monkeypatch.context() as m:
+        m.setattr(compiled_lexicon, 'source_fingerprint', unexpected)
+        m.setattr(CompiledLexicon, 'from_word_lists', unexpected)
+        assert load_lexicon(source, compiled_path).bitmasks['growth'] == 0b10
+
+    # Touched but unchanged: hashed once, not recompiled, new stats stored
+    stat = (source / "negative.txt").stat()
+    os.utime(source / "negative.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with monkeypatch.context() as m:
+        m.setattr(CompiledLexicon, 'from_word_lists', unexpected)
+        assert load_lexicon(source, compiled_path).bitmasks['loss'] == 0b1
+    assert CompiledLexicon.load(compiled_path).stats == compiled_lexicon.source_stats(source)
+
+    # Without a compiled_path, a custom dictionary compiles into the cache directory
+    monkeypatch.setattr(settings, 'CACHE_DIR', tmp_path / "cache")
+    compiled_path.unlink()
+    load_lexicon(source)
+    assert not source.with_suffix('.bin').exists()
+    assert len(list((tmp_path / "cache" / "lexicons").glob("lm-*.bin"))) == 1
+
+    logger.info("✅ Compiled lexicon round trip")
+
+
+def test_lexicon_counts_match_per_word_lookup():
+    """Bitmask counting over distinct words matches per-word category lookup"""
+    from src.analysis.sentiment.lexicon_analyzer import LexiconSentimentAnalyzer
+    from src.utils.text_utils import tokenize_words
+
+    analyzer = LexiconSentimentAnalyzer()
+    words = tokenize_words(SAMPLE_TEXT * 3, lowercase=True, remove_punct=True)
+    words += ['loss', 'may', 'could', 'litigation', 'uncertain', 'must']
+
+    expected = dict.fromkeys(analyzer.dictionary.categories, 0)
+    for word in words:
+        for category, word_set in analyzer.dictionary.dictionaries.items():
+            if word in word_set:
+                expected[category] += 1
+
+    assert analyzer.dictionary.count_categories(words) == expected
+    assert analyzer.get_sentiment_words('Losses may decline.', 'uncertainty') == ['may']
+
+    logger.info("✅ Lexicon bitmask counts match")
+
+
+def test_lexicon_batch_matches_per_document_scores():
+    """Batch lexicon scores equal per-document scores for splits and across transcripts"""
+    from src.analysis.sentiment.lexicon_analyzer import LexiconSentimentAnalyzer
+    from src.core.transcript_processor import TranscriptProcessor
+    from src.core.tokenized_document import TokenizedDocument
+
+    analyzer = LexiconSentimentAnalyzer()
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+
+    documents = [transcript.document]
+    documents += list(transcript.section_documents().values())
+    documents += list(transcript.speaker_documents().values())
+    documents += [TokenizedDocument.from_text(SAMPLE_TEXT), TokenizedDocument.from_text(''), 'Losses may rise.']
+
+    expected = [
+        analyzer._score_words(analyzer_words)
+        for analyzer_words in (
+            (doc if isinstance(doc, TokenizedDocument) else TokenizedDocument.from_text(doc)).words(
+                lowercase=True, remove_punct=True
+            )
+            for doc in documents
+        )
+    ]
+
+    assert analyzer.analyze_batch(documents) == expected
+
+    # Memoized per document
+    assert analyzer.analyze_document(transcript.document) is analyzer.analyze_batch([transcript.document])[0]
+    assert analyzer.analyze_by_section(transcript.section_documents()) == dict(
+        zip(transcript.section_documents().keys(), expected[1:1 + len(transcript.section_documents())])
+    )
+
+    logger.info("✅ Batch lexicon scores match per-document scores")
+
+
+def test_readability_range_reductions_match_views():
+    """Section and speaker complexity reduce over the parent's feature arrays"""
+    from src.analysis.complexity.readability import ComplexityAnalyzer, ReadabilityFeatures
+    from src.core.transcript_processor import TranscriptProcessor
+
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+    analyzer = ComplexityAnalyzer()
+
+    views = {**transcript.section_documents(), **transcript.speaker_documents()}
+    for name, view in views.items():
+        if view.token_count:
+            assert ReadabilityFeatures.totals_for(view) == ReadabilityFeatures(view).totals(), name
+
+    # Features are computed once, on the parent document
+    analyzer.analyze_by_speaker(transcript.speaker_documents())
+    assert 'readability_features' in transcript.document._cache
+    assert all('readability_features' not in view._cache for view in transcript.speaker_documents().values())
+
+    totals = ReadabilityFeatures.totals_for(transcript.document)
+    scores = analyzer.analyze_document(transcript.document)
+    assert (scores.word_count, scores.syllable_count, scores.complex_word_count) == (
+        totals.word_count, totals.syllable_count, totals.complex_count
+    )
+
+    logger.info("✅ Readability range reductions match")
+
+
+def test_sentence_complexity_matches_per_sentence_analysis():
+    """Vectorized per-sentence scores equal analyze() on each sentence; hotspots use them"""
+    from src.analysis.complexity.readability import ComplexityAnalyzer
+    from src.analysis.deception.detector import DeceptionRiskAnalyzer
+    from src.core.transcript_processor import TranscriptProcessor
+
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+    doc = transcript.document
+    analyzer = ComplexityAnalyzer()
+
+    scores = analyzer.sentence_scores(doc)
+    assert len(scores) == doc.sentence_count
+    assert scores.tolist() == [analyzer.analyze(sentence).composite_score for sentence in doc.sentences]
+
+    # Previous hotspot selection: full analysis of every sentence of 10+ tokens
+    token_counts = doc.sentence_token_counts(remove_punct=False)
+    expected = sorted(
+        (
+            (sentence, analyzer.analyze(sentence).composite_score)
+            for i, sentence in enumerate(doc.sentences)
+            if token_counts[i] >= 10 and analyzer.analyze(sentence).composite_score > 75
+        ),
+        key=lambda x: x[1], reverse=True
+    )[:5]
+    assert DeceptionRiskAnalyzer()._find_complexity_hotspots(transcript) == expected
+
+    logger.info("✅ Per-sentence complexity matches")
+
+
+def test_temporal_density_is_sentence_indexed():
+    """Forward/backward flags match the keyword lists; mentions count by sentence index"""
+    from src.analysis.numerical.transparency import NumericalAnalyzer
+    from src.core.tokenized_document import TokenizedDocument
+    from src.utils.text_utils import BACKWARD_KEYWORDS, FORWARD_KEYWORDS
+
+    doc = TokenizedDocument.from_text(SAMPLE_TRANSCRIPT.read_text(encoding='utf-8'))
+    sentences = doc.sentences
+    forward, backward = NumericalAnalyzer.temporal_flags(doc)
+
+    assert forward.tolist() == [any(k in s.lower() for k in FORWARD_KEYWORDS) for s in sentences]
+    assert backward.tolist() == [any(k in s.lower() for k in BACKWARD_KEYWORDS) for s in sentences]
+    assert NumericalAnalyzer.temporal_flags(doc) is doc._cache['temporal_flags']
+
+    # Previous substring matching of each mention's sentence against the statements
+    tokens = doc.numerical_tokens()
+    forward_statements = [s for s, f in zip(sentences, forward) if f]
+    backward_statements = [s for s, b in zip(sentences, backward) if b]
+    expected_forward = sum(1 for _, context in tokens if any(context in stmt for stmt in forward_statements))
+    expected_backward = sum(1 for _, context in tokens if any(context in stmt for stmt in backward_statements))
+
+    scores = NumericalAnalyzer(use_llm_contextualization=False).analyze_document(doc)
+    assert scores.forward_numerical_tokens == expected_forward
+    assert scores.backward_numerical_tokens == expected_backward
+
+    logger.info("✅ Temporal density is sentence indexed")
+
+
+class _BatchContextClient:
+    """Records assess_contextualization_batch calls; scores by number length"""
+
+    def __init__(self):
+        self.calls = []
+
+    def assess_contextualization_batch(self, numbers, context):
+        self.calls.append((context, list(numbers)))
+        return [{'overall_score': float(len(number) % 4)} for number in numbers]
+
+
+def test_llm_contextualization_is_batched_per_sentence(tmp_path):
+    """One request per distinct sentence, results mapped back per token and cached"""
+    from src.analysis.numerical.transparency import NumericalAnalyzer
+    from src.cache.result_cache import ResultCache
+    from src.core.tokenized_document import TokenizedDocument
+
+    doc = TokenizedDocument.from_text(SAMPLE_TEXT + " " + SAMPLE_TEXT)
+    tokens = doc.numerical_tokens()
+
+    analyzer = NumericalAnalyzer(use_llm_contextualization=True)
+    analyzer.cache = ResultCache(cache_dir=tmp_path, enabled=True)
+    analyzer.client = client = _BatchContextClient()
+
+    scores = analyzer._llm_contextualization(tokens)
+    assert scores == [float(len(number) % 4) for number, _ in tokens]
+
+    # The text is repeated: each numeric sentence is sent once with its numbers
+    sentences = list(dict.fromkeys(context for _, context in tokens))
+    assert [context for context, _ in client.calls] == sentences
+    assert sum(len(numbers) for _, numbers in client.calls) == len(tokens) // 2
+
+    # Second pass is served from the cache
+    analyzer.client = cached_client = _BatchContextClient()
+    quality, well, under = analyzer._calculate_contextualization(tokens)
+    assert cached_client.calls == []
+    assert quality == pytest.approx(sum(scores) / len(scores) / 3.0)
+    assert well == sum(1 for score in scores if score >= 2.5)
+    assert under == sum(1 for score in scores if score <= 1.0)
+
+    logger.info("✅ LLM contextualization is batched per sentence")
+
+
+def test_contextualization_fallbacks_are_not_cached(tmp_path):
+    """A batch answered with neutral defaults is asked again, then cached once valid"""
+    import json
+    from src.analysis.numerical.transparency import NumericalAnalyzer
+    from src.cache.result_cache import ResultCache
+    from src.models.ollama_client import OllamaClient
+
+    replies = iter(['{}', json.dumps({'assessments': [{'overall_score': 3.0}]})])
+
+    class ReplyClient:
+        def assess_contextualization_batch(self, numbers, context):
+            return OllamaClient._parse_contextualization_batch(next(replies), len(numbers))
+
+    analyzer = NumericalAnalyzer(use_llm_contextualization=True)
+    analyzer.cache = ResultCache(cache_dir=tmp_path, enabled=True)
+    analyzer.client = ReplyClient()
+    tokens = [('15%', 'Revenue grew 15%.')]
+
+    assert analyzer._llm_contextualization(tokens) == [1.5]
+    assert analyzer._llm_contextualization(tokens) == [3.0]
+    # The valid answer is cached; no reply is left for a third request
+    assert analyzer._llm_contextualization(tokens) == [3.0]
+
+    logger.info("✅ Contextualization fallbacks are not cached")
+
+
+def test_batch_contextualization_response_parsing():
+    """Batch responses are unwrapped and padded with the neutral default"""
+    import json
+    from src.models.ollama_client import OllamaClient
+
+    client = OllamaClient.__new__(OllamaClient)
+    replies = iter([
+        json.dumps({'assessments': [{'overall_score': 3.0}]}),
+        json.dumps([{'overall_score': 0.5}, {'overall_score': 2.0}]),
+        'not json',
+    ])
+    client.generate = lambda **kwargs: next(replies)
+
+    first = client.assess_contextualization_batch(['1%', '2%'], 'Margin rose 1% to 2%.')
+    assert [a['overall_score'] for a in first] == [3.0, 1.5]
+    second = client.assess_contextualization_batch(['1%', '2%'], 'Margin rose 1% to 2%.')
+    assert [a['overall_score'] for a in second] == [0.5, 2.0]
+    third = client.assess_contextualization_batch(['1%'], 'Margin rose 1%.')
+    assert [a['overall_score'] for a in third] == [1.5]
+
+
+def test_keyword_matcher_matches_substring_scans():
+    """Category bitmasks equal any(cue in text) per category, overlapping cues included"""
+    from src.utils.keyword_matcher import KeywordMatcher
+
+    categories = {
+        'short': ['driven', 'vs', 'will'],
+        'long': ['driven by', 'versus', 'goodwill'],
+        'inner': ['rive', 'ill'],
+    }
+    matcher = KeywordMatcher(categories)
+    texts = [
+        'growth driven by cloud', 'driven', 'versus last year', 'goodwill impairment',
+        'we will grow', 'nothing here', '', 'revs vs plan', 'drive', SAMPLE_TEXT.lower(),
+    ]
+
+    for text in texts:
+        expected = sum(
+            matcher.bits[name] for name, cues in categories.items()
+            if any(cue in text for cue in cues)
+        )
+        assert matcher.mask(text) == expected, text
+
+    # The batch scan over all texts agrees with the per-text scan
+    assert matcher.masks(texts, lowercase=False).tolist() == [matcher.mask(text) for text in texts]
+    assert matcher.masks([]).tolist() == []
+    assert matcher.masks(['Driven By', 'x']).tolist() == [
+        matcher.bits['short'] | matcher.bits['long'] | matcher.bits['inner'], 0
+    ]
+
+    # The benchmark's naive scans agree with both matcher paths
+    from benchmarks.keyword_cues import run
+    assert all(result['identical'] for result in run(200, 1))
+
+    logger.info("✅ Keyword matcher matches substring scans")
+
+
+def test_rule_based_contextualization_uses_shared_cues():
+    """Cue scores match the per-category scans; the matcher is built once"""
+    from config.settings import settings
+    from src.analysis.numerical.transparency import NumericalAnalyzer
+    from src.core.resources import get_contextualization_cues
+    from src.core.tokenized_document import TokenizedDocument
+
+    assert get_contextualization_cues() is get_contextualization_cues()
+
+    cue_lists = (
+        settings.CONTEXT_COMPARISON_CUES,
+        settings.CONTEXT_EXPLANATION_CUES,
+        settings.CONTEXT_IMPLICATION_CUES,
+    )
+    doc = TokenizedDocument.from_text(SAMPLE_TRANSCRIPT.read_text(encoding='utf-8'))
+    tokens = doc.numerical_tokens()
+    expected = [
+        float(sum(any(cue in context.lower() for cue in cues) for cues in cue_lists))
+        for _, context in tokens
+    ]
+
+    analyzer = NumericalAnalyzer(use_llm_contextualization=False)
+    assert [analyzer._rule_based_contextualization(n, c) for n, c in tokens] == expected
+
+    quality, well, under = analyzer._calculate_contextualization(tokens)
+    assert quality == pytest.approx(sum(expected) / len(expected) / 3.0)
+    assert well == sum(1 for score in expected if score >= 2.5)
+    assert under == sum(1 for score in expected if score <= 1.0)
+
+
+def _loop_clusters(densities, window_size, threshold):
+    """Rolling-window clustering as a plain loop (reference)"""
+    import numpy as np
+
+    clusters, cluster_densities = [], []
+    in_cluster, cluster_start = False, 0
+    for i in range(len(densities) - window_size + 1):
+        if np.mean(densities[i:i + window_size]) >= threshold:
+            if not in_cluster:
+                cluster_start, in_cluster = i, True
+        elif in_cluster:
+            clusters.append((cluster_start, i - 1 + window_size))
+            cluster_densities.append(np.mean(densities[cluster_start:i - 1 + window_size]))
+            in_cluster = False
+    if in_cluster:
+        clusters.append((cluster_start, len(densities) - 1))
+        cluster_densities.append(np.mean(densities[cluster_start:]))
+    return clusters, cluster_densities
+
+
+def test_view_numeric_index_reuses_parent_scan():
+    """Range views take mentions from the parent index, identical to a rescan"""
+    from src.core.transcript_processor import TranscriptProcessor
+    from src.utils.numeric_scanner import NumericIndex
+
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+    views = list(transcript.section_documents().values()) + list(transcript.speaker_documents().values())
+
+    for view in views:
+        rescanned = NumericIndex.build(view.source, view.sentence_spans.tolist())
+        assert view.numeric_index.mentions == rescanned.mentions
+
+    # Spans cutting through numbers and words are rescanned
+    text = "Revenue in 2023 was $1.5 billion, up 15% from 12.25%."
+    index = NumericIndex.build(text, [(0, len(text))])
+    for start, end in [(13, 40), (21, 38), (0, 22), (39, len(text))]:
+        restricted = index.restrict([(start, end)])
+        assert restricted.mentions == NumericIndex.build(text, [(start, end)]).mentions
+
+
+def test_sentence_density_vector_matches_per_sentence_loop():
+    """Density vector, statistics, top-k and clusters match the per-sentence computation"""
+    import numpy as np
+    from src.analysis.numerical.sentence_density import DENSITY_KEY, SentenceLevelDensityAnalyzer
+    from src.core.transcript_processor import TranscriptProcessor
+
+    transcript = TranscriptProcessor().process(str(SAMPLE_TRANSCRIPT))
+    doc = transcript.document
+    analyzer = SentenceLevelDensityAnalyzer()
+
+    expected = [analyzer._calculate_sentence_density(s) for s in doc.sentences]
+    densities = analyzer.sentence_densities(doc)
+    assert densities.tolist() == pytest.approx(expected)
+    assert analyzer.sentence_densities(doc) is densities
+
+    metrics = analyzer.analyze_document(doc)
+    assert metrics.p25_density == np.percentile(densities, 25)
+    assert metrics.p75_density == np.percentile(densities, 75)
+    ranked = sorted(zip(doc.sentences, densities.tolist()), key=lambda x: x[1], reverse=True)[:10]
+    assert metrics.top_dense_sentences == ranked
+
+    # Ties at the top-k boundary keep sentence order
+    values = np.array([1.0, 5.0, 3.0, 5.0, 3.0, 3.0, 0.0])
+    assert SentenceLevelDensityAnalyzer._top_indices(values, 4) == [1, 3, 2, 4]
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        sample = rng.choice([0.0, 5.0, 10.0, 20.0, 30.0], size=int(rng.integers(0, 60)))
+        assert analyzer._identify_clusters(sample) == _loop_clusters(
+            sample, analyzer.CLUSTER_WINDOW_SIZE, analyzer.CLUSTER_DENSITY_THRESHOLD
+        )
+
+    # Sections keyed 'qa' (as TranscriptProcessor names them) feed the Q&A split;
+    # views holding whole sentences are masked reductions of the global vector
+    sections = transcript.section_documents()
+    speakers = transcript.speaker_documents()
+    distribution = analyzer.analyze_distribution_patterns(metrics, sections=sections, speakers=speakers)
+    qa = sections['qa']
+    qa_ids, whole = analyzer._parent_sentence_ids(qa)
+    assert whole.all() and DENSITY_KEY not in qa._cache
+    is_answer = np.array(['?' not in s for s in qa.sentences])
+    assert distribution.answer_avg_density == pytest.approx(densities[qa_ids[is_answer]].mean())
+    assert distribution.answer_avg_density == pytest.approx(analyzer.sentence_densities(qa)[is_answer].mean())
+
+    # Speaker turns clip the sentence their label starts; only those are recomputed
+    for speaker, view in speakers.items():
+        if view.sentence_count:
+            assert DENSITY_KEY not in view._cache
+            assert distribution.speaker_densities[speaker] == pytest.approx(
+                analyzer.sentence_densities(view).mean()
+            )
+    assert any(analyzer._parent_sentence_ids(view)[1].sum() for view in speakers.values())
+
+    # A view that splits a sentence computes the clipped part on its own
+    start, end = doc.sentence_spans[1].tolist()
+    split = doc.restrict([(start, (start + end) // 2), tuple(doc.sentence_spans[2].tolist())])
+    assert analyzer._parent_sentence_ids(split)[1].tolist() == [False, True]
+    assert analyzer._masked_mean(split) == pytest.approx(analyzer.sentence_densities(split).mean())
+
+
+def test_multiscale_clusters_match_rolling_loop():
+    """Cumulative-sum clusters equal the rolling loop at every scale, threshold ties included"""
+    import numpy as np
+    from src.analysis.numerical.sentence_density import SentenceLevelDensityAnalyzer
+    from src.core.tokenized_document import TokenizedDocument
+
+    analyzer = SentenceLevelDensityAnalyzer(cluster_window_size=3, cluster_scales=[5, 8])
+    assert analyzer.cluster_window_size == 3
+    threshold = analyzer.CLUSTER_DENSITY_THRESHOLD
+
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        # Values chosen so many windows average exactly to the threshold
+        sample = rng.choice([0.0, 6.0, 12.0, 18.0, 100 / 3], size=int(rng.integers(0, 400)))
+        scales = analyzer.identify_clusters_multiscale(sample, (1, 3, 5, 8, 13))
+        for window_size, result in scales.items():
+            assert result == _loop_clusters(sample, window_size, threshold)
+        assert analyzer._identify_clusters(sample) == scales[3]
+
+    doc = TokenizedDocument.from_text(SAMPLE_TRANSCRIPT.read_text(encoding='utf-8'))
+    metrics = analyzer.analyze_document(doc)
+    distribution = analyzer.analyze_distribution_patterns(metrics)
+    densities = metrics.density_by_position
+    assert distribution.cluster_positions == _loop_clusters(densities, 3, threshold)[0]
+    assert set(distribution.multiscale_clusters) == {5, 8}
+    assert distribution.multiscale_clusters[8] == _loop_clusters(densities, 8, threshold)[0]
+
+
+def test_sentence_density_accumulator_matches_batch():
+    """Snapshots equal the batch metrics of the sentences seen so far, within the documented tolerance"""
+    import numpy as np
+    from src.analysis.numerical.sentence_density import (
+        SentenceDensityAccumulator, SentenceLevelDensityAnalyzer, StreamingQuantiles
+    )
+    from src.core.tokenized_document import TokenizedDocument
+
+    doc = TokenizedDocument.from_text(SAMPLE_TRANSCRIPT.read_text(encoding='utf-8'))
+    analyzer = SentenceLevelDensityAnalyzer()
+    densities = analyzer.sentence_densities(doc).tolist()
+    tolerance = SentenceDensityAccumulator.QUANTILE_TOLERANCE
+
+    accumulator = SentenceDensityAccumulator(keep_positions=True)
+    assert accumulator.snapshot().total_sentences == 0
+
+    for seen, (sentence, density) in enumerate(zip(doc.sentences, densities), 1):
+        accumulator.add(sentence, density)
+        if seen not in (1, 4, 30, doc.sentence_count):
+            continue
+
+        batch = analyzer.analyze_document(doc.restrict(doc.sentence_spans[:seen].tolist()))
+        live = accumulator.snapshot()
+        for name in ('total_sentences', 'numeric_dense_sentences', 'numeric_moderate_sentences',
+                     'numeric_sparse_sentences', 'narrative_sentences', 'proportion_numeric_dense',
+                     'proportion_narrative', 'max_numeric_density', 'min_numeric_density',
+                     'top_dense_sentences', 'density_by_position'):
+            assert getattr(live, name) == getattr(batch, name), name
+        assert live.mean_numeric_density == pytest.approx(batch.mean_numeric_density, rel=1e-9)
+        assert live.std_numeric_density == pytest.approx(batch.std_numeric_density, rel=1e-9, abs=1e-12)
+        for name in ('median_numeric_density', 'p25_density', 'p75_density'):
+            assert abs(getattr(live, name) - getattr(batch, name)) <= tolerance, name
+
+    # Sentences are densities computed on the fly when not given
+    computed = SentenceDensityAccumulator()
+    computed.extend(doc.sentences[:5])
+    assert computed.snapshot().total_sentences == 5
+    assert computed.snapshot().density_by_position == []
+
+    # Quantile error is bounded by the bin width on continuous data
+    values = np.random.default_rng(2).gamma(2.0, 4.0, size=5000)
+    quantiles = StreamingQuantiles(resolution=tolerance)
+    for value in values.tolist():
+        quantiles.add(value)
+    estimates = quantiles.quantiles((0.1, 0.25, 0.5, 0.75, 0.99))
+    assert np.abs(np.array(estimates) - np.percentile(values, [10, 25, 50, 75, 99])).max() <= tolerance
+
+    # Densities above 100% (more numbers than words) are kept exactly
+    over = [100.0, 150.0, 200.0, 200.0, 250.0, 300.0]
+    quantiles = StreamingQuantiles(resolution=tolerance)
+    for value in [0.0, 12.5] + over:
+        quantiles.add(value)
+    assert quantiles.quantiles((0.5, 0.75, 1.0)) == pytest.approx(
+        np.percentile([0.0, 12.5] + over, [50, 75, 100]).tolist()
+    )
+
+    dense = SentenceDensityAccumulator()
+    sentences = ["$5.5 and $6.6.", "We grew 4% and 5% to $7.1 million.", "Thank you.", "$3 and $4 and $5."]
+    batch_densities = [analyzer._calculate_sentence_density(sentence) for sentence in sentences]
+    assert max(batch_densities) > 100
+    dense.extend(sentences)
+    live = dense.snapshot()
+    assert [live.median_numeric_density, live.p25_density, live.p75_density] == pytest.approx(
+        np.percentile(batch_densities, [50, 25, 75]).tolist()
+    )
+
+
+class _SlowSentimentClient:
+    """Blocking client that records how many calls overlap"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def analyze_sentiment(self, text):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if 'fail' in text:
+            raise RuntimeError('boom')
+        return {'sentiment': 'Positive', 'confidence': 0.9, 'text': text}
+
+    def score_relevance(self, question, response):
+        if 'fail' in question:
+            raise RuntimeError('boom')
+        return 0.9
+
+
+def test_async_client_bounds_concurrency():
+    """Fan-out keeps at most max_concurrency requests in flight, results in order"""
+    from src.models.async_ollama_client import AsyncOllamaClient
+
+    stub = _SlowSentimentClient()
+    client = AsyncOllamaClient(sync_client=stub, max_concurrency=3)
+    texts = [f"segment {i}" for i in range(12)]
+
+    start = time.perf_counter()
+    results = client.run_all(client.analyze_sentiment(text) for text in texts)
+    elapsed = time.perf_counter() - start
+
+    assert [result['text'] for result in results] == texts
+    assert stub.peak == 3
+    assert elapsed < len(texts) * stub.delay
+
+    # Failures come back in place when requested
+    results = client.run_all(
+        [client.analyze_sentiment('ok'), client.analyze_sentiment('fail')], return_exceptions=True
+    )
+    assert results[0]['sentiment'] == 'Positive'
+    assert isinstance(results[1], RuntimeError)
+
+    assert AsyncOllamaClient.for_client(stub) is AsyncOllamaClient.for_client(stub)
+    assert client.run_all([]) == []
+
+    logger.info("✅ Async client bounds concurrency")
+
+
+class _FakeAsyncChat:
+    """ollama.AsyncClient stand-in returning canned message contents"""
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.requests = []
+
+    async def chat(self, model, messages, options, format):
+        self.requests.append((model, messages, format))
+        content = self.contents.pop(0)
+        if isinstance(content, Exception):
+            raise content
+        return {'message': {'content': content}}
+
+
+def test_async_client_matches_sync_semantics(monkeypatch):
+    """Native async requests share the sync prompts, parsing and fallbacks"""
+    import json
+    from src.models.async_ollama_client import AsyncOllamaClient
+    from src.models.ollama_client import OllamaClient
+
+    async def no_wait(delay):
+        return None
+
+    monkeypatch.setattr('src.utils.retry.asyncio.sleep', no_wait)
+
+    client = AsyncOllamaClient(max_concurrency=2, use_cache=False)
+    client.client = chat = _FakeAsyncChat([
+        json.dumps({'sentiment': 'Bullish', 'confidence': 1.7}),
+        'not json',
+        ConnectionError('down'), ConnectionError('down'), ConnectionError('down'),
+        json.dumps({'assessments': [{'overall_score': 3.0}]}),
+        json.dumps({'relevance_score': 0.8}),
+        json.dumps({}),
+    ])
+
+    sentiment = client.run(client.analyze_sentiment("Revenue grew."))
+    assert sentiment == {'sentiment': 'Neutral', 'confidence': 1.0}
+    assert client.run(client.analyze_sentiment("x"))['reasoning'] == 'Fallback due to: JSON parse error'
+    assert client.run(client.analyze_sentiment("x"))['reasoning'] == 'Fallback due to: LLM unavailable'
+
+    batch = client.run(client.assess_contextualization_batch(['5%', '$2B'], "Up 5% to $2B."))
+    assert batch == [{'overall_score': 3.0}, OllamaClient._default_contextualization()]
+
+    assert client.run(client.score_relevance("Why?", "Because.")) == 0.8
+    assert client.run(client.score_relevance("Why?", "Because.")) == 0.5
+
+    # Same prompts as the synchronous client
+    request = OllamaClient._relevance_request("Why?", "Because.")
+    model, messages, format = chat.requests[-1]
+    assert model == request['model'] and format == 'json'
+    assert [m['content'] for m in messages] == [request['system_prompt'], request['prompt']]
+
+    logger.info("✅ Async client matches sync semantics")
+
+
+def test_llm_consumers_fan_out(monkeypatch):
+    """Chunked sentiment and Q&A relevance go through the async client"""
+    from src.analysis.deception.question_evasion import QuestionEvasionDetector
+    from src.analysis.sentiment.llm_analyzer import LLMSentimentAnalyzer
+    from src.core.resources import registry
+
+    stub = _SlowSentimentClient(delay=0.0)
+    analyzer = LLMSentimentAnalyzer(use_cache=False)
+    analyzer.client = stub
+
+    # A failed chunk becomes a neutral segment; the others keep their results
+    chunks = ["good quarter", "fail here", "strong demand"]
+    monkeypatch.setattr(
+        'src.analysis.sentiment.llm_analyzer.split_into_sentence_chunks', lambda text, **kwargs: chunks
+    )
+    result = analyzer._analyze_chunked("ignored")
+    assert [segment['sentiment'] for segment in result.segment_sentiments] == ['Positive', 'Neutral', 'Positive']
+    assert [segment.get('text') for segment in result.segment_sentiments] == ['good quarter', None, 'strong demand']
+    assert result.overall_sentiment == 'Positive'
+
+    sentences = analyzer.analyze_sentences(
+        "Revenue grew strongly this quarter overall. Too short. This sentence will fail loudly today."
+    )
+    assert [(r['index'], r['sentiment']) for r in sentences] == [(0, 'Positive')]
+
+    registry.set('ollama_client', stub)
+    try:
+        qa_text = (
+            "Analyst - Firm\nWhat drove margins?\n\nCFO - Company\nPricing drove margins.\n\n"
+            "Analyst - Firm\nWhy did this fail?\n\nCFO - Company\nWe do not comment."
+        )
+        detector = QuestionEvasionDetector()
+        pairs = detector.analyze_qa_section(qa_text)
+        assert pairs[0].response_relevance == 0.9
+        assert pairs[1].response_relevance == pairs[1].topic_overlap
+    finally:
+        registry.reset('ollama_client')
+
+    logger.info("✅ LLM consumers fan out through the async client")
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_one_call():
+    """Concurrent callers with one key share a single execution and its outcome"""
+    from src.utils.performance import PerformanceMonitor
+    from src.utils.single_flight import SingleFlight
+
+    monitor = PerformanceMonitor()
+    flight = SingleFlight('test', monitor=monitor)
+    calls = []
+
+    def work(value):
+        calls.append(value)
+        # Hold the call open until every other caller has joined it
+        _wait_for(lambda: monitor.get_counters().get('test_saved', 0) == 4)
+        if value == 'fail':
+            raise RuntimeError('boom')
+        return value.upper()
+
+    def run_many(value):
+        results = [None] * 5
+
+        def caller(i):
+            try:
+                results[i] = flight.do(('key', value), work, value)
+            except RuntimeError as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        monitor.clear()
+        return results
+
+    assert run_many('ok') == ['OK'] * 5
+    failures = run_many('fail')
+    assert all(isinstance(result, RuntimeError) for result in failures)
+    assert calls == ['ok', 'fail']
+    assert flight.in_flight() == 0
+
+    # Sequential calls are not coalesced
+    flight.do('a', str, 1)
+    flight.do('a', str, 1)
+    assert monitor.get_counters('test_') == {'test_issued': 2}
+
+    logger.info("✅ Single-flight shares one call")
+
+
+class _BlockingChat:
+    """ollama.Client stand-in whose chat() waits until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def chat(self, model, messages, options, format):
+        self.calls += 1
+        self.release.wait(5)
+        return {'message': {'content': f"{model}:{messages[-1]['content']}"}}
+
+
+class _SlowAsyncChat(_FakeAsyncChat):
+    """_FakeAsyncChat that yields to the event loop before answering"""
+
+    async def chat(self, model, messages, options, format):
+        import asyncio
+        await asyncio.sleep(0.01)
+        return await super().chat(model, messages, options, format)
+
+
+def test_identical_llm_requests_are_coalesced():
+    """Identical concurrent generate() calls reach Ollama once and are counted"""
+    from src.models.async_ollama_client import AsyncOllamaClient
+    from src.models.ollama_client import OllamaClient, _inflight
+    from src.utils.performance import get_monitor
+
+    monitor = get_monitor()
+    monitor.clear()
+
+    client = OllamaClient(use_cache=False)
+    client.client = chat = _BlockingChat()
+    results = []
+    threads = [
+        threading.Thread(target=lambda p=prompt: results.append(client.generate('m', p)))
+        for prompt in ('same', 'same', 'same', 'other')
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: monitor.get_counters().get('llm_requests_saved', 0) == 2 and chat.calls == 2)
+    chat.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == ['m:other', 'm:same', 'm:same', 'm:same']
+    assert chat.calls == 2
+    assert monitor.get_counters('llm_requests') == {
+        'llm_requests_issued': 2, 'llm_requests_coalesced': 1, 'llm_requests_saved': 2,
+    }
+    assert _inflight.in_flight() == 0
+
+    # The async client coalesces its own concurrent requests the same way
+    async_client = AsyncOllamaClient(max_concurrency=4, use_cache=False)
+    async_client.client = fake = _SlowAsyncChat(['{"relevance_score": 0.7}'] * 2)
+    scores = async_client.run_all(
+        [async_client.score_relevance("Why?", "Because.") for _ in range(3)]
+        + [async_client.score_relevance("How?", "Like so.")]
+    )
+    assert scores == [0.7] * 4
+    assert len(fake.requests) == 2
+    monitor.clear()
+
+    logger.info("✅ Identical LLM requests are coalesced")
+
+
+def test_prompt_cache_round_trip_and_eviction(tmp_path):
+    """Responses persist across instances; least recently used entries are evicted"""
+    from src.cache.prompt_cache import PromptCache
+
+    path = tmp_path / "llm.sqlite"
+    cache = PromptCache(path=path, max_entries=3, max_bytes=1024)
+    keys = [PromptCache.make_key(('m', '', f'prompt {i}', 0.1, 2048, True)) for i in range(4)]
+    assert len(set(keys)) == 4
+    assert keys[0] == PromptCache.make_key(['m', '', 'prompt 0', 0.1, 2048, True])
+
+    for key in keys[:3]:
+        cache.set(key, 'm', '{"ok": true}')
+    time.sleep(0.01)
+    assert cache.get(keys[0]) == '{"ok": true}'  # now most recently used
+
+    cache.set(keys[3], 'm', '{"ok": false}')
+    assert cache.get(keys[1]) is None
+    assert cache.stats()['total_entries'] == 3
+    cache.close()
+
+    reopened = PromptCache(path=path, max_entries=3, max_bytes=1024)
+    assert reopened.get(keys[3]) == '{"ok": false}'
+
+    # The byte limit evicts as well
+    reopened.set(keys[1], 'm', 'x' * 1020)
+    assert reopened.stats()['total_entries'] == 1
+    assert reopened.clear() == 1
+    reopened.close()
+
+    logger.info("✅ Prompt cache round trip and eviction")
+
+
+class _CountingChat:
+    """ollama.Client stand-in that answers from a canned list and counts calls"""
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.calls = 0
+
+    def chat(self, model, messages, options, format):
+        self.calls += 1
+        return {'message': {'content': self.contents.pop(0)}}
+
+
+def test_generate_is_cached_per_request(tmp_path):
+    """A repeated request is answered from the prompt cache; any option change is a miss"""
+    from src.cache.prompt_cache import PromptCache
+    from src.models.ollama_client import OllamaClient
+    from src.utils.performance import get_monitor
+
+    monitor = get_monitor()
+    monitor.clear()
+
+    client = OllamaClient(use_cache=False)
+    client.cache = PromptCache(path=tmp_path / "llm.sqlite")
+    client.client = chat = _CountingChat(['not json', '{"relevance_score": 0.8}', '{"a": 1}', '{"b": 2}'])
+
+    # Malformed JSON is not cached, so it is asked for again
+    assert client.generate('m', 'Rate this', json_mode=True) == 'not json'
+    assert client.generate('m', 'Rate this', json_mode=True) == '{"relevance_score": 0.8}'
+    assert client.generate('m', 'Rate this', json_mode=True) == '{"relevance_score": 0.8}'
+    assert chat.calls == 2
+
+    assert client.generate('m', 'Rate this', json_mode=True, temperature=0.7) == '{"a": 1}'
+    assert client.generate('m', 'Rate this', system_prompt='sys', json_mode=True) == '{"b": 2}'
+    assert chat.calls == 4
+    assert monitor.get_counters('llm_cache') == {'llm_cache_hits': 1, 'llm_cache_misses': 4}
+
+    # A new client on the same store makes no calls at all
+    fresh = OllamaClient(use_cache=False)
+    fresh.cache = client.cache
+    fresh.client = _CountingChat([])
+    assert fresh.generate('m', 'Rate this', json_mode=True, temperature=0.7) == '{"a": 1}'
+    client.cache.close()
+    monitor.clear()
+
+    logger.info("✅ generate() is cached per request")
+
+
+def test_pack_sentences_respects_size_and_breaks():
+    """Sentences are packed greedily, never split, and never across a break"""
+    from src.utils.text_utils import pack_sentences
+
+    assert pack_sentences([4, 4, 4, 10, 1], chunk_size=8) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    assert pack_sentences([2, 2, 2, 2], chunk_size=8, breaks=[2]) == [(0, 2), (2, 4)]
+    assert pack_sentences([], chunk_size=8) == []
+
+    # Chunks after a break do not depend on what precedes it
+    tail = pack_sentences([3, 3, 3, 3], chunk_size=7)
+    shifted = pack_sentences([5, 1, 3, 3, 3, 3], chunk_size=7, breaks=[2])
+    assert [(a - 2, b - 2) for a, b in shifted[-len(tail):]] == tail
+
+    logger.info("✅ Sentences packed into stable chunks")
+
+
+class _CountingSentimentClient:
+    """Sentiment client that records every text it is asked about"""
+
+    def __init__(self):
+        self.texts = []
+        self.lock = threading.Lock()
+
+    def analyze_sentiment(self, text):
+        with self.lock:
+            self.texts.append(text)
+        label = 'Negative' if 'decline' in text else 'Positive'
+        return {'sentiment': label, 'confidence': 0.8}
+
+
+@requires_punkt
+def test_llm_sentiment_chunks_shared_across_views(monkeypatch):
+    """Overall, section and speaker LLM sentiment reuse one set of chunk results"""
+    from config.settings import settings
+    from src.analysis.sentiment.llm_analyzer import LLMSentimentAnalyzer
+    from src.core.tokenized_document import TokenizedDocument
+    from src.utils.text_utils import split_into_chunks
+
+    monkeypatch.setattr(settings, 'LLM_CHUNK_SIZE', 30)
+
+    ceo = " ".join(
+        f"Revenue in segment {i} grew strongly on demand from large enterprise customers." for i in range(12)
+    )
+    turns = []
+    for i in range(6):
+        turns.append(('analyst', f"Can you explain the decline in region {i} margins this quarter?"))
+        turns.append(('cfo', f"Region {i} margins fell on pricing but we expect recovery next year."))
+
+    text = ceo
+    qa_start = len(text) + 1
+    speaker_ranges = {'ceo': [(0, len(ceo))], 'analyst': [], 'cfo': []}
+    for speaker, turn in turns:
+        start = len(text) + 1
+        text = f"{text} {turn}"
+        speaker_ranges[speaker].append((start, len(text)))
+
+    doc = TokenizedDocument.from_text(text)
+    sections = {'prepared_remarks': doc.restrict([(0, len(ceo))]), 'qa': doc.restrict([(qa_start, len(text))])}
+    speakers = {name: doc.restrict(ranges) for name, ranges in speaker_ranges.items()}
+
+    client = _CountingSentimentClient()
+    analyzer = LLMSentimentAnalyzer(use_cache=False)
+    analyzer.client = client
+
+    plan = analyzer.plan_chunks(doc, sections.values())
+    overall = analyzer.analyze_document(doc)
+    section_scores = {name: analyzer.analyze_document(view) for name, view in sections.items()}
+    speaker_scores = {name: analyzer.analyze_document(view) for name, view in speakers.items()}
+
+    # Chunks are whole sentences and never cross the section boundary
+    assert all(start in {s for s, _ in doc.sentence_spans.tolist()} for start, _ in plan)
+    assert not any(start < qa_start - 1 < end for start, end in plan)
+
+    # The overall score is aggregated from exactly the section chunks
+    assert overall.segment_sentiments == (
+        section_scores['prepared_remarks'].segment_sentiments + section_scores['qa'].segment_sentiments
+    )
+    assert len(speaker_scores['ceo'].segment_sentiments) == len(section_scores['prepared_remarks'].segment_sentiments)
+    assert speaker_scores['analyst'].overall_sentiment == 'Negative'
+    assert speaker_scores['ceo'].overall_sentiment == 'Positive'
+
+    # Each chunk is sent once, at most half as many calls as independent word-offset chunking
+    assert len(client.texts) == len(set(client.texts))
+    independent = sum(
+        len(split_into_chunks(view.text, chunk_size=30, overlap=7))
+        for view in [doc, *sections.values(), *speakers.values()]
+    )
+    assert 2 * len(client.texts) <= independent
+
+    # A second pass over the same views sends nothing
+    sent = len(client.texts)
+    analyzer.analyze_document(speakers['cfo'])
+    assert len(client.texts) == sent
+
+    logger.info("✅ LLM sentiment chunks shared across views")
+
+
+def test_llm_sentiment_fallbacks_are_not_cached(tmp_path):
+    """A chunk that fell back to neutral is sent again; its later real result is cached"""
+    from src.analysis.sentiment.llm_analyzer import LLMSentimentAnalyzer
+    from src.cache.result_cache import ResultCache
+    from src.core.tokenized_document import TokenizedDocument
+    from src.models.ollama_client import OllamaClient
+
+    class FlakyClient(OllamaClient):
+        """Ollama is down for the first request, then answers"""
+
+        def __init__(self):
+            self.calls = 0
+
+        def generate(self, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("connection refused")
+            return '{"sentiment": "Positive", "confidence": 0.9}'
+
+    doc = TokenizedDocument.from_text("Revenue grew strongly this quarter.")
+    analyzer = LLMSentimentAnalyzer(use_cache=False)
+    analyzer.cache = ResultCache(cache_dir=tmp_path, enabled=True)
+    analyzer.client = client = FlakyClient()
+
+    first = analyzer.analyze_document(doc)
+    assert first.overall_sentiment == 'Neutral'
+    assert first.segment_sentiments[0]['reasoning'] == 'Fallback due to: LLM unavailable'
+    assert analyzer.cache.get(doc.text, 'llm_sentiment_chunk') is None
+
+    second = analyzer.analyze_document(doc)
+    assert second.overall_sentiment == 'Positive' and client.calls == 2
+    assert analyzer.cache.get(doc.text, 'llm_sentiment_chunk')['sentiment'] == 'Positive'
+
+    # Served from the memo and, in a new analyzer, from the result cache
+    assert analyzer.analyze_document(doc).overall_sentiment == 'Positive'
+    fresh = LLMSentimentAnalyzer(use_cache=False)
+    fresh.cache = analyzer.cache
+    fresh.client = client
+    assert fresh.analyze_document(doc).overall_sentiment == 'Positive'
+    assert client.calls == 2
+
+    # The whole-text path does not cache a fallback either
+    client.calls = 0
+    assert analyzer.analyze("Margins held.").overall_sentiment == 'Neutral'
+    assert analyzer.cache.get("Margins held.", 'llm_sentiment') is None
+    assert analyzer.analyze("Margins held.").overall_sentiment == 'Positive'
+
+    logger.info("✅ LLM sentiment fallbacks are not cached")
+
+
+class _StubOllamaServer:
+    """Local HTTP server answering /api/tags and /api/chat like Ollama"""
+
+    def __init__(self, name):
+        import json
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        stub = self
+        self.name = name
+        self.failing = False
+        self.chats = 0
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if stub.failing:
+                    self._reply(503, {'error': 'down'})
+                else:
+                    self._reply(200, {'models': []})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with lock:
+                    stub.chats += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                time.sleep(stub.delay)
+                with lock:
+                    stub.in_flight -= 1
+                if stub.failing:
+                    self._reply(500, {'error': 'overloaded'})
+                else:
+                    self._reply(200, {'message': {'role': 'assistant', 'content': stub.name}, 'done': True})
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_servers():
+    servers = [_StubOllamaServer('a'), _StubOllamaServer('b')]
+    yield servers
+    for server in servers:
+        server.close()
+
+
+def test_pool_routes_to_least_outstanding_endpoint(stub_servers):
+    """Requests go to the endpoint with the fewest outstanding requests per unit of weight"""
+    from src.models.ollama_pool import OllamaConnectionPool
+
+    a, b = stub_servers
+    pool = OllamaConnectionPool(pool_size=4, max_overflow=0, endpoints={a.url: 1.0, b.url: 3.0})
+
+    # Held connections: b takes three for each one a takes
+    with pool.get_connection() as c1, pool.get_connection() as c2, \
+            pool.get_connection() as c3, pool.get_connection() as c4:
+        hosts = [c.host for c in (c1, c2, c3, c4)]
+    assert sorted(hosts) == sorted([a.url, b.url, b.url, b.url])
+
+    # Sequential requests follow the weights too
+    client = pool.client(use_cache=False)
+    answers = [client.generate('m', f'prompt {i}') for i in range(8)]
+    assert answers.count('a') == 2 and answers.count('b') == 6
+    assert (a.chats, b.chats) == (2, 6)
+
+    stats = pool.get_stats()
+    assert stats['active_connections'] == 0
+    assert stats['endpoints'][b.url]['requests'] == 9
+    assert stats['endpoints'][b.url]['p50_latency'] > 0
+    pool.shutdown()
+
+    logger.info("✅ Pool routes to the least outstanding endpoint")
+
+
+def test_pool_ejects_and_readmits_failing_endpoint(stub_servers):
+    """Failing endpoints stop receiving requests until a probe succeeds"""
+    from src.models.ollama_pool import OllamaConnectionPool
+
+    a, b = stub_servers
+    pool = OllamaConnectionPool(
+        pool_size=2, max_overflow=0, endpoints=[a.url, b.url], eject_after=2, probe_interval=0.05
+    )
+    b.failing = True
+
+    def send():
+        with pool.get_connection() as client:
+            return client._chat('m', 'hi', None, 0.1, 16, False)
+
+    answers = []
+    for _ in range(6):
+        try:
+            answers.append(send())
+        except RuntimeError:
+            answers.append('error')
+    assert answers.count('error') == 2
+    assert answers[-2:] == ['a', 'a']
+
+    stats = pool.get_stats()['endpoints'][b.url]
+    assert not stats['healthy'] and stats['errors'] == 2 and stats['ejections'] == 1
+    assert pool.health_check()  # a still answers, b stays ejected
+    assert not pool.get_stats()['endpoints'][b.url]['healthy']
+
+    # Once b recovers, a probe re-admits it
+    b.failing = False
+    time.sleep(0.06)
+    send()
+    _wait_for(lambda: pool.get_stats()['endpoints'][b.url]['healthy'])
+    assert {send(), send()} == {'a', 'b'}
+    pool.shutdown()
+
+    logger.info("✅ Pool ejects and re-admits failing endpoints")
+
+
+def test_pool_reuses_connections_under_concurrent_load():
+    """Concurrent requests reuse kept connections; only requests past pool_size on an endpoint overflow"""
+    from src.models.ollama_pool import OllamaConnectionPool
+
+    def run(pool, threads=8, requests=300):
+        created = []
+        overflow_peak = [0]
+
+        def create(endpoint):
+            connection = {'client': object(), 'endpoint': endpoint, 'created_at': time.time(),
+                          'use_count': 0, 'last_used': time.time()}
+            created.append(connection)
+            return connection
+
+        pool._create_connection = create
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(requests):
+                    with pool.get_connection():
+                        overflow_peak[0] = max(overflow_peak[0], pool.get_stats()['overflow_connections'])
+                        time.sleep(0)
+            except Exception as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        assert not errors
+        return created, overflow_peak[0]
+
+    # Two endpoints of four kept connections take eight threads without overflow
+    pool = OllamaConnectionPool(pool_size=4, max_overflow=4, recycle_after=10**6,
+                                endpoints=['http://a:11434', 'http://b:11434'], adaptive=False)
+    created, overflow_peak = run(pool)
+    stats = pool.get_stats()
+    assert len(created) <= 8 and overflow_peak == 0 and stats['pool_exhausted_count'] == 0
+    assert stats['active_connections'] == 0 and stats['total_requests'] == 8 * 300
+    assert stats['available_connections'] == len(created)
+
+    # One endpoint: four kept connections, at most four overflow ones at a time
+    pool = OllamaConnectionPool(pool_size=4, max_overflow=4, recycle_after=10**6,
+                                endpoints=['http://a:11434'], adaptive=False)
+    created, overflow_peak = run(pool)
+    stats = pool.get_stats()
+    assert overflow_peak <= 4
+    assert len(created) == 4 + stats['pool_exhausted_count']
+    assert stats['active_connections'] == 0 and stats['overflow_connections'] == 0
+    assert stats['available_connections'] == 4
+    assert stats['endpoints']['http://a:11434']['connections'] == 4
+
+    logger.info("✅ Pool reuses connections under concurrent load")
+
+
+def test_async_fan_out_takes_slots_from_the_pool(stub_servers):
+    """A routed client's async fan-out is bounded by the pool, not by LLM_MAX_CONCURRENCY"""
+    from config.settings import settings
+    from src.models.async_ollama_client import AsyncOllamaClient
+    from src.models.ollama_pool import OllamaConnectionPool
+
+    a, b = stub_servers
+    a.delay = b.delay = 0.2
+    pool = OllamaConnectionPool(pool_size=4, max_overflow=4, endpoints=[a.url, b.url], adaptive=False)
+    async_client = AsyncOllamaClient.for_client(pool.client(use_cache=False))
+    assert async_client.pool is pool
+    assert settings.LLM_MAX_CONCURRENCY < 8
+
+    answers = async_client.run_all([async_client.generate('m', f'prompt {i}') for i in range(16)])
+    assert sorted(answers) == ['a'] * 8 + ['b'] * 8
+
+    # Eight requests in flight at once, four on each endpoint
+    assert (a.max_in_flight, b.max_in_flight) == (4, 4)
+    stats = pool.get_stats()
+    assert stats['active_connections'] == 0 and stats['total_requests'] == 16
+    assert stats['endpoints'][a.url]['requests'] == 8
+    pool.shutdown()
+
+    logger.info("✅ Async fan-out takes slots from the pool")
+
+
+def test_adaptive_limit_follows_latency_and_errors():
+    """The limit grows while p50 stays flat, and shrinks on slow windows or errors"""
+    from src.utils.adaptive_limit import AdaptiveLimit
+    from src.utils.performance import PerformanceMonitor
+
+    monitor = PerformanceMonitor()
+    limit = AdaptiveLimit('llm_test', initial_limit=4, min_limit=1, max_limit=6,
+                          window=5, tolerance=1.5, monitor=monitor)
+
+    def window(latency, in_flight=None):
+        for _ in range(5):
+            limit.record(latency, limit.limit if in_flight is None else in_flight)
+
+    # Flat latency at the limit: additive increase, capped at max_limit
+    for _ in range(4):
+        window(0.1)
+    assert limit.limit == 6
+
+    # Flat latency below the limit: no evidence of headroom, no change
+    window(0.1, in_flight=1)
+    assert limit.limit == 6
+
+    # Latency well above the baseline: multiplicative decrease
+    window(0.2)
+    assert limit.limit == 4
+
+    # A burst of failures backs off once per window
+    for _ in range(3):
+        limit.record(5.0, limit.limit, error=True)
+    assert limit.limit == 3
+
+    gauges = monitor.get_gauges('llm_test')
+    assert gauges['llm_test_limit'] == 3
+    assert gauges['llm_test_baseline_latency'] >= 0.1
+    assert gauges['llm_test_window'] == 5
+    assert monitor.get_counters('llm_test') == {'llm_test_increases': 2, 'llm_test_decreases': 2}
+    assert len(limit.stats()['latency_window']) == 5
+
+    logger.info("✅ Adaptive limit follows latency and errors")
+
+
+def test_adaptive_limit_tolerates_mixed_latencies():
+    """Prompts of mixed length neither pin the baseline low nor collapse the limit"""
+    import numpy as np
+    from src.utils.adaptive_limit import AdaptiveLimit
+    from src.utils.performance import PerformanceMonitor
+
+    means, lows = [], []
+    for seed in range(5):
+        rng = np.random.default_rng(seed)
+        limit = AdaptiveLimit('llm_test', initial_limit=4, min_limit=1, max_limit=32,
+                              window=20, tolerance=1.5, monitor=PerformanceMonitor())
+
+        def window(scale):
+            # Latency spread by prompt length, independent of the load
+            for latency in scale * rng.lognormal(0.0, 0.6, size=20):
+                limit.record(float(latency), limit.limit)
+
+        # A first window of short prompts does not set the bar for the rest
+        for _ in range(20):
+            limit.record(0.05, limit.limit)
+        mixed = []
+        for _ in range(60):
+            window(0.2)
+            mixed.append(limit.limit)
+
+        # Every prompt four times slower: backing off does not help, so the
+        # baseline catches up instead of the limit sinking to its minimum
+        slower = []
+        for _ in range(60):
+            window(0.8)
+            slower.append(limit.limit)
+        assert limit.baseline > 0.4
+
+        for limits in (mixed[20:], slower[20:]):
+            means.append(sum(limits) / len(limits))
+            lows.append(min(limits))
+
+    assert sum(means) / len(means) >= 15
+    assert min(lows) >= 2
+
+    logger.info("✅ Adaptive limit tolerates mixed latencies")
+
+
+class _CapacityBoundChat:
+    """Fake async chat whose latency grows once more than capacity requests are in flight"""
+
+    def __init__(self, capacity, service_time):
+        self.capacity = capacity
+        self.service_time = service_time
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat(self, model, messages, options, format):
+        import asyncio
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.service_time * max(1.0, self.in_flight / self.capacity))
+        finally:
+            self.in_flight -= 1
+        return {'message': {'content': '{"relevance_score": 0.5}'}}
+
+
+def test_async_client_limit_converges_to_server_capacity():
+    """Starting low, the async client's limit climbs to about the server's capacity"""
+    from src.models.async_ollama_client import AsyncOllamaClient
+    from src.utils.adaptive_limit import AdaptiveLimit, AsyncAdaptiveLimiter
+    from src.utils.performance import PerformanceMonitor
+
+    monitor = PerformanceMonitor()
+    client = AsyncOllamaClient(max_concurrency=2, use_cache=False, adaptive=True)
+    client._limiter = AsyncAdaptiveLimiter(
+        AdaptiveLimit('llm_test', initial_limit=2, max_limit=32, window=10, monitor=monitor)
+    )
+    client.client = server = _CapacityBoundChat(capacity=6, service_time=0.01)
+
+    scores = client.run_all([client.score_relevance(f"Q{i}?", "A.") for i in range(400)])
+    assert scores == [0.5] * 400
+
+    counters = monitor.get_counters('llm_test')
+    assert counters['llm_test_increases'] >= 3 and counters['llm_test_decreases'] >= 1
+    assert 4 <= client._limiter.limit.limit <= 12
+    assert server.max_in_flight <= 13
+    assert monitor.get_gauges('llm_test')['llm_test_limit'] == client._limiter.limit.limit
+
+    logger.info("✅ Async client limit converges to server capacity")
+
+
+def test_pool_limit_grows_under_async_fan_out(stub_servers):
+    """The pool's adaptive limit, not a fixed semaphore, bounds and grows a routed async fan-out"""
+    from src.models.async_ollama_client import AsyncOllamaClient
+    from src.models.ollama_pool import OllamaConnectionPool
+    from src.utils.adaptive_limit import AdaptiveLimit
+    from src.utils.performance import PerformanceMonitor
+
+    a, b = stub_servers
+    a.delay = b.delay = 0.05
+    monitor = PerformanceMonitor()
+    pool = OllamaConnectionPool(pool_size=2, max_overflow=0, endpoints=[a.url, b.url], adaptive=True)
+    pool.limiter = AdaptiveLimit('llm_test', initial_limit=2, max_limit=8, window=4, monitor=monitor)
+    async_client = AsyncOllamaClient.for_client(pool.client(use_cache=False))
+
+    answers = async_client.run_all([async_client.generate('m', f'prompt {i}') for i in range(120)])
+    assert sorted(set(answers)) == ['a', 'b']
+
+    # Requests kept the limit saturated, so it grew past its start
+    assert monitor.get_counters('llm_test')['llm_test_increases'] >= 2
+    assert pool.get_stats()['concurrency_limit'] > 2
+    assert a.max_in_flight + b.max_in_flight > 2
+    assert a.max_in_flight + b.max_in_flight <= 2 * 8
+    pool.shutdown()
+
+    logger.info("✅ Pool limit grows under async fan-out")
+
+
+def test_pool_limit_backs_off_on_errors(stub_servers):
+    """Failed requests lower the pool's concurrency limit below pool_size + max_overflow"""
+    from src.models.ollama_pool import OllamaConnectionPool
+
+    a, _ = stub_servers
+    pool = OllamaConnectionPool(pool_size=4, max_overflow=0, timeout=0.2, endpoints=[a.url],
+                                eject_after=100, adaptive=True)
+    assert pool.get_stats()['concurrency_limit'] == 4
+
+    with pytest.raises(RuntimeError):
+        with pool.get_connection():
+            raise RuntimeError("timed out")
+    assert pool.get_stats()['concurrency_limit'] == 3
+
+    # Only three connections are admitted now
+    with pool.get_connection(), pool.get_connection(), pool.get_connection():
+        with pytest.raises(TimeoutError):
+            with pool.get_connection():
+                pass
+    pool.shutdown()
+
+    logger.info("✅ Pool limit backs off on errors")